@@ -1,6 +1,16 @@
+import time
+started = time.perf_counter()  # Startup times are measured from here
+
 import logging
 import os
-from config.settings_manager import base_path
+import sys
+
+if __name__ == "__main__" and "--import-report" in sys.argv:
+    # Reports the main window's import time per subsystem instead of starting it
+    from src.utils.import_report import main
+    sys.exit(main([argument for argument in sys.argv[1:] if argument != "--import-report"]))
+
+from config.settings_manager import base_path, ensure_app_dirs
 from src.gui.main_window import AppTrackPro
 # Configure logging
 log_file_path = os.path.join(base_path, "apptrackpro.log")
@@ -13,10 +23,13 @@ logging.basicConfig(
     level=logging.DEBUG
 )
 logging.debug("Application is starting.")
+ensure_app_dirs()
 
 if __name__ == "__main__":
     try:
-        app = AppTrackPro()
+        app = AppTrackPro(started=started)
+        # `--measure-startup` prints time to first paint and to interactive, then exits
+        app.exit_when_interactive = "--measure-startup" in sys.argv
         logging.debug("AppTrackPro initialized successfully.")
         app.mainloop()
     except Exception as e:
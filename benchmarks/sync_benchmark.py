@@ -0,0 +1,159 @@
+# benchmarks/sync_benchmark.py
+"""
+Measures Google Sheets sync offline against FakeSheetsBackend.
+
+Each cycle makes random edits on both sides (local edits to Position, remote edits to
+Status, plus added and deleted rows), runs one SheetSyncEngine cycle and checks that
+both sides converged and that no edit was lost. Run from the project root:
+
+    python -m benchmarks.sync_benchmark --rows 20000 --cycles 30 --latency 0.05 --failure-rate 0.1
+"""
+
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+
+import pandas as pd
+
+from src.utils.row_fingerprint import normalized_frame
+from src.utils.sync_backend import CHUNK_ROWS, MAX_PARALLEL_REQUESTS, FakeSheetsBackend
+from src.utils.sync_merge import SheetSyncEngine, SyncSnapshot
+from src.utils.sync_scheduler import TokenBucket
+
+COLUMNS = ["Company", "Position", "Application Portal URL", "Date Applied", "Status"]
+
+
+def make_applications(count, rng):
+    return pd.DataFrame([[
+        f"Company {i}",
+        f"Engineer {i % 97}",
+        f"https://jobs.example.com/{i}",
+        pd.Timestamp("2024-01-01") + pd.Timedelta(days=rng.randrange(365)),
+        rng.choice(["Applied", "Interview", "Rejected"]),
+    ] for i in range(count)], columns=COLUMNS)
+
+
+def edit_local(df, cycle, edits, rng):
+    """Edits Position in random rows, adds one row and deletes one; returns the data and the edit markers."""
+    df = df.copy()
+    markers = set()
+    for k in range(edits):
+        marker = f"L{cycle}-{k}"
+        df.at[rng.randrange(len(df)), "Position"] = marker
+        markers.add(marker)
+    added = f"Local {cycle}"
+    df.loc[len(df)] = [added, "", "", "2024-06-01", "Applied"]
+    markers.add(added)
+    df = df.drop(index=rng.randrange(len(df) - 1)).reset_index(drop=True)
+    # A later edit to the same cell, or deleting the row, legitimately replaces a marker
+    return df, markers & (set(df["Company"]) | set(df["Position"]))
+
+
+def edit_remote(sheet, cycle, edits, rng):
+    """Edits Status in random sheet rows and inserts one row between others, like another user would."""
+    rows = sheet.snapshot()
+    markers = set()
+    for k in range(edits):
+        marker = f"R{cycle}-{k}"
+        row = rows[rng.randrange(1, len(rows))]
+        row.extend([""] * (len(COLUMNS) - len(row)))
+        row[4] = marker
+        markers.add(marker)
+    added = f"Remote {cycle}"
+    rows.insert(rng.randrange(1, len(rows)), [added, "", "", "2024-06-02", "Applied"])
+    markers.add(added)
+    sheet.set_rows(rows)
+    return markers & {cell for row in rows for cell in row}
+
+
+def sheet_frame(sheet):
+    """Returns the fake sheet's data as a DataFrame without spending a request (or an injected failure)."""
+    rows = [row + [""] * (len(COLUMNS) - len(row)) for row in sheet.snapshot()[1:]]
+    while rows and not any(rows[-1]):
+        rows.pop()
+    return pd.DataFrame(rows, columns=COLUMNS)
+
+
+def run(args):
+    rng = random.Random(args.seed)
+    local = make_applications(args.rows, rng)
+    sheet = FakeSheetsBackend.from_frame(local, latency=args.latency, jitter=args.latency / 2,
+                                         failure_rate=args.failure_rate, quota=args.quota, seed=args.seed,
+                                         chunk_rows=args.chunk_rows, max_parallel=args.parallel)
+    sheet.budget = TokenBucket(args.budget) if args.budget else None
+    base_path = os.path.join(tempfile.mkdtemp(), "sync_base.json")
+    engine = SheetSyncEngine(base_path, sheet)
+
+    cycle_times, failures, lost, diverged = [], 0, 0, 0
+    for cycle in range(args.cycles + 1):
+        markers = set()  # Values written this cycle that the merge must keep
+        if cycle:
+            local, local_markers = edit_local(local, cycle, args.edits, rng)
+            markers = local_markers | edit_remote(sheet, cycle, args.edits, rng)
+
+        while True:
+            started = time.perf_counter()
+            try:
+                result = engine.sync(SyncSnapshot(local, cycle))
+                break
+            except Exception:
+                failures += 1  # A real client backs off first; the benchmark retries at once
+        cycle_times.append(time.perf_counter() - started)
+        local = pd.DataFrame([list(row) for row in result.merged], columns=COLUMNS)
+        engine.commit(result)
+
+        # Both sides must hold the same data, and every edit made so far must have survived
+        remote = sheet_frame(sheet)
+        if not normalized_frame(remote, COLUMNS).equals(normalized_frame(local, COLUMNS).set_axis(remote.index)):
+            diverged += 1
+        text = set(local["Company"]) | set(local["Position"]) | set(local["Status"])
+        lost += len(markers - text)
+
+    # Polls with no changes on either side; most only read the footprint cell
+    requests_before, idle_times = sheet.requests, []
+    for _ in range(args.idle_polls):
+        started = time.perf_counter()
+        try:
+            engine.commit(engine.sync(SyncSnapshot(local, args.cycles + 1)))
+        except Exception:
+            failures += 1
+        idle_times.append(time.perf_counter() - started)
+    idle_requests = sheet.requests - requests_before
+
+    first, rest = cycle_times[0], cycle_times[1:] or [0.0]
+    print(f"rows={args.rows} cycles={args.cycles} edits/side/cycle={args.edits + 1} "
+          f"latency={args.latency}s failure_rate={args.failure_rate} quota={args.quota} "
+          f"chunk_rows={args.chunk_rows} parallel={args.parallel}")
+    print(f"first sync {first * 1000:.0f} ms; cycle mean {statistics.mean(rest) * 1000:.0f} ms, "
+          f"p95 {sorted(rest)[min(int(len(rest) * 0.95), len(rest) - 1)] * 1000:.0f} ms")
+    print(f"requests {sheet.requests} ({sheet.requests / max(args.cycles + 1, 1):.1f}/cycle), "
+          f"cells written {sheet.cells_written}, failed cycles {failures}, injected failures {sheet.failures}")
+    if idle_times:
+        print(f"idle poll mean {statistics.mean(idle_times) * 1000:.0f} ms, "
+              f"{idle_requests / len(idle_times):.1f} requests/poll")
+    print(f"engine {engine.stats()}")
+    print(f"diverged cycles {diverged}, lost edits {lost}")
+    return 1 if diverged or lost else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--cycles", type=int, default=20)
+    parser.add_argument("--edits", type=int, default=5, help="cell edits per side per cycle")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every request")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="share of requests failing with 503")
+    parser.add_argument("--quota", type=int, default=None, help="requests per minute before 429s")
+    parser.add_argument("--budget", type=int, default=None, help="client-side requests per minute (token bucket)")
+    parser.add_argument("--idle-polls", type=int, default=10, help="polls without changes after the cycles")
+    parser.add_argument("--chunk-rows", type=int, default=CHUNK_ROWS, help="rows per read or write request")
+    parser.add_argument("--parallel", type=int, default=MAX_PARALLEL_REQUESTS, help="concurrent chunk requests")
+    parser.add_argument("--seed", type=int, default=1)
+    raise SystemExit(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+# benchmarks/theme_benchmark.py
+"""
+Measures how the time to switch themes grows with the number of widgets.
+
+For each widget count it builds the app's menu bar and paned window (registered with
+ThemeRegistry) plus that many ttk labels and entries, like the Clipboard tab and the forms,
+and times ThemeRegistry.use() switching between Light and Dark. For comparison it times
+the recursive walk the window used before, which configured every classic tk widget, on
+the same number of tk labels and entries. Needs a display. Run from the project root:
+
+    python -m benchmarks.theme_benchmark --widgets 100,1000,10000 --toggles 20
+"""
+
+import argparse
+import statistics
+import time
+import tkinter as tk
+from tkinter import ttk
+
+from src.gui.theme import PALETTES, ThemeRegistry
+
+
+def build_registry_widgets(root, registry, count):
+    """The app's registered widgets plus `count` ttk labels and entries; returns the container."""
+    container = ttk.Frame(root)
+    container.pack(fill="both", expand=True)
+    menu_bar = registry.register(tk.Frame(container, height=25), "menu_bar")
+    menu_bar.pack(fill="x")
+    settings_button = registry.register(tk.Menubutton(menu_bar, text="Settings"), "menu")
+    settings_button.pack(side="left")
+    registry.register(tk.Menu(settings_button, tearoff=0), "menu")
+    registry.register(tk.Checkbutton(menu_bar, text="Enable Google Sync"), "menu_check").pack(side="left")
+    registry.register(tk.Label(menu_bar, text="Sync off"), "menu_label").pack(side="left")
+    panes = registry.register(tk.PanedWindow(container, orient="horizontal"), "window")
+    panes.pack(fill="both", expand=True)
+    form = ttk.Frame(panes)
+    panes.add(form)
+    for i in range(count):
+        widget = ttk.Label(form, text=f"Field {i}:") if i % 2 == 0 else ttk.Entry(form, width=20)
+        widget.grid(row=i // 2, column=i % 2)
+    return container
+
+
+def build_classic_widgets(root, count):
+    """`count` classic tk labels and entries, as the forms were built before; returns the container."""
+    container = tk.Frame(root)
+    container.pack(fill="both", expand=True)
+    for i in range(count):
+        widget = tk.Label(container, text=f"Field {i}:") if i % 2 == 0 else tk.Entry(container, width=20)
+        widget.grid(row=i // 2, column=i % 2)
+    return container
+
+
+def walk(widget, palette):
+    """The recursive per-widget theme update the main window used before ThemeRegistry."""
+    for child in widget.winfo_children():
+        if not isinstance(child, ttk.Widget):
+            options = child.keys()
+            if 'bg' in options or 'background' in options:
+                child.config(bg=palette["bg"])
+            if 'fg' in options or 'foreground' in options:
+                child.config(fg=palette["fg"])
+            if isinstance(child, (tk.Entry, tk.Text)):
+                child.config(bg=palette["entry_bg"], fg=palette["entry_fg"])
+            elif isinstance(child, tk.Button):
+                child.config(activebackground=palette["button_bg"], activeforeground=palette["fg"])
+        walk(child, palette)
+
+
+def time_switches(root, switch, toggles, redraw):
+    """Median milliseconds of `toggles` switches between Dark and Light."""
+    times = []
+    for i in range(toggles):
+        started = time.perf_counter()
+        switch("Dark" if i % 2 == 0 else "Light")
+        if redraw:
+            root.update_idletasks()
+        times.append(time.perf_counter() - started)
+    return statistics.median(times) * 1000
+
+
+def run(args):
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        print(f"A display is needed to create Tk widgets: {e}")
+        return 1
+    if not args.show:
+        root.withdraw()
+
+    counts = [int(count) for count in args.widgets.split(",")]
+    print(f"Theme switch time, median of {args.toggles}{' with redraw' if args.redraw else ''}")
+    print(f"  {'widgets':>8}{'registry ms':>13}{'walk ms':>10}{'touched':>9}")
+    for count in counts:
+        registry = ThemeRegistry(root)
+        registry.use("Light")
+        container = build_registry_widgets(root, registry, count)
+        root.update_idletasks()
+        registry_ms = time_switches(root, registry.use, args.toggles, args.redraw)
+        touched = registry.registered()
+        container.destroy()
+
+        container = build_classic_widgets(root, count)
+        root.update_idletasks()
+        walk_ms = time_switches(root, lambda name: walk(container, PALETTES[name]), args.toggles, args.redraw)
+        container.destroy()
+        print(f"  {count:>8}{registry_ms:>13.2f}{walk_ms:>10.2f}{touched:>9}")
+    print("'touched' is the number of widgets the registry configures itself; ttk widgets follow their style.")
+    root.destroy()
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--widgets", default="100,1000,5000", help="comma-separated widget counts")
+    parser.add_argument("--toggles", type=int, default=20, help="theme switches to time per count")
+    parser.add_argument("--redraw", action="store_true", help="include redrawing the widgets in the time")
+    parser.add_argument("--show", action="store_true", help="show the window instead of keeping it hidden")
+    raise SystemExit(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
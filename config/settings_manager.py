@@ -1,6 +1,8 @@
 import os
 import json
+import logging
 import shutil
+import threading
 from appdirs import user_data_dir
 from src.utils.utils import resource_path
 
@@ -18,90 +20,194 @@ DATA_DIR = os.path.join(base_path, 'Data')
 # Paths for application files stored exclusively in AppData
 CONFIG_JSON_PATH = os.path.join(CONFIG_DIR, 'app_config.json')
 ICON_PATH = os.path.join(ASSETS_DIR, 'app_icon.png')
+ASSET_CACHE_DIR = os.path.join(ASSETS_DIR, 'cache')  # Icons pre-scaled to the size they are shown at
 PERSONAL_INFO_FILE = os.path.join(DATA_DIR, 'personal_info.json')
 DATA_FILE_PATH = os.path.join(DATA_DIR, 'Applications.xlsx')
+SQLITE_DB_PATH = os.path.join(DATA_DIR, 'Applications.db')
 SERVICE_ACCOUNT_FILE = os.path.join(CONFIG_DIR, 'service_account.json')
+SYNC_BASE_PATH = os.path.join(CONFIG_DIR, 'sync_base.json')  # Last data known to match Google Sheets
+SYNC_OUTBOX_PATH = os.path.join(CONFIG_DIR, 'sync_outbox.json')  # Local changes not yet synced
 
 # Default configurations for settings
 default_config = {
     "ENABLE_GOOGLE_SYNC": False,
     "DATA_FILE_PATH": DATA_FILE_PATH,
+    "STORAGE_BACKEND": "excel",  # "excel" or "sqlite"
+    "SQLITE_DB_PATH": SQLITE_DB_PATH,
     "SERVICE_ACCOUNT_FILE": SERVICE_ACCOUNT_FILE,
     "SPREADSHEET_ID": "",
+    "SYNC_REQUESTS_PER_MINUTE": 30,  # Google Sheets request budget shared by reads and writes
+    "SYNC_HTTP_CLIENT": "httplib2",  # "httplib2" or "asyncio" (needs aiohttp)
     "theme": "Light"  # Default theme
 }
 
-# Ensure required directories in AppData exist
-os.makedirs(ASSETS_DIR, exist_ok=True)
-os.makedirs(DATA_DIR, exist_ok=True)
-os.makedirs(CONFIG_DIR, exist_ok=True)
-
-# Copy assets directory if it doesn't exist in AppData
-project_assets_path = resource_path('assets')
-if not os.listdir(ASSETS_DIR):
-    if os.path.exists(project_assets_path):
-        try:
-            shutil.copytree(project_assets_path, ASSETS_DIR, dirs_exist_ok=True)
-            print(f"Copied assets folder to {ASSETS_DIR}")
-        except Exception as e:
-            print(f"Error copying assets folder: {e}")
-    else:
-        print("Error: assets folder is missing from the project directory.")
-
-# Load configurations from app_config.json if available, or initialize it in AppData
-if os.path.exists(CONFIG_JSON_PATH):
-    with open(CONFIG_JSON_PATH, "r") as config_file:
-        try:
-            user_config = json.load(config_file)
-        except json.JSONDecodeError:
-            user_config = default_config
-            print("Warning: app_config.json is malformed. Using default configurations.")
-else:
-    # If app_config.json doesn't exist, create it with default settings in AppData
-    user_config = default_config
-    with open(CONFIG_JSON_PATH, "w") as config_file:
-        json.dump(default_config, config_file, indent=4)
-        print("Initialized app_config.json with default configurations in AppData.")
-
-# Merge any missing default keys with loaded configurations to ensure all are present
-for key, value in default_config.items():
-    user_config.setdefault(key, value)
-
-# Export configuration variables from loaded user_config
-ENABLE_GOOGLE_SYNC = user_config["ENABLE_GOOGLE_SYNC"]
-SPREADSHEET_ID = user_config["SPREADSHEET_ID"]
-theme = user_config["theme"]
-
 # Example range for Google Sheets
 RANGE_NAME = "Sheet1!A1:E"  # Adjust this to the actual range as needed
 
-def save_theme(new_theme):
-    """Updates the theme in app_config.json located in AppData."""
-    global theme  # Update the global theme variable to match the new setting
-    theme = new_theme
-
-    # Load the current configuration from CONFIG_JSON_PATH to ensure no other settings are overwritten
-    try:
-        with open(CONFIG_JSON_PATH, "r") as config_file:
-            config_data = json.load(config_file)
-    except (FileNotFoundError, json.JSONDecodeError):
-        # If file does not exist or is corrupted, start with default configuration
-        config_data = default_config
-
-    # Update the theme in the loaded configuration data
-    config_data["theme"] = theme
-
-    # Save the updated configuration back to app_config.json
-    try:
-        with open(CONFIG_JSON_PATH, "w") as config_file:
-            json.dump(config_data, config_file, indent=4)
-        print(f"[DEBUG] Theme set to '{theme}' and saved in app_config.json in AppData.")
-    except Exception as e:
-        print(f"[ERROR] Failed to save theme to app_config.json: {e}")
-
-# Debugging: Print paths to verify correct file locations are set to AppData
-print(f"App Local Storage Path: {base_path}")
-print(f"Config JSON Path: {CONFIG_JSON_PATH}")
-print(f"Data File Path: {DATA_FILE_PATH}")
-print(f"Service Account File Path: {SERVICE_ACCOUNT_FILE}")
-print(f"Icon Path: {ICON_PATH}")
\ No newline at end of file
+# Settings changed within this many seconds of each other are written to app_config.json together
+WRITE_DELAY_SECONDS = 1.0
+
+
+def ensure_app_dirs():
+    """
+    Creates the AppData folders and copies the bundled assets there on first run.
+    Called once by app.py at startup; importing this module touches no files.
+    """
+    os.makedirs(ASSETS_DIR, exist_ok=True)
+    os.makedirs(DATA_DIR, exist_ok=True)
+    os.makedirs(CONFIG_DIR, exist_ok=True)
+
+    # Copy assets directory if it doesn't exist in AppData
+    project_assets_path = resource_path('assets')
+    if not os.listdir(ASSETS_DIR):
+        if os.path.exists(project_assets_path):
+            try:
+                shutil.copytree(project_assets_path, ASSETS_DIR, dirs_exist_ok=True)
+                print(f"Copied assets folder to {ASSETS_DIR}")
+            except Exception as e:
+                print(f"Error copying assets folder: {e}")
+        else:
+            print("Error: assets folder is missing from the project directory.")
+    logging.debug(f"App Local Storage Path: {base_path}, Config JSON Path: {CONFIG_JSON_PATH}")
+
+
+class ConfigService:
+    """
+    The settings in app_config.json, held in memory.
+
+    The file is read on first use and not again unless reload() is called; missing keys
+    take their value from default_config. set() changes values in memory, tells subscribers
+    which values changed and schedules a single write for every change made within
+    `write_delay` seconds. The file is replaced atomically, so it is never left half
+    written. close() writes pending changes at once. Safe to use from any thread;
+    subscribers run on the thread that changed the values.
+    """
+
+    def __init__(self, path=CONFIG_JSON_PATH, defaults=None, write_delay=WRITE_DELAY_SECONDS):
+        self.path = path
+        self.defaults = dict(default_config if defaults is None else defaults)
+        self.write_delay = write_delay
+        self.load_error = None  # Why app_config.json could not be read, if it could not
+        self.writes = 0  # Times the file was written
+        self._values = None
+        self._dirty = False
+        self._timer = None
+        self._subscribers = []
+        self._lock = threading.RLock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            return self._loaded().get(key, default)
+
+    def __getitem__(self, key):
+        with self._lock:
+            return self._loaded()[key]
+
+    def as_dict(self):
+        with self._lock:
+            return dict(self._loaded())
+
+    def set(self, **changes):
+        """Updates settings and returns {key: new value} for the values that actually changed."""
+        with self._lock:
+            values = self._loaded()
+            changed = {key: value for key, value in changes.items() if key not in values or values[key] != value}
+            if not changed:
+                return {}
+            values.update(changed)
+            self._dirty = True
+            if self._timer is None:
+                self._timer = threading.Timer(self.write_delay, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+            subscribers = list(self._subscribers)
+        self._notify(subscribers, changed)
+        return changed
+
+    def subscribe(self, callback, keys=None):
+        """
+        Calls `callback(changes)` with {key: new value} whenever settings change, or only
+        when one of `keys` does. Returns a function that removes the subscription.
+        """
+        subscription = (callback, frozenset(keys) if keys else None)
+        with self._lock:
+            self._subscribers.append(subscription)
+
+        def unsubscribe():
+            with self._lock:
+                if subscription in self._subscribers:
+                    self._subscribers.remove(subscription)
+        return unsubscribe
+
+    def reload(self):
+        """Writes pending changes, re-reads the file and tells subscribers about values that differ."""
+        self.flush()
+        with self._lock:
+            previous, self._values = self._values, None
+            values = self._loaded()
+            changed = {key: value for key, value in values.items()
+                       if previous is not None and previous.get(key) != value}
+            subscribers = list(self._subscribers)
+        self._notify(subscribers, changed)
+        return changed
+
+    def flush(self):
+        """Writes pending changes to app_config.json now."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._dirty:
+                return
+            self._dirty = False
+            try:
+                temp_path = self.path + ".tmp"
+                with open(temp_path, "w", encoding="utf-8") as config_file:
+                    json.dump(self._values, config_file, indent=4)
+                os.replace(temp_path, self.path)
+                self.writes += 1
+            except OSError as e:
+                self._dirty = True
+                print(f"[ERROR] Failed to save app_config.json: {e}")
+                logging.error(f"Failed to save app_config.json: {e}")
+
+    def close(self):
+        self.flush()
+
+    def _loaded(self):
+        if self._values is None:
+            self._values = self._read()
+        return self._values
+
+    def _read(self):
+        values = dict(self.defaults)
+        self.load_error = None
+        try:
+            with open(self.path, "r", encoding="utf-8") as config_file:
+                stored = json.load(config_file)
+            if not isinstance(stored, dict):
+                raise ValueError("the file does not hold a JSON object")
+            values.update(stored)
+        except FileNotFoundError:
+            pass  # First run: defaults until a setting is changed
+        except (OSError, ValueError) as e:
+            self.load_error = str(e)
+            print("Warning: app_config.json is malformed. Using default configurations.")
+            logging.warning(f"app_config.json could not be read ({e}); using default configurations.")
+        return values
+
+    @staticmethod
+    def _notify(subscribers, changed):
+        if not changed:
+            return
+        for callback, keys in subscribers:
+            changes = changed if keys is None else {key: value for key, value in changed.items() if key in keys}
+            if changes:
+                try:
+                    callback(changes)
+                except Exception as e:
+                    logging.error(f"Error applying changed settings {sorted(changes)}: {e}")
+
+
+# The application's settings, loaded on first use
+config = ConfigService()
@@ -4,33 +4,52 @@ import tkinter as tk
 from tkinter import filedialog, messagebox
 from tkinter import ttk
 from datetime import datetime
-import pandas as pd
 import json
+import queue
+import threading
 import webbrowser
 import shutil
-from PIL import Image, ImageTk
 from tkinterdnd2 import DND_FILES, TkinterDnD
-from config.settings_manager import default_config, save_theme, SPREADSHEET_ID, ENABLE_GOOGLE_SYNC, \
-    ASSETS_DIR
-
-# Import configuration settings from settings_manager.py
+# Paths, and `config`, the settings in app_config.json (read once, on first use)
 from config.settings_manager import (
+    ASSETS_DIR,
+    ASSET_CACHE_DIR,
     PERSONAL_INFO_FILE,
-    DATA_FILE_PATH,
     base_path,
     CONFIG_JSON_PATH,
-    SERVICE_ACCOUNT_FILE
+    SERVICE_ACCOUNT_FILE,
+    SYNC_BASE_PATH,
+    SYNC_OUTBOX_PATH,
+    config
 )
 
-# Import utility functions for file I/O and Google Sheets synchronization
-from src.utils.file_io import read_applications_from_excel, save_applications_to_excel
-from src.utils.google_sheets import (
-    read_from_google_sheets,
-    write_to_google_sheets
-)
+# Google Sheets synchronization; the Google API client itself is imported on first sync.
+# pandas, PIL and the storage engines are imported where they are first needed, after
+# the window has been painted, so they do not delay startup.
+from src.utils.google_sheets import get_sheets_backend, sheets_client
 
 # Import the centralized resource_path function from utils/utils.py
 from src.utils.utils import resource_path
+from src.utils.asset_cache import AssetCache
+from src.gui.theme import ThemeRegistry
+from src.utils.startup_timer import StartupTimer
+from src.utils.sync_merge import SheetSyncEngine, SyncSnapshot
+from src.utils.sync_outbox import SyncOutbox, error_status
+from src.utils.sync_scheduler import PUSH_BATCH_MS, SyncScheduler, TokenBucket
+from src.utils.sync_worker import SyncWorker
+from src.gui.virtual_treeview import StreamedRows, VirtualTreeview
+
+# Rows read per batch while applications stream in at startup
+LOAD_BATCH_ROWS = 1000
+
+# Journaled edits are folded into Applications.xlsx after this much idle time
+COMPACTION_IDLE_MS = 5000
+
+# How often the Tk thread checks the sync worker for finished Google Sheets calls
+SYNC_POLL_MS = 100
+
+# Seconds the window waits at exit for a sync still running; the outbox keeps whatever it didn't push
+SYNC_CLOSE_SECONDS = 5
 
 def load_personal_info():
     """
@@ -59,7 +78,15 @@ def load_personal_info():
         }
 
 class AppTrackPro(TkinterDnD.Tk):  # Inherit from TkinterDnD.Tk for drag-and-drop
-    def __init__(self):
+    def __init__(self, started=None):
+        """
+        Builds the window in two phases. The shell (menu bar, notebooks and the Add Application
+        tab) is built here and painted first; finish_startup then loads the applications in the
+        background and builds the Clipboard tab. The View/Edit tab and the settings icons are
+        built the first time they are shown. `started` is the time.perf_counter() startup is
+        measured from.
+        """
+        self.startup_timer = StartupTimer(started)
         super().__init__()
         self.APPLICATIONS_FILE_NAME = "Applications.xlsx"
         self.SERVICE_ACCOUNT_FILE_NAME = "service_account.json"  # Define the service account file name
@@ -71,6 +98,28 @@ class AppTrackPro(TkinterDnD.Tk):  # Inherit from TkinterDnD.Tk for drag-and-dro
         self.status_combobox = None
         self.edit_entry = None  # Initialize edit_entry as None
         self.menu_visible = False  # Variable to track menu visibility
+        self.application_store = None  # Storage engine selected by STORAGE_BACKEND
+        self.applications_loading = True  # True until applications have streamed in from storage
+        self.compaction_task = None  # after() id of the pending idle compaction
+        # Merges local and Google Sheets changes against the data both held after the last sync
+        self.sync_budget = TokenBucket(config.get("SYNC_REQUESTS_PER_MINUTE"))  # Keeps sync within the API quota
+        self.sheets_backend = get_sheets_backend()
+        self.sheets_backend.budget = self.sync_budget
+        self.sheets_backend.progress = self.report_sync_progress
+        self.sync_progress = None  # (done, total, action) of the running chunked transfer
+        self.sync_engine = SheetSyncEngine(SYNC_BASE_PATH, self.sheets_backend)
+        self.sync_scheduler = SyncScheduler()  # Adapts the poll interval to activity and focus
+        self.sync_task = None  # after() id of the next poll
+        self.push_batch_task = None  # after() id of the pending batched push
+        self.sync_worker = SyncWorker(self.sync_engine.sync)
+        self.sync_poll_task = None  # after() id of the next sync worker poll
+        self.sync_outbox = SyncOutbox(SYNC_OUTBOX_PATH)  # Unsynced local changes and retry state
+        self.sync_retry_task = None  # after() id of the next retry after a failed sync
+        self.last_sync_status = "Waiting to sync"
+        # Bundled assets, or the AppData copy when run from elsewhere; icons are pre-scaled once
+        self.assets = AssetCache(ASSET_CACHE_DIR, (resource_path('assets'), ASSETS_DIR))
+        self.assets_loaded = False  # Settings dialog icons are loaded when a dialog first opens
+        self.exit_when_interactive = False  # Set by `app.py --measure-startup`
 
         # Configure the main window
         self.configure_window()
@@ -87,35 +136,47 @@ class AppTrackPro(TkinterDnD.Tk):  # Inherit from TkinterDnD.Tk for drag-and-dro
         # Create UI components
         self.create_ui_components()
 
-        # Load assets (images)
-        self.load_assets()
-
         # Initialize additional GUI components
         self.initialize_additional_gui()
 
-        self.load_application_data()
-
         # Setup the main layout
         self.setup_main_layout()
 
-        # Schedule periodic tasks
-        self.schedule_tasks()
+        # Settings changed from now on are applied as they change
+        config.subscribe(self.apply_config_changes)
 
-        # Apply the current theme
-        self.apply_theme()
+        # Everything else waits until the shell has been painted
+        self.after(0, self.finish_startup)
+
+    def finish_startup(self):
+        """Second startup phase, run from the event loop once the window shell is on screen."""
+        self.update_idletasks()  # Completes the pending first redraw
+        self.startup_timer.mark("first_paint")
 
-        # Initialize sync task
-        self.sync_task = None
+        self.load_application_data()
+        self.build_tab(self.clipboard_tab)
+
+        # Start polling Google Sheets; polls slow down while the window is in the background
+        self.bind("<FocusIn>", self.on_focus_change, add="+")
+        self.bind("<FocusOut>", self.on_focus_change, add="+")
         self.schedule_sync()
 
+    def mark_interactive(self):
+        """Reports startup times once the applications are loaded and every control responds."""
+        if "interactive" in self.startup_timer.marks:
+            return
+        self.startup_timer.mark("interactive")
+        self.startup_timer.report()
+        if self.exit_when_interactive:
+            self.after(0, self.on_close)
+
     def configure_window(self):
         # Use the native title bar by removing overrideredirect
         self.title("AppTrackPro")
         self.geometry("1300x600")
+        self.protocol("WM_DELETE_WINDOW", self.on_close)  # Flush pending writes before exiting
         try:
-            icon_path = resource_path(os.path.join('assets', 'app_icon.png'))
-            icon_image = tk.PhotoImage(file=icon_path)
-            self.iconphoto(True, icon_image)  # Use .png file for the application icon
+            self.iconphoto(True, self.assets.photo('app_icon.png'))  # Use .png file for the application icon
         except Exception as e:
             print(f"Error loading icon: {e}")
             logging.error(f"Error loading icon: {e}")
@@ -125,44 +186,42 @@ class AppTrackPro(TkinterDnD.Tk):  # Inherit from TkinterDnD.Tk for drag-and-dro
         self.CONFIG_DIR = os.path.join(self.BASE_PATH, 'config')
         self.CONFIG_JSON_PATH = CONFIG_JSON_PATH  # Already set to AppData path
         self.DATA_DIR = os.path.join(self.BASE_PATH, 'Data')
-        self.DATA_FILE_PATH = DATA_FILE_PATH  # Directly use the AppData path for Applications.xlsx
-        os.makedirs(self.DATA_DIR, exist_ok=True)
-        os.makedirs(self.CONFIG_DIR, exist_ok=True)
+        self.DATA_FILE_PATH = config.get("DATA_FILE_PATH")  # Applications.xlsx in AppData unless configured otherwise
 
     def load_and_apply_theme(self):
+        # Set before any widget is built, so every widget is created in the saved theme
+        self.theme = ThemeRegistry(self)
         self.is_dark_mode = self.load_theme_from_config()
-        if self.is_dark_mode:
-            self.set_dark_mode()
-        else:
-            self.set_light_mode()
+        self.apply_theme()
 
     def initialize_preferences(self):
         """Initialize preferences like Google Sync based on the configuration."""
-        self.sync_to_google = ENABLE_GOOGLE_SYNC
+        self.sync_to_google = config.get("ENABLE_GOOGLE_SYNC")
         self.google_sync_var = tk.BooleanVar(value=self.sync_to_google)
 
     def create_ui_components(self):
         self.create_custom_menu_bar()
 
     def load_assets(self):
+        """
+        Loads the settings dialog icons the first time a dialog opens. They come from the
+        asset cache already scaled, so PIL is only needed when the cache is cold.
+        """
+        if self.assets_loaded:
+            return
+        self.assets_loaded = True
         try:
-            self.upload_xlsx_icon = ImageTk.PhotoImage(
-                Image.open(resource_path(os.path.join('assets', 'upload_xlsx.png'))).resize((64, 64))
-            )
-            self.upload_json_icon = ImageTk.PhotoImage(
-                Image.open(resource_path(os.path.join('assets', 'upload_json.png'))).resize((64, 64))
-            )
-            self.upload_sheets_id_icon = ImageTk.PhotoImage(
-                Image.open(resource_path(os.path.join('assets', 'upload_sheets_id.png'))).resize((42, 42))
-            )
+            self.upload_xlsx_icon = self.assets.photo('upload_xlsx.png', (64, 64))
+            self.upload_json_icon = self.assets.photo('upload_json.png', (64, 64))
+            self.upload_sheets_id_icon = self.assets.photo('upload_sheets_id.png', (42, 42))
             try:
-                self.google_sync_icon = tk.PhotoImage(file=os.path.join(ASSETS_DIR, 'google_sync.png'))
+                self.google_sync_icon = self.assets.photo('google_sync.png')
             except Exception as e:
                 print(f"Error loading google_sync.png: {e}")
                 self.google_sync_icon = None
 
             try:
-                self.applications_icon = tk.PhotoImage(file=os.path.join(ASSETS_DIR, 'applications.png'))
+                self.applications_icon = self.assets.photo('applications.png')
             except Exception as e:
                 print(f"Error loading applications.png: {e}")
                 self.applications_icon = None
@@ -177,22 +236,136 @@ class AppTrackPro(TkinterDnD.Tk):  # Inherit from TkinterDnD.Tk for drag-and-dro
         self.search_var = tk.StringVar()
         self.search_var.trace_add("write", lambda *args: self.perform_search())
         self.applications_tree = None
+        self.applications_view = None  # VirtualTreeview that renders applications_tree
         self.position_entry = None
         self.company_entry = None
         self.url_entry = None
-        self.applications_df = pd.DataFrame()
+        self.applications_df = None  # Set once applications have loaded
+        self.streamed_rows = StreamedRows()  # Batches shown while applications stream in
+        self.search_index = None  # Trigram index over applications_df used by perform_search, built while loading
+        self.query_engine = None  # QueryEngine for field queries such as "status:Interview", made on first search
 
     def load_application_data(self):
-        """Loads application data from Applications.xlsx in AppData."""
+        """
+        Starts streaming application data from the configured storage engine in AppData.
+        Batches are read on a background thread and shown in the Treeview as they arrive.
+        """
+        self.applications_loading = True
+        self.streamed_rows = StreamedRows()
+        self.load_progress = (0, None)
+
+        # A bounded queue keeps at most a few unrendered batches in memory
+        self.application_batch_queue = queue.Queue(maxsize=4)
+        threading.Thread(target=self.stream_application_batches, name="ApplicationLoader", daemon=True).start()
+        self.after(0, self.drain_application_batches)
+
+    def stream_application_batches(self):
+        """Background thread: reads application batches and hands them to the Tk thread."""
+        def report_progress(rows_read, total_rows):
+            self.load_progress = (rows_read, total_rows)
+
         try:
-            self.applications_df = read_applications_from_excel(self.DATA_FILE_PATH)
+            # Opening the store imports pandas and the storage engine, so it happens here too
+            from src.utils.file_io import ApplicationDataset, open_application_store
+            from src.utils.search_index import SearchIndex
+            self.application_store = open_application_store(
+                config.get("STORAGE_BACKEND"), self.DATA_FILE_PATH, config.get("SQLITE_DB_PATH")
+            )
+            self.application_dataset = ApplicationDataset(self.application_store)
+
+            for batch in self.application_dataset.stream(LOAD_BATCH_ROWS, report_progress):
+                self.application_batch_queue.put(("batch", batch))
+
+            # Build the search index here too, so the Tk thread only swaps it in
+            applications_df = self.application_dataset.get()
+            search_index = SearchIndex()
+            search_index.build(applications_df)
+            self.application_batch_queue.put(("done", (applications_df, search_index)))
         except Exception as e:
-            print(f"Error: Could not read the Excel file from AppData. {str(e)}")
-            logging.error(f"Error: Could not read the Excel file from AppData. {str(e)}")
-            self.applications_df = pd.DataFrame()
+            self.application_batch_queue.put(("error", e))
+
+    def drain_application_batches(self):
+        """Inserts one streamed batch into the Treeview per call until loading has finished."""
+        try:
+            kind, payload = self.application_batch_queue.get_nowait()
+        except queue.Empty:
+            self.after(15, self.drain_application_batches)
+            return
+
+        if kind == "batch":
+            self.streamed_rows.append(payload)
+            if self.applications_view:
+                # Only the visible rows are sliced out of the batches and become Treeview items;
+                # the batches are concatenated once, by the loader thread, when the last one is read
+                self.applications_view.set_data(self.streamed_rows, keep_offset=True)
+            self.update_load_status()
+            self.after(1, self.drain_application_batches)
+            return
+
+        self.applications_loading = False
+        self.streamed_rows = StreamedRows()
+        if kind == "done":
+            self.applications_df, self.search_index = payload
+            print(f"Loaded {len(self.applications_df)} applications.")
+            self.populate_treeview(self.applications_df, keep_offset=True)
+        else:
+            import pandas as pd  # Already loaded by the loader thread
+            from src.utils.file_io import APPLICATION_COLUMNS
+            from src.utils.search_index import SearchIndex
+            print(f"Error: Could not read the Excel file from AppData. {str(payload)}")
+            logging.error(f"Error: Could not read the Excel file from AppData. {str(payload)}")
+            self.applications_df = pd.DataFrame(columns=APPLICATION_COLUMNS)
+            self.search_index = SearchIndex()
+            self.search_index.build(self.applications_df)
+        self.update_load_status()
+        self.mark_interactive()
+
+        # Apply any search typed while the data was still loading
+        if self.search_var.get().strip():
+            self.perform_search()
+
+        # The startup sync is skipped while loading, so run it now
+        if self.sync_to_google:
+            if self.sync_outbox.pending:
+                print(f"{self.sync_outbox.edits} local changes from an earlier session are waiting to be synced.")
+            self.sync_from_google_sheets()
+
+    def update_load_status(self):
+        """Shows loading progress next to the search bar."""
+        if not getattr(self, 'load_status_var', None):
+            return
+        if not self.applications_loading:
+            self.load_status_var.set("")
+            return
+        rows_read, total_rows = self.load_progress
+        if total_rows:
+            self.load_status_var.set(f"Loading applications... {rows_read:,} / {total_rows:,}")
+        else:
+            self.load_status_var.set(f"Loading applications... {rows_read:,}")
+
+    def schedule_compaction(self):
+        """Folds journaled edits into local storage once edits have been idle for a while."""
+        if self.compaction_task is not None:
+            self.after_cancel(self.compaction_task)
+        self.compaction_task = self.after(COMPACTION_IDLE_MS, self.compact_applications)
+
+    def compact_applications(self):
+        """
+        Hands a copy of the applications to the store's background writer, which folds the
+        change journal into local storage. The copy itself is made here, on the Tk thread.
+        """
+        self.compaction_task = None
+        self.application_store.compact(self.applications_df)
+
+    def applications_ready(self):
+        """Returns False (and explains why) while applications are still streaming in."""
+        if self.applications_loading:
+            print("Applications are still loading. Please try again in a moment.")
+            return False
+        return True
 
     def setup_main_layout(self):
-        main_paned_window = tk.PanedWindow(self, orient="horizontal")
+        main_paned_window = self.theme.register(tk.PanedWindow(self, orient="horizontal"), "window")
         main_paned_window.pack(side='top', fill='both', expand=True)
 
         self.tab_control = ttk.Notebook(main_paned_window)
@@ -210,35 +383,29 @@ class AppTrackPro(TkinterDnD.Tk):  # Inherit from TkinterDnD.Tk for drag-and-dro
         main_paned_window.paneconfig(self.tab_control, minsize=300)
         main_paned_window.paneconfig(self.right_notebook, minsize=125)
 
+        # Only the Add Application tab is shown at first; the others are built when first shown
+        self.tab_builders = {
+            str(self.view_edit_applications_tab): self.create_view_edit_applications_tab,
+            str(self.clipboard_tab): self.create_personal_info_tab,
+        }
+        self.tab_control.bind("<<NotebookTabChanged>>", self.on_tab_changed)
         self.create_add_application_tab()
-        self.create_view_edit_applications_tab()
-        self.create_personal_info_tab()
 
-    def schedule_tasks(self):
-        if self.sync_to_google:
-            self.after(60000, self.sync_to_google_sheets)
-            self.schedule_sync()
-            self.apply_theme()
+    def on_tab_changed(self, event):
+        self.build_tab(event.widget.select())
+
+    def build_tab(self, tab):
+        """Builds a tab's contents the first time it is shown."""
+        builder = self.tab_builders.pop(str(tab), None)
+        if builder is not None:
+            builder()
 
 #-----------------------------------------------
     def load_theme_from_config(self):
-        """Load the saved theme setting from app_config.json in AppData, or create it with default settings if it doesn't exist."""
-        # Check if app_config.json exists in AppData (CONFIG_JSON_PATH)
-        if not os.path.exists(CONFIG_JSON_PATH):
-            # Create app_config.json in AppData with default theme settings
-            default_config = {"theme": "Light"}
-            with open(CONFIG_JSON_PATH, "w") as config_file:
-                json.dump(default_config, config_file, indent=4)
-            return False  # Default to Light theme
-
-        # Load theme from existing app_config.json in AppData
-        try:
-            with open(CONFIG_JSON_PATH, "r") as config_file:
-                config = json.load(config_file)
-                return config.get("theme", "Light") == "Dark"
-        except json.JSONDecodeError:
+        """Return whether the saved theme is Dark; without a saved theme, the default is Light."""
+        if config.load_error:
             messagebox.showerror("Error", "app_config.json is corrupted. Reverting to default settings.")
-            return False  # Default to Light theme
+        return config.get("theme") == "Dark"
 
     def create_add_application_tab(self):
         """
@@ -250,28 +417,28 @@ class AppTrackPro(TkinterDnD.Tk):  # Inherit from TkinterDnD.Tk for drag-and-dro
         entry_font = ("TkDefaultFont", 12)
 
         # Form frame to hold input fields, making it easier to center content
-        form_frame = tk.Frame(self.add_application_tab)
+        form_frame = ttk.Frame(self.add_application_tab)
         form_frame.grid(row=0, column=0, padx=20, pady=20, sticky="n")
 
         # Input for 'Company' (first input field)
-        tk.Label(form_frame, text="Company:", font=label_font).grid(
+        ttk.Label(form_frame, text="Company:", font=label_font).grid(
             row=0, column=0, padx=10, pady=(0, 5), sticky="w"
         )
-        self.company_entry = tk.Entry(form_frame, font=entry_font, width=60)
+        self.company_entry = ttk.Entry(form_frame, font=entry_font, width=60)
         self.company_entry.grid(row=1, column=0, padx=10, pady=(0, 10))
 
         # Input for 'Position' (second input field)
-        tk.Label(form_frame, text="Position:", font=label_font).grid(
+        ttk.Label(form_frame, text="Position:", font=label_font).grid(
             row=2, column=0, padx=10, pady=(0, 5), sticky="w"
         )
-        self.position_entry = tk.Entry(form_frame, font=entry_font, width=60)
+        self.position_entry = ttk.Entry(form_frame, font=entry_font, width=60)
         self.position_entry.grid(row=3, column=0, padx=10, pady=(0, 10))
 
         # Input for 'Application Portal URL'
-        tk.Label(form_frame, text="Application Portal URL:", font=label_font).grid(
+        ttk.Label(form_frame, text="Application Portal URL:", font=label_font).grid(
             row=4, column=0, padx=10, pady=(0, 5), sticky="w"
         )
-        self.url_entry = tk.Entry(form_frame, font=entry_font, width=60)
+        self.url_entry = ttk.Entry(form_frame, font=entry_font, width=60)
         self.url_entry.grid(row=5, column=0, padx=10, pady=(0, 20))
 
         # 'Submit' button for adding the application (updated to ttk.Button)
@@ -294,24 +461,21 @@ class AppTrackPro(TkinterDnD.Tk):  # Inherit from TkinterDnD.Tk for drag-and-dro
         Sets up the 'View/Edit Applications' tab with a search bar and a Treeview
         to display application data with a vertical scrollbar and column configuration.
         """
-        # Attempt to load applications data
-        try:
-            self.applications_df = read_applications_from_excel(DATA_FILE_PATH)
-        except Exception as e:
-            print(f"Error: Could not read the Excel file. {str(e)}")
-            self.applications_df = pd.DataFrame()
-
         # Frame for search bar
-        search_frame = tk.Frame(self.view_edit_applications_tab)
+        search_frame = ttk.Frame(self.view_edit_applications_tab)
         search_frame.grid(row=0, column=0, sticky="ew")
 
         # Search label and entry field
-        tk.Label(search_frame, text="Search:").pack(side="left", padx=5)
-        search_entry = tk.Entry(search_frame, textvariable=self.search_var, width=30)
+        ttk.Label(search_frame, text="Search:").pack(side="left", padx=5)
+        search_entry = ttk.Entry(search_frame, textvariable=self.search_var, width=30)
         search_entry.pack(side="left", padx=5)
 
+        # Loading progress while applications stream in
+        self.load_status_var = tk.StringVar()
+        ttk.Label(search_frame, textvariable=self.load_status_var).pack(side="left", padx=10)
+
         # Frame for the main Treeview
-        frame = tk.Frame(self.view_edit_applications_tab)
+        frame = ttk.Frame(self.view_edit_applications_tab)
         frame.grid(row=1, column=0, sticky="nsew")
         self.view_edit_applications_tab.rowconfigure(1, weight=1)
         self.view_edit_applications_tab.columnconfigure(0, weight=1)
@@ -340,11 +504,15 @@ class AppTrackPro(TkinterDnD.Tk):  # Inherit from TkinterDnD.Tk for drag-and-dro
         # Bind Treeview events for clicking and context menu
         self.applications_tree.bind("<Button-1>", self.on_treeview_click)
         self.applications_tree.bind("<Button-3>", self.show_context_menu)  # Right-click menu
-        self.populate_treeview(self.applications_df)
 
-        # Add vertical scrollbar for Treeview
-        vsb = ttk.Scrollbar(frame, orient="vertical", command=self.applications_tree.yview)
-        self.applications_tree.configure(yscrollcommand=vsb.set)
+        # Add vertical scrollbar for Treeview; it scrolls the virtual view over the whole DataFrame
+        vsb = ttk.Scrollbar(frame, orient="vertical")
+        self.applications_view = VirtualTreeview(self.applications_tree, vsb, on_scroll=self.close_cell_editors)
+        if not self.applications_loading:
+            self.refresh_treeview()
+        elif len(self.streamed_rows):
+            self.applications_view.set_data(self.streamed_rows)
+        self.update_load_status()
 
         # Position Treeview and scrollbar in grid
         self.applications_tree.grid(row=0, column=0, sticky="nsew")
@@ -368,14 +536,14 @@ class AppTrackPro(TkinterDnD.Tk):  # Inherit from TkinterDnD.Tk for drag-and-dro
         # Add each personal info item as a label-entry pair
         for label, value in personal_info.items():
             # Field label (clickable to copy value)
-            field_label = tk.Label(self.clipboard_tab, text=label + ":", fg="blue", cursor="hand2")
+            field_label = ttk.Label(self.clipboard_tab, text=label + ":", cursor="hand2")
             field_label.grid(row=row, column=0, padx=5, pady=5, sticky="e")
 
             # Bind click event to copy value to clipboard
             field_label.bind("<Button-1>", lambda e, val=value: self.copy_to_clipboard(val))
 
             # Entry widget for displaying (and editing) field value
-            entry = tk.Entry(self.clipboard_tab, width=38)
+            entry = ttk.Entry(self.clipboard_tab, width=38)
             entry.insert(0, value)
             entry.grid(row=row, column=1, padx=5, pady=5, sticky="w")
 
@@ -384,7 +552,7 @@ class AppTrackPro(TkinterDnD.Tk):  # Inherit from TkinterDnD.Tk for drag-and-dro
             row += 1
 
         # Save button setup (updated to ttk.Button)
-        button_frame = tk.Frame(self.clipboard_tab)
+        button_frame = ttk.Frame(self.clipboard_tab)
         button_frame.grid(row=row, column=0, columnspan=2, pady=10)
         save_button = ttk.Button(
             button_frame,
@@ -396,29 +564,35 @@ class AppTrackPro(TkinterDnD.Tk):  # Inherit from TkinterDnD.Tk for drag-and-dro
         button_frame.grid_columnconfigure(0, weight=1)
 
     # Treeview Setup and Interaction
-    def populate_treeview(self, df):
+    def populate_treeview(self, df, keep_offset=False):
         """
-        Populates the applications Treeview with data from the DataFrame.
+        Shows the DataFrame in the applications Treeview.
+        Only the rows in view are created as Treeview items; scrolling materializes the rest.
         """
-        # Clear existing data in the Treeview
-        for item in self.applications_tree.get_children():
-            self.applications_tree.delete(item)
-
-        # Insert new data into the Treeview
-        for index, row in df.iterrows():
-            values = [index + 1] + list(row)
-            self.applications_tree.insert("", "end", iid=index, values=values)
+        if self.applications_view is None:
+            return  # The View/Edit tab shows the current data when it is first built
+        self.close_cell_editors()
+        self.applications_view.set_data(df, keep_offset=keep_offset)
 
     def refresh_treeview(self):
         """
-        Clears and repopulates the Treeview with the most current DataFrame Data.
+        Redraws the Treeview with the most current DataFrame Data, keeping any active search.
+        Only changed rows are touched, and the scroll position and selection are kept.
         """
-        # Clear existing Treeview Data
-        for item in self.applications_tree.get_children():
-            self.applications_tree.delete(item)
-
-        # Reload and display the current Data in the Treeview
-        self.populate_treeview(self.applications_df)
+        if self.search_var.get().strip():
+            self.perform_search(keep_offset=True)
+        else:
+            self.populate_treeview(self.applications_df, keep_offset=True)
+
+    def close_cell_editors(self):
+        """Removes any in-cell Entry or status dropdown, e.g. before the rows under it move."""
+        # Clear the attributes first: destroying a focused Entry fires its <FocusOut> handler
+        edit_entry, self.edit_entry = self.edit_entry, None
+        status_combobox, self.status_combobox = self.status_combobox, None
+        if edit_entry:
+            edit_entry.destroy()
+        if status_combobox:
+            status_combobox.destroy()
 
     def on_treeview_click(self, event):
         """
@@ -449,7 +623,7 @@ class AppTrackPro(TkinterDnD.Tk):  # Inherit from TkinterDnD.Tk for drag-and-dro
 
         # Handle URL column double-click behavior
         if col_index == 3:  # 'Application Portal URL' column
-            values = self.applications_tree.item(selected_item, "values")
+            values = self.applications_view.row_values(selected_item)
             url = values[col_index] if len(values) > col_index else ""
 
             # Check if the URL cell is clicked twice consecutively
@@ -489,7 +663,7 @@ class AppTrackPro(TkinterDnD.Tk):  # Inherit from TkinterDnD.Tk for drag-and-dro
 
         # Get cell coordinates and current value
         x, y, width, height = self.applications_tree.bbox(selected_item, column)
-        current_value = self.applications_tree.item(selected_item, "values")[col_index]
+        current_value = self.applications_view.row_values(selected_item)[col_index]
 
         # Create an entry widget over the cell for editing
         self.edit_entry = tk.Entry(self.applications_tree, width=width)
@@ -499,7 +673,8 @@ class AppTrackPro(TkinterDnD.Tk):  # Inherit from TkinterDnD.Tk for drag-and-dro
 
         # Bind actions to save or cancel editing
         self.edit_entry.bind("<Return>", lambda e: self.save_edit(selected_item, col_index))
-        self.edit_entry.bind("<FocusOut>", lambda e: self.edit_entry.destroy())
+        # Destroys this Entry, not self.edit_entry, which close_cell_editors() may have cleared by then
+        self.edit_entry.bind("<FocusOut>", lambda e, entry=self.edit_entry: entry.destroy())
         self.edit_entry.focus_set()
 
     def on_treeview_cell_edit(self, event):
@@ -529,7 +704,7 @@ class AppTrackPro(TkinterDnD.Tk):  # Inherit from TkinterDnD.Tk for drag-and-dro
         x, y, width, height = self.applications_tree.bbox(item_id, column="#" + str(col_index + 1))
 
         # Retrieve the current value of the cell for editing
-        current_value = self.applications_tree.item(item_id, "values")[col_index]
+        current_value = self.applications_view.row_values(item_id)[col_index]
 
         # Create and place an Entry widget at the cell's location with its current value
         self.edit_entry = tk.Entry(self.applications_tree, width=width)
@@ -538,42 +713,38 @@ class AppTrackPro(TkinterDnD.Tk):  # Inherit from TkinterDnD.Tk for drag-and-dro
 
         # Bind events to save or cancel edit on Enter key or focus loss
         self.edit_entry.bind("<Return>", lambda e: self.save_edit(item_id, col_index))
-        self.edit_entry.bind("<FocusOut>", lambda e: self.edit_entry.destroy())
+        # Destroys this Entry, not self.edit_entry, which close_cell_editors() may have cleared by then
+        self.edit_entry.bind("<FocusOut>", lambda e, entry=self.edit_entry: entry.destroy())
         self.edit_entry.focus_set()  # Set focus to the entry widget for immediate editing
 
     def save_edit(self, item_id, col_index):
         """
         Saves the edited value from the Entry widget back to both the Treeview cell and the DataFrame.
         """
+        if not self.applications_ready():
+            return
+
         # Check if edit_entry exists and retrieve the new value
         if self.edit_entry:
             new_value = self.edit_entry.get()
 
-            # Update the Treeview cell with the new value
-            values = list(self.applications_tree.item(item_id, "values"))
-            values[col_index] = new_value
-            self.applications_tree.item(item_id, values=values)
-
             # Update the DataFrame with the new value
             column_name = self.applications_tree["columns"][col_index]
             self.applications_df.at[int(item_id), column_name] = new_value
+            self.search_index.update_row(self.applications_df, int(item_id))
+
+            # Update the Treeview cell with the new value
+            self.refresh_treeview()
 
-            # Save the DataFrame to Excel
-            save_applications_to_excel(self.applications_df)
+            # Save the changed cell to local storage
+            self.application_store.update_cell(self.applications_df, int(item_id), column_name)
+            self.schedule_compaction()
 
             # Conditionally sync updated data to Google Sheets if sync is enabled
-            if self.sync_to_google:
-                try:
-                    write_to_google_sheets(self.applications_df)
-                    print(f"Updated '{column_name}' synced to Google Sheets for row {item_id}.")
-                except Exception as e:
-                    print(f"Error: Could not sync with Google Sheets. {str(e)}")
-            else:
-                print("Google Sync is disabled. Changes were not synced to Google Sheets.")
+            self.push_to_google_sheets()
 
-            # Destroy the Entry widget after saving the edit
-            self.edit_entry.destroy()
-            self.edit_entry = None  # Reset edit_entry
+            # Destroy the Entry widget after saving the edit (the refresh may already have removed it)
+            self.close_cell_editors()
 
             print(f"Saved edit: {new_value} in cell ({item_id}, {col_index}).")
         else:
@@ -584,15 +755,20 @@ class AppTrackPro(TkinterDnD.Tk):  # Inherit from TkinterDnD.Tk for drag-and-dro
         Saves the edited value directly within the cell without needing an Entry widget.
         Only allows saving for non-URL and non-Status columns.
         """
+        if not self.applications_ready():
+            return
+
         # Retrieve the directly edited value from the Treeview cell
-        edited_value = self.applications_tree.item(item_id, "values")[col_index]
+        edited_value = self.applications_view.row_values(item_id)[col_index]
 
         # Update the DataFrame with the edited value for the specified column
         column_name = self.applications_tree["columns"][col_index]
         self.applications_df.at[int(item_id), column_name] = edited_value
+        self.search_index.update_row(self.applications_df, int(item_id))
 
-        # Persist changes by saving the updated DataFrame to Excel
-        save_applications_to_excel(self.applications_df)
+        # Persist the changed cell to local storage
+        self.application_store.update_cell(self.applications_df, int(item_id), column_name)
+        self.schedule_compaction()
 
         # Unbind the key release event after saving to prevent unintended edits
         self.applications_tree.unbind("<KeyRelease>")
@@ -626,7 +802,7 @@ class AppTrackPro(TkinterDnD.Tk):  # Inherit from TkinterDnD.Tk for drag-and-dro
         copied_text = ""
         for row_id in row_ids:
             # Retrieve all cell values for the specified row
-            row_data = self.applications_tree.item(row_id, "values")
+            row_data = self.applications_view.row_values(row_id)
             # Concatenate row values into a single tab-separated string
             row_text = "\t".join(str(item) for item in row_data)
             copied_text += row_text + "\n"
@@ -640,67 +816,237 @@ class AppTrackPro(TkinterDnD.Tk):  # Inherit from TkinterDnD.Tk for drag-and-dro
 
     # Data Management and Synchronization
     def sync_from_google_sheets(self):
-        """Fetch data from Google Sheets if Google Sync is enabled."""
+        """Merge changes from Google Sheets on the sync worker if Google Sync is enabled."""
         if not self.sync_to_google:
             print("Google Sync is disabled. Skipping sync from Google Sheets.")
             return
+        if not self.applications_ready():
+            return
 
-        try:
-            # Retrieve the latest data from Google Sheets
-            google_df = read_from_google_sheets()
-
-            # Replace NaN values with empty strings
-            google_df = google_df.fillna('')
-
-            # Check for differences and update if necessary
-            if not google_df.empty:
-                if not google_df.equals(self.applications_df):
-                    print("Detected changes in Google Sheets. Updating local data.")
-                    self.applications_df = google_df
-
-                    # Ensure the Treeview is initialized before updating it
-                    if hasattr(self, 'applications_tree') and self.applications_tree:
-                        self.populate_treeview(self.applications_df)
-                    else:
-                        print("Error: applications_tree is not initialized yet. Will populate later.")
-                else:
-                    print("No changes detected in Google Sheets.")
-        except Exception as e:
-            print(f"Error syncing data from Google Sheets: {e}")
-            # Log the error but do not disable Google Sync
-            logging.error(f"Error syncing data from Google Sheets: {e}")
+        self.request_sync()
 
     def sync_to_google_sheets(self):
         """Push local DataFrame data to Google Sheets if Google Sync is enabled."""
         if not self.sync_to_google:
             print("Google Sync is disabled. Skipping sync to Google Sheets.")
             return
+        if not self.applications_ready():
+            return  # Never push a partially loaded table
 
-        try:
-            # Update Google Sheets with the current DataFrame data
-            write_to_google_sheets(self.applications_df)
-            print("Data synced to Google Sheets successfully.")
-        except Exception as e:
-            print(f"Error syncing data to Google Sheets: {e}")
-            # Log the error but do not disable Google Sync
-            logging.error(f"Error syncing data to Google Sheets: {e}")
+        self.request_sync()
+
+    def push_to_google_sheets(self):
+        """
+        Queues a sync of the current DataFrame on the sync worker if Google Sync is enabled.
+        Syncs queued while an earlier one is still waiting replace it, so only the latest data is sent.
+        """
+        if self.applications_loading:
+            return  # Never push a partially loaded table
+        if not self.sync_to_google:
+            print("Google Sync is disabled. Changes were not synced to Google Sheets.")
+            return
+        self.sync_outbox.record_edit()
+        self.sync_scheduler.record_edit()
+
+        # Edits in quick succession go out as one sync
+        if self.push_batch_task is None:
+            self.push_batch_task = self.after(PUSH_BATCH_MS, self.flush_push_batch)
+        self.sync_status_var.set("Syncing...")
+
+    def flush_push_batch(self):
+        """Syncs the edits collected during the push batching window."""
+        self.push_batch_task = None
+        if self.sync_to_google and not self.applications_loading:
+            self.request_sync()
+
+    def data_version(self):
+        """Identifies the current state of applications_df; it changes with every modification."""
+        return id(self.search_index), self.search_index.version
+
+    def request_sync(self):
+        """Queues a three-way merge of the current data with Google Sheets, unless a retry is pending."""
+        if self.sync_outbox.backing_off():
+            # The scheduled retry sends these changes too, in the same batch
+            self.update_sync_status()
+            return
+        if self.push_batch_task is not None:
+            self.after_cancel(self.push_batch_task)
+            self.push_batch_task = None
+        self.sync_scheduler.record_poll()
+        self.sync_worker.submit(SyncSnapshot(self.applications_df.copy(), self.data_version()))
+        self.watch_sync_worker()
+
+    def retry_sync(self):
+        """Retries a failed sync once its backoff delay has passed."""
+        self.sync_retry_task = None
+        if self.sync_to_google and self.applications_ready():
+            self.request_sync()
+
+    def schedule_sync_retry(self, error):
+        """Records a failed sync and schedules a retry with exponential backoff."""
+        delay = self.sync_outbox.record_failure(error)
+        self.sync_scheduler.record_failure()
+        if error_status(error) == 429:
+            self.sync_budget.drain()  # Out of quota: hold back further requests too
+        if self.sync_retry_task is not None:
+            self.after_cancel(self.sync_retry_task)
+        self.sync_retry_task = self.after(int(delay * 1000), self.retry_sync)
+        print(f"Retrying the Google Sheets sync in {delay:.0f} seconds "
+              f"({self.sync_outbox.edits} local changes pending).")
+
+    def update_sync_status(self):
+        """Shows the last sync outcome, or the pending changes while retries back off."""
+        if not self.sync_to_google:
+            self.sync_status_var.set("Sync off")
+        elif self.sync_outbox.backing_off():
+            self.sync_status_var.set(f"Offline, {self.sync_outbox.edits} pending")
+        else:
+            self.sync_status_var.set(self.last_sync_status)
+
+    def apply_sync_result(self, result):
+        """
+        Applies the merged changes from a sync to the local data. A result computed before a
+        later local edit is dropped and another sync is queued, which merges that edit too.
+        """
+        if result.version != self.data_version() or self.applications_loading:
+            print("Local data changed during the sync; syncing again.")
+            self.request_sync()
+            return False
+
+        delta = result.local_delta
+        if result.remote_changed:
+            print(f"Merged changes from Google Sheets: {len(delta.inserts) + len(delta.appends)} added, "
+                  f"{len(delta.updates)} updated, {sum(stop - start for start, stop in delta.delete_ranges)} deleted.")
+            if delta.inserts:
+                # Rows arrived between existing ones; positions shift, so replace everything
+                import pandas as pd
+                self.applications_df = pd.DataFrame([list(row) for row in result.merged], columns=list(result.columns))
+                self.search_index.build(self.applications_df)
+                self.application_store.replace_all(self.applications_df)
+            else:
+                self.apply_sync_delta(delta)
+            self.schedule_compaction()
+
+            self.refresh_treeview()
+
+        self.sync_engine.commit(result._replace(version=self.data_version()))
+        return True
+
+    def apply_sync_delta(self, delta):
+        """Applies deleted rows, changed cells and rows added at the end, without interior inserts."""
+        import pandas as pd
+        from src.utils.row_fingerprint import normalize_cell
+
+        if delta.delete_ranges:
+            row_indices = sorted((row for start, stop in delta.delete_ranges for row in range(start, stop)), reverse=True)
+            self.applications_df = self.applications_df.drop(row_indices).reset_index(drop=True)
+            self.search_index.delete_rows(row_indices)
+            self.application_store.delete_rows(self.applications_df, row_indices)
+
+        columns = list(self.applications_df.columns)
+        for row, first_column, values in delta.updates:
+            for column, new_value in zip(columns[first_column:], values):
+                # Values come back normalized, so leave cells that only differ in type alone
+                if normalize_cell(self.applications_df.at[row, column]) != new_value:
+                    self.applications_df.at[row, column] = new_value
+                    self.application_store.update_cell(self.applications_df, row, column)
+            self.search_index.update_row(self.applications_df, row)
+
+        if delta.appends:
+            new_rows = pd.DataFrame(delta.appends, columns=columns)
+            start = len(self.applications_df)
+            self.applications_df = pd.concat([self.applications_df, new_rows], ignore_index=True)
+            self.search_index.add_rows(self.applications_df, range(start, len(self.applications_df)))
+            self.application_store.append_rows(self.applications_df, len(new_rows))
+
+    def report_sync_progress(self, done, total, action):
+        """Called from the chunk threads; the Tk thread shows it on its next poll."""
+        self.sync_progress = (done, total, action)
+
+    def watch_sync_worker(self):
+        """Shows that a sync is in progress and polls the sync worker until it is idle."""
+        self.sync_status_var.set("Syncing...")
+        if self.sync_poll_task is None:
+            self.sync_poll_task = self.after(SYNC_POLL_MS, self.poll_sync_results)
+
+    def poll_sync_results(self):
+        """Handles finished sync cycles on the Tk thread."""
+        self.sync_poll_task = None
+        while True:
+            try:
+                error, result = self.sync_worker.results.get_nowait()
+            except queue.Empty:
+                break
+
+            if error is not None:
+                print(f"Error syncing data with Google Sheets: {error}")
+                # Log the error but do not disable Google Sync; the changes stay pending and are retried
+                logging.error(f"Error syncing data with Google Sheets: {error}")
+                self.last_sync_status = "Sync failed"
+                self.schedule_sync_retry(error)
+                continue
+
+            try:
+                self.sync_scheduler.record_result(result.remote_changed)
+                if self.apply_sync_result(result):
+                    self.sync_outbox.record_success()
+                    self.last_sync_status = f"Synced {datetime.now().strftime('%H:%M')}"
+            except Exception as e:
+                print(f"Error applying changes from Google Sheets: {e}")
+                logging.error(f"Error applying changes from Google Sheets: {e}")
+                self.last_sync_status = "Sync failed"
+
+        if self.sync_worker.busy:
+            progress = self.sync_progress
+            if progress is not None and progress[0] < progress[1]:
+                self.sync_status_var.set(f"{progress[2]} {progress[0]}/{progress[1]}...")
+            self.sync_poll_task = self.after(SYNC_POLL_MS, self.poll_sync_results)
+        else:
+            self.sync_progress = None
+            self.update_sync_status()
 
     def schedule_sync(self):
-        """Schedules periodic syncing from Google Sheets every 60 seconds."""
+        """
+        Polls Google Sheets when a poll is due and schedules the next one. The interval
+        adapts to how often the sheet changes and whether the window is focused.
+        """
+        if self.sync_task is not None:
+            self.after_cancel(self.sync_task)
+            self.sync_task = None
+
+        if self.sync_scheduler.poll_delay() <= 0 or self.sync_scheduler.last_poll is None:
+            if self.sync_to_google:
+                # Perform synchronization with Google Sheets
+                self.sync_from_google_sheets()
+            else:
+                print("Google Sync is disabled. Skipping sync from Google Sheets.")
+            self.sync_scheduler.record_poll()
+
         # Schedule the next sync and store the task ID
-        self.sync_task = self.after(60000, self.schedule_sync)
+        self.sync_task = self.after(int(self.sync_scheduler.poll_delay() * 1000) + 1, self.schedule_sync)
 
-        if self.sync_to_google:
-            # Perform synchronization with Google Sheets
-            self.sync_from_google_sheets()
-        else:
-            print("Google Sync is disabled. Skipping sync from Google Sheets.")
+    def on_focus_change(self, event=None):
+        """Tracks whether the window is in the foreground and reschedules the next poll when that changes."""
+        # Focus moving between widgets fires FocusOut then FocusIn, so check once it has settled
+        self.after_idle(self.update_window_focus)
+
+    def update_window_focus(self):
+        try:
+            focused = self.focus_displayof() is not None
+        except (KeyError, tk.TclError):
+            focused = True  # Focus is on a widget Tk cannot name, e.g. a combobox dropdown
+        if self.sync_scheduler.set_focused(focused):
+            self.schedule_sync()
 
     def save_application(self):
         """
         Captures Data from input fields, validates it, and saves it as a new application entry.
         Updates both the local DataFrame and Google Sheets, then refreshes the Treeview.
         """
+        if not self.applications_ready():
+            messagebox.showinfo("Please wait", "Applications are still loading.")
+            return
+
         # Retrieve input Data and clean up extra spaces
         position = self.position_entry.get().strip()
         company = self.company_entry.get().strip()
@@ -714,6 +1060,8 @@ class AppTrackPro(TkinterDnD.Tk):  # Inherit from TkinterDnD.Tk for drag-and-dro
             messagebox.showerror("Error", "Company and Position are required fields.")
             return  # Stop if required fields are missing
 
+        import pandas as pd
+
         # Ensure DataFrame has the correct columns if it's empty
         if self.applications_df.empty:
             self.applications_df = pd.DataFrame(
@@ -730,25 +1078,18 @@ class AppTrackPro(TkinterDnD.Tk):  # Inherit from TkinterDnD.Tk for drag-and-dro
 
         # Append the new Data to the applications DataFrame
         self.applications_df = pd.concat([self.applications_df, new_data], ignore_index=True)
+        self.search_index.add_rows(self.applications_df, [len(self.applications_df) - 1])
 
-        # Save the updated DataFrame to the local Excel file
-        save_applications_to_excel(self.applications_df)
-        print("Data saved locally to Excel.")
+        # Save the new row to local storage
+        self.application_store.append_rows(self.applications_df, 1)
+        self.schedule_compaction()
+        print("Data saved to local storage.")
 
         # Sync updated Data to Google Sheets only if sync is enabled
-        if self.sync_to_google:
-            try:
-                write_to_google_sheets(self.applications_df)
-                print("Data synced to Google Sheets.")
-            except FileNotFoundError as e:
-                print(f"Google Sheets sync failed: {e}")
-                messagebox.showerror("Error", f"Google Sheets sync failed: {e}")
-            except Exception as e:
-                print(f"[ERROR] Unexpected error during Google Sheets sync: {e}")
-                messagebox.showerror("Error", f"Google Sheets sync failed: {e}")
+        self.push_to_google_sheets()
 
         # Refresh the Treeview to display the new application
-        self.populate_treeview(self.applications_df)
+        self.refresh_treeview()
 
         # Clear the input fields after saving
         self.clear_input_fields()
@@ -762,28 +1103,35 @@ class AppTrackPro(TkinterDnD.Tk):  # Inherit from TkinterDnD.Tk for drag-and-dro
         self.url_entry.delete(0, tk.END)
 
     # Search and Filter
-    def perform_search(self):
+    def perform_search(self, keep_offset=False):
         """
-        Filters the Treeview to display only rows containing the search term.
+        Filters the Treeview to display only rows matching the search query.
+        Plain text matches rows containing it; field terms such as
+        `status:Interview company:acme applied>=2024-06-01 -status:Rejected` are also supported.
         If no search term is entered, all rows are displayed.
         """
+        if self.applications_loading:
+            return  # Applied once loading finishes
+
         # Retrieve and clean the search term (convert to lowercase for case-insensitive matching)
         search_term = self.search_var.get().strip().lower()
 
         # If the search term is empty, display all rows
         if not search_term:
-            self.populate_treeview(self.applications_df)
+            self.populate_treeview(self.applications_df, keep_offset=keep_offset)
             return
 
-        # Filter the DataFrame: retain rows that contain the search term in any column
-        filtered_df = self.applications_df[
-            self.applications_df.apply(
-                lambda row: search_term in row.astype(str).str.lower().to_string(), axis=1
-            )
-        ]
+        # Look up the matching rows; keep the current results while a query is half-typed
+        if self.query_engine is None:
+            from src.utils.search_query import QueryEngine
+            self.query_engine = QueryEngine()
+        positions = self.query_engine.search(self.applications_df, self.search_index, search_term)
+        if positions is None:
+            return
+        filtered_df = self.applications_df.iloc[positions]
 
         # Refresh the Treeview to show only the rows in the filtered DataFrame
-        self.populate_treeview(filtered_df)
+        self.populate_treeview(filtered_df, keep_offset=keep_offset)
 
     # Context Menu and Cell Interaction
     def show_context_menu(self, event):
@@ -796,8 +1144,8 @@ class AppTrackPro(TkinterDnD.Tk):  # Inherit from TkinterDnD.Tk for drag-and-dro
         column_id = self.applications_tree.identify_column(event.x)
         col_index = int(column_id[1:]) - 1  # Convert to zero-based index
 
-        # Get all selected rows
-        selected_rows = self.applications_tree.selection()
+        # Get all selected rows, including those scrolled out of view
+        selected_rows = self.applications_view.selection()
 
         # Only show the context menu if a row is clicked
         if not row_id:
@@ -843,6 +1191,8 @@ class AppTrackPro(TkinterDnD.Tk):  # Inherit from TkinterDnD.Tk for drag-and-dro
         if not row_ids:
             print("No rows selected for deletion.")
             return
+        if not self.applications_ready():
+            return
 
         # Convert row_ids to integers and sort them in descending order to prevent index shifting
         row_indices = sorted([int(row_id) for row_id in row_ids], reverse=True)
@@ -857,24 +1207,19 @@ class AppTrackPro(TkinterDnD.Tk):  # Inherit from TkinterDnD.Tk for drag-and-dro
 
         # Reset the DataFrame index after deletions
         self.applications_df.reset_index(drop=True, inplace=True)
+        self.search_index.delete_rows(row_indices)
 
-        # Update the Treeview
-        self.populate_treeview(self.applications_df)
+        # Update the Treeview; the rows below the deleted ones shift up, so drop the old selection
+        self.applications_view.clear_selection()
+        self.refresh_treeview()
 
         # Sync with Google Sheets if enabled
-        if self.sync_to_google:
-            try:
-                # Update Google Sheets with the current DataFrame data
-                write_to_google_sheets(self.applications_df)
-                print("Data synced to Google Sheets after deletion.")
-            except Exception as e:
-                print(f"Error syncing data to Google Sheets: {e}")
-        else:
-            print("Google Sync is disabled. Changes were not synced to Google Sheets.")
+        self.push_to_google_sheets()
 
-        # Save the updated DataFrame to Excel
-        save_applications_to_excel(self.applications_df)
-        print("Data saved locally to Excel after deletion.")
+        # Remove the deleted rows from local storage
+        self.application_store.delete_rows(self.applications_df, row_indices)
+        self.schedule_compaction()
+        print("Data saved to local storage after deletion.")
 
     def edit_cell(self, row_id, col_index, column_name):
         """
@@ -886,7 +1231,7 @@ class AppTrackPro(TkinterDnD.Tk):  # Inherit from TkinterDnD.Tk for drag-and-dro
 
         # Retrieve the cell coordinates and current value
         x, y, width, height = self.applications_tree.bbox(row_id, column="#" + str(col_index + 1))
-        current_value = self.applications_tree.item(row_id, "values")[col_index]
+        current_value = self.applications_view.row_values(row_id)[col_index]
 
         # Create an Entry widget for editing
         self.edit_entry = tk.Entry(self.applications_tree, width=width)
@@ -907,7 +1252,7 @@ class AppTrackPro(TkinterDnD.Tk):  # Inherit from TkinterDnD.Tk for drag-and-dro
         - col_index (int): Index of the 'Status' column.
         """
         status_options = ["Submitted", "Rejected", "Interview", "Offer"]
-        current_status = self.applications_tree.item(item_id, "values")[col_index]
+        current_status = self.applications_view.row_values(item_id)[col_index]
 
         # Create a dropdown menu (Combobox) with status options
         self.status_combobox = ttk.Combobox(self.applications_tree, values=status_options, state="readonly")
@@ -928,36 +1273,31 @@ class AppTrackPro(TkinterDnD.Tk):  # Inherit from TkinterDnD.Tk for drag-and-dro
         """
         Saves the selected status from the dropdown to the Treeview, DataFrame, and Google Sheets.
         """
+        if not self.applications_ready():
+            return
+
         # Retrieve the new status from the dropdown menu
         new_status = self.status_combobox.get()
-        values = list(self.applications_tree.item(item_id, "values"))
-        values[col_index] = new_status
-        self.applications_tree.item(item_id, values=values)
 
-        # Update the DataFrame with the new status
+        # Update the DataFrame and the Treeview with the new status
         column_name = self.applications_tree["columns"][col_index]
         self.applications_df.at[int(item_id), column_name] = new_status
+        self.search_index.update_row(self.applications_df, int(item_id))
+        self.refresh_treeview()
 
         # Save changes to the Excel file locally
         try:
-            save_applications_to_excel(self.applications_df, DATA_FILE_PATH)
-            print(f"Status '{new_status}' saved for row {item_id} in Excel.")
+            self.application_store.update_cell(self.applications_df, int(item_id), column_name)
+            self.schedule_compaction()
+            print(f"Status '{new_status}' saved for row {item_id} in local storage.")
         except Exception as e:
-            print(f"Error: Could not save to the Excel file. {str(e)}")
+            print(f"Error: Could not save to local storage. {str(e)}")
 
         # Conditionally sync the updated status to Google Sheets if sync is enabled
-        if self.sync_to_google:
-            try:
-                write_to_google_sheets(self.applications_df)
-                print(f"Status '{new_status}' synced with Google Sheets for row {item_id}.")
-            except Exception as e:
-                print(f"Error: Could not sync with Google Sheets. {str(e)}")
-        else:
-            print("Google Sync is disabled. Changes were not synced to Google Sheets.")
+        self.push_to_google_sheets()
 
-        # Destroy the dropdown after saving
-        self.status_combobox.destroy()
-        self.status_combobox = None
+        # Destroy the dropdown after saving (the refresh may already have removed it)
+        self.close_cell_editors()
 
     # Personal Info
     def save_personal_info(self):
@@ -993,59 +1333,88 @@ class AppTrackPro(TkinterDnD.Tk):  # Inherit from TkinterDnD.Tk for drag-and-dro
         self.iconify()
 
     def on_close(self):
+        """Flushes pending local storage writes and Google Sheets pushes before closing the window."""
+        if self.compaction_task is not None:
+            self.after_cancel(self.compaction_task)
+        if self.sync_poll_task is not None:
+            self.after_cancel(self.sync_poll_task)
+        if self.sync_retry_task is not None:
+            self.after_cancel(self.sync_retry_task)
+        if self.sync_task is not None:
+            self.after_cancel(self.sync_task)
+        if self.push_batch_task is not None:
+            # Send the edits still waiting in the batching window before the worker stops
+            self.after_cancel(self.push_batch_task)
+            self.push_batch_task = None
+            if self.sync_to_google and not self.sync_outbox.backing_off():
+                self.sync_worker.submit(SyncSnapshot(self.applications_df.copy(), self.data_version()))
+        pending = self.sync_outbox.pending
+        if not pending:
+            # Nothing local to push: stop the worker's poll. Backends with cancels_requests (asyncio)
+            # abort a request in flight; the httplib2 one only refuses the next one.
+            self.sheets_backend.close()
+        # The worker is a daemon thread, so a request hung past this wait dies with the process
+        self.sync_worker.close(timeout=SYNC_CLOSE_SECONDS)
+        if pending:
+            self.sheets_backend.close()
+        self.sync_engine.close()
+        self.sync_outbox.close()
+        config.close()  # Writes settings changed within the last second
+        if self.sync_outbox.pending and self.sync_to_google:
+            print(f"{self.sync_outbox.edits} local changes will be synced to Google Sheets on the next start.")
+        print(f"Google Sync stats: {self.sync_worker.stats()}, {self.sync_engine.stats()}")
+        if self.application_store:
+            self.application_store.close(timeout=30)
+            stats = self.application_store.stats()
+            print(f"Local storage stats: {stats}")
+            logging.info(f"Local storage stats: {stats}")
         self.destroy()
 
     def create_custom_menu_bar(self):
         """Create a custom menu bar with theme-aware styling."""
         # Main menu bar frame
-        self.menu_bar = tk.Frame(self, bg=self.menu_bg_color, height=25)
+        self.menu_bar = self.theme.register(tk.Frame(self, height=25), "menu_bar")
         self.menu_bar.pack(side='top', fill='x')
 
         # Settings button
-        self.settings_button = tk.Menubutton(
+        self.settings_button = self.theme.register(tk.Menubutton(
             self.menu_bar,
             text='⚙️',
-            bg=self.menu_bg_color,
-            fg=self.menu_fg_color,
-            activebackground=self.menu_active_bg,
-            activeforeground=self.menu_fg_color,
             relief='flat',
             padx=10
-        )
+        ), "menu")
         self.settings_button.pack(side='left')
 
-        # Settings menu with 'Configuration' and 'Toggle Theme'
-        self.settings_menu = tk.Menu(
-            self.settings_button,
-            tearoff=0,
-            bg=self.menu_bg_color,
-            fg=self.menu_fg_color,
-            activebackground=self.menu_active_bg,
-            activeforeground=self.menu_fg_color
-        )
+        # Settings menu with 'Configuration' and 'Toggle Theme'; its entries use the menu's colors
+        self.settings_menu = self.theme.register(tk.Menu(self.settings_button, tearoff=0), "menu")
         self.settings_menu.add_command(label="Applications File", command=self.open_applications_config_dialog)
+        self.settings_menu.add_command(label="Export to Excel", command=self.export_applications)
         self.settings_menu.add_command(label="Google Sync", command=self.open_settings_dialog)
         self.settings_menu.add_command(label='Switch Theme', command=self.toggle_theme)
         self.settings_button.config(menu=self.settings_menu)
 
         # Google Sync Toggle Checkbutton next to the settings button
         self.google_sync_var = tk.BooleanVar(value=self.sync_to_google)
-        self.google_sync_checkbutton = tk.Checkbutton(
+        self.google_sync_checkbutton = self.theme.register(tk.Checkbutton(
             self.menu_bar,
             text="Enable Google Sync",
             variable=self.google_sync_var,
             command=self.toggle_sync,
-            bg=self.menu_bg_color,
-            fg=self.menu_fg_color,
-            activebackground=self.menu_active_bg,
-            activeforeground=self.menu_fg_color,
             indicatoron=True,
-            selectcolor=self.menu_active_bg,
             relief="flat",
             padx=10
-        )
+        ), "menu_check")
         self.google_sync_checkbutton.pack(side='left')
 
+        # Sync state reported by the background sync worker
+        self.sync_status_var = tk.StringVar(value=self.last_sync_status if self.sync_to_google else "Sync off")
+        self.sync_status_label = self.theme.register(tk.Label(
+            self.menu_bar,
+            textvariable=self.sync_status_var,
+            padx=10
+        ), "menu_label")
+        self.sync_status_label.pack(side='left')
+
     def toggle_settings_menu(self, event=None):
         """Toggle the visibility of the settings menu."""
         if self.menu_visible:
@@ -1061,7 +1430,7 @@ class AppTrackPro(TkinterDnD.Tk):  # Inherit from TkinterDnD.Tk for drag-and-dro
         print(f"Sync to Google Sheets: {'Enabled' if self.sync_to_google else 'Disabled'}")
 
         # Update configuration
-        self.update_config(ENABLE_GOOGLE_SYNC=self.sync_to_google, theme="Dark" if self.is_dark_mode else "Light")
+        config.set(ENABLE_GOOGLE_SYNC=self.sync_to_google)
 
         # Cancel any existing scheduled sync
         if self.sync_task is not None:
@@ -1073,196 +1442,27 @@ class AppTrackPro(TkinterDnD.Tk):  # Inherit from TkinterDnD.Tk for drag-and-dro
 
         # If enabling sync, perform an immediate sync
         if self.sync_to_google:
+            self.sync_outbox.clear_backoff()
             self.sync_to_google_sheets()
         else:
             print("Google Sync is disabled. Skipping initial sync.")
+            if not self.sync_worker.busy:
+                self.sync_status_var.set("Sync off")
 
     def apply_theme(self):
-        """Apply the selected theme and update the menu bar."""
-        if self.is_dark_mode:
-            self.set_dark_mode()
-        else:
-            self.set_light_mode()
-
-        # Update all widgets with the new theme
-        self.update_all_widgets_theme(self)
-        # Update the menu bar specifically
-        self.update_menu_bar_theme()
-
-    def set_dark_mode(self):
-        self.bg_color = "#2E2E2E"
-        self.fg_color = "#FFFFFF"
-        self.entry_bg_color = "#3A3A3A"
-        self.entry_fg_color = "#FFFFFF"
-        self.button_bg_color = "#3E3E3E"
-        self.menu_bg_color = "#3E3E3E"
-        self.menu_fg_color = "#FFFFFF"
-        self.menu_active_bg = "#5E5E5E"
-
-        style = ttk.Style()
-        style.theme_use("alt")  # Use 'alt' theme for better customization
-
-        # Configure styles for ttk widgets
-        style.configure("TLabel", background=self.bg_color, foreground=self.fg_color)
-        style.configure("TFrame", background=self.bg_color)
-        style.configure("TButton", background=self.button_bg_color, foreground=self.fg_color)
-        style.configure("TEntry", fieldbackground=self.entry_bg_color, foreground=self.entry_fg_color)
-        style.configure("Treeview", background=self.entry_bg_color, foreground=self.entry_fg_color,
-                        fieldbackground=self.entry_bg_color)
-        style.map('Treeview', background=[('selected', '#6A6A6A')], foreground=[('selected', '#FFFFFF')])
-        style.configure("Treeview.Heading", background=self.button_bg_color, foreground=self.fg_color)
-        style.configure("TNotebook", background=self.bg_color)
-        style.configure("TNotebook.Tab", background=self.bg_color, foreground=self.fg_color)
-        style.map("TNotebook.Tab", background=[('selected', self.entry_bg_color)])
-        style.configure("TFrame", background=self.bg_color)
-        style.configure("TCombobox", fieldbackground=self.entry_bg_color, background=self.entry_bg_color,
-                        foreground=self.entry_fg_color)
-        style.map('TCombobox', fieldbackground=[('readonly', self.entry_bg_color)],
-                  background=[('readonly', self.entry_bg_color)],
-                  foreground=[('readonly', self.entry_fg_color)])
-
-        # Custom style for Save buttons
-        style.configure(
-            "Custom.TButton",
-            background=self.button_bg_color,
-            foreground=self.fg_color,
-            borderwidth=1,
-            focusthickness=3,
-            focuscolor='none',
-            font=('TkDefaultFont', 12),
-            padding=(10, 5)
-        )
-        style.map(
-            "Custom.TButton",
-            background=[('active', self.menu_active_bg)],
-            foreground=[('active', self.fg_color)]
-        )
-
-    def set_light_mode(self):
-        self.bg_color = "#F0F0F0"
-        self.fg_color = "#000000"
-        self.entry_bg_color = "#FFFFFF"
-        self.entry_fg_color = "#000000"
-        self.button_bg_color = "#E0E0E0"
-        self.menu_bg_color = "#E0E0E0"
-        self.menu_fg_color = "#000000"
-        self.menu_active_bg = "#C0C0C0"
-
-        style = ttk.Style()
-        style.theme_use("alt")  # Use 'alt' theme for better customization
-
-        # Configure styles for ttk widgets
-        style.configure("TLabel", background=self.bg_color, foreground=self.fg_color)
-        style.configure("TFrame", background=self.bg_color)
-        style.configure("TButton", background=self.button_bg_color, foreground=self.fg_color)
-        style.configure("TEntry", fieldbackground=self.entry_bg_color, foreground=self.entry_fg_color)
-        style.configure("Treeview", background=self.entry_bg_color, foreground=self.entry_fg_color,
-                        fieldbackground=self.entry_bg_color)
-        style.map('Treeview', background=[('selected', '#D9D9D9')], foreground=[('selected', '#000000')])
-        style.configure("Treeview.Heading", background=self.button_bg_color, foreground=self.fg_color)
-        style.configure("TNotebook", background=self.bg_color)
-        style.configure("TNotebook.Tab", background=self.bg_color, foreground=self.fg_color)
-        style.map("TNotebook.Tab", background=[('selected', self.entry_bg_color)])
-        style.configure("TFrame", background=self.bg_color)
-        style.configure("TCombobox", fieldbackground=self.entry_bg_color, background=self.entry_bg_color,
-                        foreground=self.entry_fg_color)
-        style.map('TCombobox', fieldbackground=[('readonly', self.entry_bg_color)],
-                  background=[('readonly', self.entry_bg_color)],
-                  foreground=[('readonly', self.entry_fg_color)])
-
-        # Custom style for Save buttons
-        style.configure(
-            "Custom.TButton",
-            background=self.button_bg_color,
-            foreground=self.fg_color,
-            borderwidth=1,
-            focusthickness=3,
-            focuscolor='none',
-            font=('TkDefaultFont', 12),
-            padding=(10, 5)
-        )
-        style.map(
-            "Custom.TButton",
-            background=[('active', self.menu_active_bg)],
-            foreground=[('active', self.fg_color)]
-        )
-
-    def update_all_widgets_theme(self, widget):
-        """Recursively update the theme for all widgets."""
-        for child in widget.winfo_children():
-            # Check if the widget is a ttk widget
-            if isinstance(child, ttk.Widget):
-                pass  # Skip ttk widgets; they're styled via ttk.Style
-            else:
-                # Get the list of options the widget supports
-                options = child.keys()
-                # Set 'bg' or 'background' if supported
-                if 'bg' in options or 'background' in options:
-                    child.config(bg=self.bg_color)
-                # Set 'fg' or 'foreground' if supported
-                if 'fg' in options or 'foreground' in options:
-                    child.config(fg=self.fg_color)
-
-                # Specific adjustments for certain widget types
-                if isinstance(child, tk.Entry):
-                    if 'bg' in options or 'background' in options:
-                        child.config(bg=self.entry_bg_color)
-                    if 'fg' in options or 'foreground' in options:
-                        child.config(fg=self.entry_fg_color)
-                elif isinstance(child, tk.Button):
-                    if 'activebackground' in options:
-                        child.config(activebackground=self.button_bg_color)
-                    if 'activeforeground' in options:
-                        child.config(activeforeground=self.fg_color)
-                elif isinstance(child, tk.Text):
-                    if 'bg' in options or 'background' in options:
-                        child.config(bg=self.entry_bg_color)
-                    if 'fg' in options or 'foreground' in options:
-                        child.config(fg=self.entry_fg_color)
-                # For frames and toplevels, only set 'bg'
-                elif isinstance(child, (tk.Frame, tk.Toplevel)):
-                    if 'bg' in options or 'background' in options:
-                        child.config(bg=self.bg_color)
-            # Recursively update child widgets
-            self.update_all_widgets_theme(child)
-
-    def update_menu_bar_theme(self):
-        """Update theme for the menu bar components (Settings and Google Sync Checkbutton)."""
-        # Update menu bar background color
-        self.menu_bar.config(bg=self.menu_bg_color)
-
-        # Update Settings button
-        self.settings_button.config(
-            bg=self.menu_bg_color,
-            fg=self.menu_fg_color,
-            activebackground=self.menu_active_bg,
-            activeforeground=self.menu_fg_color
-        )
-
-        # Update Settings menu items to match theme
-        self.settings_menu.config(
-            bg=self.menu_bg_color,
-            fg=self.menu_fg_color,
-            activebackground=self.menu_active_bg,
-            activeforeground=self.menu_fg_color
-        )
-        for index in range(self.settings_menu.index('end') + 1):
-            self.settings_menu.entryconfig(
-                index,
-                background=self.menu_bg_color,
-                foreground=self.menu_fg_color,
-                activebackground=self.menu_active_bg,
-                activeforeground=self.menu_fg_color
-            )
-
-        # Update Google Sync Checkbutton
-        self.google_sync_checkbutton.config(
-            bg=self.menu_bg_color,
-            fg=self.menu_fg_color,
-            activebackground=self.menu_active_bg,
-            activeforeground=self.menu_fg_color,
-            selectcolor=self.menu_active_bg  # Match checkbox color with theme
-        )
+        """Apply the selected theme; see ThemeRegistry."""
+        self.theme.use("Dark" if self.is_dark_mode else "Light")
+
+        # Colors for widgets that set their own, such as the settings dialogs
+        palette = self.theme.palette
+        self.bg_color = palette["bg"]
+        self.fg_color = palette["fg"]
+        self.entry_bg_color = palette["entry_bg"]
+        self.entry_fg_color = palette["entry_fg"]
+        self.button_bg_color = palette["button_bg"]
+        self.menu_bg_color = palette["menu_bg"]
+        self.menu_fg_color = palette["menu_fg"]
+        self.menu_active_bg = palette["menu_active_bg"]
 
     def toggle_theme(self):
         """Toggle between Dark and Light themes and save to app_config.json in AppData."""
@@ -1270,8 +1470,7 @@ class AppTrackPro(TkinterDnD.Tk):  # Inherit from TkinterDnD.Tk for drag-and-dro
         theme = "Dark" if self.is_dark_mode else "Light"
         self.apply_theme()
 
-        # Call save_theme from settings_manager to save the theme to the AppData config
-        save_theme(theme)  # This function now manages saving only in AppData
+        config.set(theme=theme)
 
     def bind_events_to_children(self, parent_widget, click_handler, drop_handler=None):
         """
@@ -1304,12 +1503,18 @@ class AppTrackPro(TkinterDnD.Tk):  # Inherit from TkinterDnD.Tk for drag-and-dro
         """Prompt user to select Applications.xlsx, and copy it to AppData."""
         file_path = filedialog.askopenfilename(title="Select Applications.xlsx", filetypes=[("Excel files", "*.xlsx")])
         if file_path:
-            try:
-                shutil.copy(file_path, DATA_FILE_PATH)
-                self.app_file_path_var.set(DATA_FILE_PATH)
-                print(f"[DEBUG] Applications.xlsx copied to {DATA_FILE_PATH}")
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to copy Applications.xlsx: {e}")
+            self.replace_applications_file(file_path)
+
+    def replace_applications_file(self, file_path):
+        """Copies `file_path` over the applications workbook and shows its contents."""
+        if not self.applications_ready():
+            return
+        try:
+            self.reopen_application_store(replaced_file=file_path)
+            self.app_file_path_var.set(self.DATA_FILE_PATH)
+            print(f"[DEBUG] Applications.xlsx copied to {self.DATA_FILE_PATH}")
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to copy Applications.xlsx: {e}")
 
     def select_service_account_file(self, event=None):
         """Prompt user to select Service Account JSON, and copy it to AppData."""
@@ -1318,6 +1523,7 @@ class AppTrackPro(TkinterDnD.Tk):  # Inherit from TkinterDnD.Tk for drag-and-dro
         if file_path:
             try:
                 shutil.copy(file_path, SERVICE_ACCOUNT_FILE)
+                sheets_client.invalidate()  # Authenticate with the new key on the next sync
                 self.service_account_file_path_var.set(SERVICE_ACCOUNT_FILE)
                 print(f"[DEBUG] Service Account JSON copied to {SERVICE_ACCOUNT_FILE}")
             except Exception as e:
@@ -1334,6 +1540,7 @@ class AppTrackPro(TkinterDnD.Tk):  # Inherit from TkinterDnD.Tk for drag-and-dro
             if file_path.lower().endswith('.json'):
                 try:
                     shutil.copy(file_path, SERVICE_ACCOUNT_FILE)
+                    sheets_client.invalidate()  # Authenticate with the new key on the next sync
                     self.service_account_file_path_var.set(SERVICE_ACCOUNT_FILE)
                     print(f"[DEBUG] Service Account JSON copied to {SERVICE_ACCOUNT_FILE}")
                 except Exception as e:
@@ -1350,17 +1557,13 @@ class AppTrackPro(TkinterDnD.Tk):  # Inherit from TkinterDnD.Tk for drag-and-dro
             file_path = file_list[0]
             # Validate the file type
             if file_path.lower().endswith('.xlsx'):
-                try:
-                    shutil.copy(file_path, DATA_FILE_PATH)
-                    self.app_file_path_var.set(DATA_FILE_PATH)
-                    print(f"[DEBUG] Applications.xlsx copied to {DATA_FILE_PATH}")
-                except Exception as e:
-                    messagebox.showerror("Error", f"Failed to copy Applications.xlsx: {e}")
+                self.replace_applications_file(file_path)
             else:
                 messagebox.showerror("Invalid File", "Please drop a valid Excel (.xlsx) file.")
 
     def open_settings_dialog(self):
         """Open a dialog to configure the Service Account JSON and Spreadsheet ID."""
+        self.load_assets()
         dialog = tk.Toplevel(self)
         dialog.title("Google Sync Configuration")
         dialog.geometry("600x300")  # Adjusted size for larger content
@@ -1506,6 +1709,7 @@ class AppTrackPro(TkinterDnD.Tk):  # Inherit from TkinterDnD.Tk for drag-and-dro
 
     def open_applications_config_dialog(self):
         """Open a dialog to configure the Applications.xlsx file."""
+        self.load_assets()
         dialog = tk.Toplevel(self)
         dialog.title("Applications File Configuration")
         dialog.geometry("600x200")  # Adjusted size for content
@@ -1600,15 +1804,9 @@ class AppTrackPro(TkinterDnD.Tk):  # Inherit from TkinterDnD.Tk for drag-and-dro
             messagebox.showerror("Error", "Spreadsheet ID cannot be empty.")
             return
 
-        # Update configuration (Assuming you have a method or mechanism to handle configurations)
         try:
-            # Example: Update a configuration dictionary or write to a config file
-            config = {
-                "SERVICE_ACCOUNT_FILE": service_account_path,
-                "SPREADSHEET_ID": spreadsheet_id
-            }
-            with open('config.json', 'w') as config_file:
-                json.dump(config, config_file, indent=4)
+            # sheets_client follows SERVICE_ACCOUNT_FILE; apply_config_changes switches the spreadsheet
+            config.set(SERVICE_ACCOUNT_FILE=service_account_path, SPREADSHEET_ID=spreadsheet_id.strip())
             print("[DEBUG] Settings saved successfully.")
             messagebox.showinfo("Success", "Settings have been saved successfully.")
             dialog.destroy()
@@ -1625,149 +1823,137 @@ class AppTrackPro(TkinterDnD.Tk):  # Inherit from TkinterDnD.Tk for drag-and-dro
             messagebox.showerror("Error", "Applications.xlsx file does not exist.")
             return
 
-        # Update configuration (Assuming you have a method or mechanism to handle configurations)
         try:
-            # Example: Update a configuration dictionary or write to a config file
-            config = {
-                "DATA_FILE_PATH": applications_path
-            }
-            with open('config.json', 'w') as config_file:
-                json.dump(config, config_file, indent=4)
+            # apply_config_changes reopens the storage on the new workbook
+            config.set(DATA_FILE_PATH=applications_path)
+
+            # The SQLite engine keeps its own copy of the data, so import the workbook into it
+            if str(config.get("STORAGE_BACKEND")).lower() == "sqlite":
+                self.application_store.import_from_excel(applications_path)
+                self.applications_df = self.application_store.load()
+                self.search_index.build(self.applications_df)
+                self.refresh_treeview()
             print("[DEBUG] Applications settings saved successfully.")
             messagebox.showinfo("Success", "Applications settings have been saved successfully.")
             dialog.destroy()
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save Applications settings: {e}")
 
+    def export_applications(self):
+        """Export the stored applications to an Applications.xlsx-format workbook chosen by the user."""
+        file_path = filedialog.asksaveasfilename(
+            title="Export Applications",
+            defaultextension=".xlsx",
+            initialfile=self.APPLICATIONS_FILE_NAME,
+            filetypes=[("Excel files", "*.xlsx")]
+        )
+        if file_path:
+            try:
+                self.application_store.export_to_excel(file_path)
+                print(f"[DEBUG] Applications exported to {file_path}")
+            except Exception as e:
+                messagebox.showerror("Error", f"Failed to export applications: {e}")
+
     def get_current_google_sync_setting(self):
-        """Retrieve the current ENABLE_GOOGLE_SYNC setting from settings_manager.py."""
-        try:
-            return ENABLE_GOOGLE_SYNC
-        except ImportError:
-            return False  # Default to False if not set
+        """Retrieve the current ENABLE_GOOGLE_SYNC setting."""
+        return bool(config.get("ENABLE_GOOGLE_SYNC"))
 
     # Additional methods for file selection, Data handling, and layout setup
 
     def get_current_applications_file_path(self):
-        """Retrieve the current Applications.xlsx file path from settings_manager.py."""
-        try:
-            from config.settings_manager import DATA_FILE_PATH
-            if os.path.isfile(DATA_FILE_PATH):
-                return os.path.abspath(DATA_FILE_PATH)
-            else:
-                print("DATA_FILE_PATH does not point to an existing file.")
-                return "No file selected"
-        except Exception as e:
-            print(f"Error retrieving DATA_FILE_PATH: {e}")
-            return "No file selected"
+        """Retrieve the current Applications.xlsx file path."""
+        data_file_path = config.get("DATA_FILE_PATH")
+        if data_file_path and os.path.isfile(data_file_path):
+            return os.path.abspath(data_file_path)
+        print("DATA_FILE_PATH does not point to an existing file.")
+        return "No file selected"
 
     def get_current_service_account_file_path(self):
-        """Retrieve the current Service Account JSON file path from settings_manager.py or show 'No file selected'."""
-        try:
-            # Check if the path actually exists
-            if os.path.isfile(SERVICE_ACCOUNT_FILE):
-                return os.path.abspath(SERVICE_ACCOUNT_FILE)
-            else:
-                print("SERVICE_ACCOUNT_FILE does not point to an existing file.")
-                return "No file selected"
-        except ImportError:
-            return "No file selected"
-        except Exception as e:
-            print(f"Error retrieving SERVICE_ACCOUNT_FILE: {e}")
-            return "No file selected"
+        """Retrieve the current Service Account JSON file path or show 'No file selected'."""
+        service_account_file = config.get("SERVICE_ACCOUNT_FILE")
+        if service_account_file and os.path.isfile(service_account_file):
+            return os.path.abspath(service_account_file)
+        print("SERVICE_ACCOUNT_FILE does not point to an existing file.")
+        return "No file selected"
 
     def get_current_spreadsheet_id(self):
-        """Retrieve the current Spreadsheet ID from config.settings."""
-        try:
-            return SPREADSHEET_ID
-        except ImportError:
-            print("Error: Could not import SPREADSHEET_ID from config.settings.")
-            return ""
-        except Exception as e:
-            print(f"Error retrieving SPREADSHEET_ID: {e}")
-            return ""
-
-    def update_config(self, **kwargs):
-        """Update configuration settings in app_config.json."""
-        try:
-            # Load the current configuration
-            with open(CONFIG_JSON_PATH, "r") as config_file:
-                config = json.load(config_file)
-        except (FileNotFoundError, json.JSONDecodeError):
-            # If the file does not exist or is corrupted, start with default configuration
-            config = default_config
-
-        # Update the configuration with new values
-        config.update(kwargs)
-
-        # Save the updated configuration back to app_config.json
-        with open(CONFIG_JSON_PATH, "w") as config_file:
-            json.dump(config, config_file, indent=4)
-        print("[DEBUG] Configuration updated in app_config.json.")
-
-    def reload_configurations(self):
-        """Reload configurations from app_config.json."""
-        config_json_path = os.path.join(base_path, "config", "app_config.json")
-        try:
-            with open(config_json_path, "r") as config_file:
-                config = json.load(config_file)
-
-            # Update variables
-            self.sync_to_google = config.get("ENABLE_GOOGLE_SYNC", False)
-            self.DATA_FILE_PATH = config.get("DATA_FILE_PATH", os.path.join(base_path, "Data", "Applications.xlsx"))
-            self.SERVICE_ACCOUNT_FILE = config.get("SERVICE_ACCOUNT_FILE",
-                                                   os.path.join(base_path, "config", "service_account.json"))
-            self.SPREADSHEET_ID = config.get("SPREADSHEET_ID", "")
-            theme = config.get("theme", "Light")
-
-            print(f"[DEBUG] Reloading configurations. Theme found: {theme}")
+        """Retrieve the current Spreadsheet ID."""
+        return config.get("SPREADSHEET_ID") or ""
 
-            # Update theme
-            self.is_dark_mode = True if theme.lower() == "dark" else False
-            print(f"[DEBUG] is_dark_mode set to: {self.is_dark_mode}")
-            self.apply_theme()
-
-            # Re-read the Excel file with the updated path
-            try:
-                self.applications_df = read_applications_from_excel(self.DATA_FILE_PATH)
-                self.populate_treeview(self.applications_df)
-                print("[DEBUG] Applications Data reloaded successfully.")
-            except Exception as e:
-                print(f"[ERROR] Could not read the Excel file after reloading configurations: {e}")
-                self.applications_df = pd.DataFrame()
-                self.populate_treeview(self.applications_df)
-
-            # Re-establish Google Sync if enabled
+    def apply_config_changes(self, changes):
+        """
+        Config subscriber: applies changed settings to the running app. Changes the app made
+        itself (toggle_sync, toggle_theme) already match its state and are skipped.
+        """
+        if "theme" in changes and (changes["theme"] == "Dark") != self.is_dark_mode:
+            self.toggle_theme()
+        if "ENABLE_GOOGLE_SYNC" in changes and bool(changes["ENABLE_GOOGLE_SYNC"]) != self.sync_to_google:
+            self.google_sync_var.set(bool(changes["ENABLE_GOOGLE_SYNC"]))
+            self.toggle_sync()
+        if "SPREADSHEET_ID" in changes:
+            # Takes effect from the next sync cycle; the new spreadsheet starts without a base
+            self.sync_engine.switch_spreadsheet(changes["SPREADSHEET_ID"])
+        if changes.keys() & {"DATA_FILE_PATH", "STORAGE_BACKEND", "SQLITE_DB_PATH"}:
+            if not self.applications_ready():
+                return  # The loader thread opened the old storage; the change applies on the next start
+            # Edits go to the newly configured storage from now on
+            self.DATA_FILE_PATH = config.get("DATA_FILE_PATH")
+            self.reopen_application_store()
             if self.sync_to_google:
                 self.sync_to_google_sheets()
                 self.schedule_sync()
 
+    def reload_configurations(self):
+        """Reload app_config.json, e.g. after it was edited by hand, and reopen the applications if their storage changed."""
+        try:
+            # Changed settings, storage included, are applied by apply_config_changes
+            changes = config.reload()
+            print(f"[DEBUG] Reloading configurations. Changed: {sorted(changes)}")
             print("[DEBUG] Configurations reloaded successfully.")
         except Exception as e:
             print(f"[ERROR] Failed to reload configurations: {e}")
             messagebox.showerror("Error", f"Failed to reload configurations: {e}")
 
-    def update_google_sync_setting(self, enable_google_sync):
+    def reopen_application_store(self, replaced_file=None):
         """
-        Update ENABLE_GOOGLE_SYNC setting in app_config.json.
+        Closes the storage engine, which folds pending edits into it, and reads the applications
+        again from the configured storage. With `replaced_file`, that file is copied over the
+        workbook in between and the change journal of the old workbook is dropped.
         """
-        try:
-            # Load current config
-            with open(self.config_file_path, "r") as file:
-                config = json.load(file)
+        import pandas as pd
+        from src.utils.change_journal import ChangeJournal
+        from src.utils.file_io import ApplicationDataset, open_application_store
 
-            # Update ENABLE_GOOGLE_SYNC value
-            config["ENABLE_GOOGLE_SYNC"] = enable_google_sync
-
-            # Write updated config back to file
-            with open(self.config_file_path, "w") as file:
-                json.dump(config, file, indent=4)
-
-            print(f"Google Sync setting updated to: {enable_google_sync}")
+        try:
+            if self.application_store:
+                self.application_store.close()
+            if replaced_file is not None:
+                shutil.copy(replaced_file, self.DATA_FILE_PATH)
+                ChangeJournal(self.DATA_FILE_PATH).clear()
+            self.application_store = open_application_store(
+                config.get("STORAGE_BACKEND"), self.DATA_FILE_PATH, config.get("SQLITE_DB_PATH")
+            )
+            self.application_dataset = ApplicationDataset(self.application_store)
+            self.applications_df = self.application_dataset.get()
+            self.search_index.build(self.applications_df)
+            self.refresh_treeview()
+            print("[DEBUG] Applications Data reloaded successfully.")
         except Exception as e:
-            print(f"Error updating Google Sync setting: {e}")
+            print(f"[ERROR] Could not read the Excel file after reloading configurations: {e}")
+            logging.error(f"Could not reopen the applications storage: {e}")
+            self.applications_df = pd.DataFrame()
+            self.search_index.build(self.applications_df)
+            self.refresh_treeview()
+            if replaced_file is not None:
+                raise
 
+    def update_google_sync_setting(self, enable_google_sync):
+        """Update the ENABLE_GOOGLE_SYNC setting; apply_config_changes turns sync on or off."""
+        config.set(ENABLE_GOOGLE_SYNC=bool(enable_google_sync))
+        print(f"Google Sync setting updated to: {enable_google_sync}")
 
 if __name__ == "__main__":
+    from config.settings_manager import ensure_app_dirs
+    ensure_app_dirs()
     app = AppTrackPro()
     app.mainloop()
@@ -0,0 +1,173 @@
+# src/gui/theme.py
+
+import tkinter as tk
+import weakref
+from tkinter import ttk
+
+# Colors per theme, by palette key
+PALETTES = {
+    "Light": {
+        "bg": "#F0F0F0",
+        "fg": "#000000",
+        "entry_bg": "#FFFFFF",
+        "entry_fg": "#000000",
+        "button_bg": "#E0E0E0",
+        "menu_bg": "#E0E0E0",
+        "menu_fg": "#000000",
+        "menu_active_bg": "#C0C0C0",
+        "selected_bg": "#D9D9D9",
+        "selected_fg": "#000000",
+    },
+    "Dark": {
+        "bg": "#2E2E2E",
+        "fg": "#FFFFFF",
+        "entry_bg": "#3A3A3A",
+        "entry_fg": "#FFFFFF",
+        "button_bg": "#3E3E3E",
+        "menu_bg": "#3E3E3E",
+        "menu_fg": "#FFFFFF",
+        "menu_active_bg": "#5E5E5E",
+        "selected_bg": "#6A6A6A",
+        "selected_fg": "#FFFFFF",
+    },
+}
+
+# ttk styles: {style: {option: palette key}}; one configure() recolors every widget using the style
+STYLES = {
+    "TLabel": {"background": "bg", "foreground": "fg"},
+    "TFrame": {"background": "bg"},
+    "TButton": {"background": "button_bg", "foreground": "fg"},
+    "TEntry": {"fieldbackground": "entry_bg", "foreground": "entry_fg", "insertcolor": "entry_fg"},
+    "Treeview": {"background": "entry_bg", "foreground": "entry_fg", "fieldbackground": "entry_bg"},
+    "Treeview.Heading": {"background": "button_bg", "foreground": "fg"},
+    "TNotebook": {"background": "bg"},
+    "TNotebook.Tab": {"background": "bg", "foreground": "fg"},
+    "TCombobox": {"fieldbackground": "entry_bg", "background": "entry_bg", "foreground": "entry_fg"},
+    "Custom.TButton": {"background": "button_bg", "foreground": "fg"},
+}
+
+# State-dependent ttk colors: {style: {option: [(state, palette key), ...]}}
+STYLE_MAPS = {
+    "Treeview": {"background": [("selected", "selected_bg")], "foreground": [("selected", "selected_fg")]},
+    "TNotebook.Tab": {"background": [("selected", "entry_bg")]},
+    "TCombobox": {
+        "fieldbackground": [("readonly", "entry_bg")],
+        "background": [("readonly", "entry_bg")],
+        "foreground": [("readonly", "entry_fg")],
+    },
+    "Custom.TButton": {"background": [("active", "menu_active_bg")], "foreground": [("active", "fg")]},
+}
+
+# Option database patterns: classic tk widgets created later take these colors when they are built
+OPTIONS = {
+    "*Toplevel.background": "bg",
+    "*Frame.background": "bg",
+    "*Panedwindow.background": "bg",
+    "*Label.background": "bg",
+    "*Label.foreground": "fg",
+    "*Entry.background": "entry_bg",
+    "*Entry.foreground": "entry_fg",
+    "*Entry.insertBackground": "entry_fg",
+    "*Text.background": "entry_bg",
+    "*Text.foreground": "entry_fg",
+    "*Text.insertBackground": "entry_fg",
+    "*Button.background": "button_bg",
+    "*Button.foreground": "fg",
+    "*Button.activeBackground": "button_bg",
+    "*Button.activeForeground": "fg",
+    "*Menu.background": "menu_bg",
+    "*Menu.foreground": "menu_fg",
+    "*Menu.activeBackground": "menu_active_bg",
+    "*Menu.activeForeground": "menu_fg",
+}
+
+# Roles of classic tk widgets that outlive a theme switch: {role: {option: palette key}}
+ROLES = {
+    "window": {"background": "bg"},
+    "menu_bar": {"background": "menu_bg"},
+    "menu": {
+        "background": "menu_bg",
+        "foreground": "menu_fg",
+        "activebackground": "menu_active_bg",
+        "activeforeground": "menu_fg",
+    },
+    "menu_check": {
+        "background": "menu_bg",
+        "foreground": "menu_fg",
+        "activebackground": "menu_active_bg",
+        "activeforeground": "menu_fg",
+        "selectcolor": "menu_active_bg",
+    },
+    "menu_label": {"background": "menu_bg", "foreground": "menu_fg"},
+}
+
+
+class ThemeRegistry:
+    """
+    Colors the window by role from the current palette, so a theme switch touches each
+    style and role once instead of walking the widget tree.
+
+    ttk widgets follow their style, and one style.configure() recolors all widgets using it
+    however many there are, so tabs, forms and editors are built from ttk widgets. Classic
+    tk widgets cannot follow a style. Those created after a switch (cell editors, context
+    menus, dialogs) take the palette from the option database as they are built, and the
+    few that live across switches (the menu bar and the paned window) are registered with a
+    role and reconfigured on each switch.
+    """
+
+    def __init__(self, root, palettes=PALETTES):
+        self.root = root
+        self.palettes = palettes
+        self.name = None
+        self.palette = {}
+        self.style = None
+        self._widgets = {role: weakref.WeakSet() for role in ROLES}
+
+    def use(self, name):
+        """Switches to palette `name`."""
+        self.palette = self.palettes[name]
+        if self.style is None:
+            self.style = ttk.Style(self.root)
+            self.style.theme_use("alt")  # Use 'alt' theme for better customization
+            # Custom style for Save buttons; its colors are set with the others below
+            self.style.configure(
+                "Custom.TButton",
+                borderwidth=1,
+                focusthickness=3,
+                focuscolor='none',
+                font=('TkDefaultFont', 12),
+                padding=(10, 5)
+            )
+        self.name = name
+
+        for style, options in STYLES.items():
+            self.style.configure(style, **self.colors(options))
+        for style, options in STYLE_MAPS.items():
+            self.style.map(style, **{
+                option: [(state, self.palette[key]) for state, key in states]
+                for option, states in options.items()
+            })
+        for pattern, key in OPTIONS.items():
+            self.root.option_add(pattern, self.palette[key])
+
+        for role, widgets in self._widgets.items():
+            options = self.colors(ROLES[role])
+            for widget in list(widgets):
+                try:
+                    widget.configure(**options)
+                except tk.TclError:
+                    widgets.discard(widget)  # Destroyed
+
+    def register(self, widget, role):
+        """Colors a classic tk widget for `role` now and after every switch; returns the widget."""
+        if self.name is not None:
+            widget.configure(**self.colors(ROLES[role]))
+        self._widgets[role].add(widget)
+        return widget
+
+    def colors(self, options):
+        """Resolves {option: palette key} to {option: color} for the current palette."""
+        return {option: self.palette[key] for option, key in options.items()}
+
+    def registered(self):
+        return sum(len(widgets) for widgets in self._widgets.values())
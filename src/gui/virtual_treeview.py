@@ -0,0 +1,311 @@
+# src/gui/virtual_treeview.py
+
+from bisect import bisect_right
+
+DEFAULT_ROW_HEIGHT = 20
+OVERSCAN_ROWS = 10
+WHEEL_ROWS = 3
+
+# Event state bits of Shift and Control, with which a click or arrow key adds to the Treeview's selection
+EXTEND_SELECTION_MASK = 0x0001 | 0x0004
+
+
+class StreamedRows:
+    """
+    Batches of rows that are still streaming in, shown as one table without concatenating
+    them, so adding a batch costs the same however many have arrived.
+
+    Labels are row positions, as in pd.concat(batches, ignore_index=True). Offers the part
+    of the DataFrame interface VirtualTreeview uses: len(), index, and iloc/loc for a
+    slice of rows (only the batches it overlaps are concatenated) or a single row; iloc and
+    loc are the same because labels are positions.
+    """
+
+    def __init__(self):
+        self.batches = []
+        self._starts = []  # Position of each batch's first row
+        self._rows = 0
+
+    def append(self, batch):
+        self._starts.append(self._rows)
+        self.batches.append(batch)
+        self._rows += len(batch)
+
+    def __len__(self):
+        return self._rows
+
+    @property
+    def index(self):
+        import pandas as pd  # Already loaded by whoever streams the batches
+        return pd.RangeIndex(self._rows)
+
+    @property
+    def iloc(self):
+        return self
+
+    loc = iloc
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return self._window(*key.indices(self._rows)[:2])
+        position = self.index[key]
+        batch = bisect_right(self._starts, position) - 1
+        return self.batches[batch].iloc[position - self._starts[batch]]
+
+    def _window(self, start, stop):
+        import pandas as pd
+        pieces = []
+        batch = max(0, bisect_right(self._starts, start) - 1)
+        while batch < len(self.batches) and self._starts[batch] < stop:
+            first = self._starts[batch]
+            pieces.append(self.batches[batch].iloc[max(0, start - first):stop - first])
+            batch += 1
+        if not pieces:
+            return self.batches[0].iloc[0:0] if self.batches else pd.DataFrame()
+        window = pd.concat(pieces) if len(pieces) > 1 else pieces[0]
+        return window.set_axis(pd.RangeIndex(start, start + len(window)))
+
+
+class VirtualTreeview:
+    """
+    Shows a DataFrame in a ttk.Treeview while keeping only the visible window of rows
+    (plus a few rows of overscan) as Treeview items.
+
+    Items use the DataFrame's index labels as iids and show the label + 1 in the first
+    column, like a fully populated Treeview would. The scrollbar and mouse wheel move a
+    row offset into the DataFrame, so rendering and scrolling cost the same at any size.
+
+    Rendering reconciles the wanted window against the items already shown, keyed by
+    iid, and issues only the insert, move, item(values=...) and delete calls needed.
+    """
+
+    def __init__(self, tree, scrollbar, on_scroll=None):
+        self.tree = tree
+        self.scrollbar = scrollbar
+        self.on_scroll = on_scroll  # Called before the visible rows change
+        self.df = None
+        self.offset = 0
+        self.row_height = DEFAULT_ROW_HEIGHT
+        self.header_height = 0
+        self.selected = set()  # Selected index labels, including rows scrolled out of view
+        self._rendering = False
+        self._input = None  # "replace" or "extend" while a click or key is changing the selection
+        self._rendered = {}  # iid -> displayed values (as strings) of every existing item
+        self._order = []  # iids in display order
+        self.last_render_ops = {"insert": 0, "move": 0, "update": 0, "delete": 0}
+
+        # The scrollbar tracks the offset into the DataFrame rather than the Treeview's own items
+        self.scrollbar.configure(command=self.on_scrollbar)
+        self.tree.bind("<Configure>", lambda e: self.render())
+        self.tree.bind("<ButtonPress-1>", self._note_modifiers, add="+")
+        self.tree.bind("<KeyPress>", self._note_modifiers, add="+")
+        self.tree.bind("<<TreeviewSelect>>", self.on_select, add="+")
+        self.tree.bind("<MouseWheel>", self.on_mousewheel)
+        self.tree.bind("<Button-4>", lambda e: self.scroll_by(-WHEEL_ROWS) or "break")
+        self.tree.bind("<Button-5>", lambda e: self.scroll_by(WHEEL_ROWS) or "break")
+        self.tree.bind("<Up>", lambda e: self._note_modifiers(e) or self.on_arrow_key(-1))
+        self.tree.bind("<Down>", lambda e: self._note_modifiers(e) or self.on_arrow_key(1))
+        self.tree.bind("<Prior>", lambda e: self.scroll_by(-self.visible_rows()) or "break")
+        self.tree.bind("<Next>", lambda e: self.scroll_by(self.visible_rows()) or "break")
+
+    # Data
+    def set_data(self, df, keep_offset=False):
+        """
+        Shows `df` (a DataFrame or StreamedRows), resetting the scroll position unless
+        `keep_offset` is set.
+        """
+        self.df = df
+        if not keep_offset:
+            self.offset = 0
+        if self.selected:
+            self.selected = {label for label in self.selected if df is not None and label in df.index}
+        self.render()
+
+    def __len__(self):
+        return 0 if self.df is None else len(self.df)
+
+    def row_values(self, label):
+        """Returns the displayed values of the row with index `label`, whether or not it is rendered."""
+        label = self._label(label)
+        return [label + 1] + list(self.df.loc[label])
+
+    def selection(self):
+        """Returns the iids of all selected rows, including rows scrolled out of view."""
+        return tuple(str(label) for label in sorted(self.selected))
+
+    def clear_selection(self):
+        """Forgets the selection, e.g. after the selected rows were deleted."""
+        self.selected = set()
+
+    def _label(self, iid):
+        return int(iid)
+
+    # Geometry
+    def visible_rows(self):
+        """Number of rows that fit in the Treeview's current height."""
+        height = self.tree.winfo_height()
+        if height <= 1:
+            height = int(self.tree.cget("height")) * self.row_height + self.header_height
+        return max(1, (height - self.header_height) // self.row_height)
+
+    def _measure_rows(self):
+        """Measures the real row and heading height from the first rendered item."""
+        children = self.tree.get_children()
+        if not children:
+            return
+        bbox = self.tree.bbox(children[0])
+        if bbox:
+            self.header_height = bbox[1]
+            self.row_height = max(1, bbox[3])
+
+    # Scrolling
+    def max_offset(self):
+        return max(0, len(self) - self.visible_rows())
+
+    def scroll_to(self, offset):
+        offset = max(0, min(int(offset), self.max_offset()))
+        if offset == self.offset:
+            return
+        if self.on_scroll:
+            self.on_scroll()
+        self.offset = offset
+        self.render()
+
+    def scroll_by(self, rows):
+        self.scroll_to(self.offset + rows)
+
+    def on_scrollbar(self, action, *args):
+        if action == "moveto":
+            self.scroll_to(round(float(args[0]) * len(self)))
+        elif action == "scroll":
+            amount, unit = int(args[0]), args[1]
+            self.scroll_by(amount * (self.visible_rows() if unit == "pages" else 1))
+
+    def on_mousewheel(self, event):
+        # Windows reports multiples of 120 per notch; macOS reports small deltas
+        steps = event.delta // 120 if abs(event.delta) >= 120 else event.delta
+        self.scroll_by(-steps * WHEEL_ROWS)
+        return "break"
+
+    def on_arrow_key(self, direction):
+        """Scrolls when the keyboard focus moves past the first or last visible row."""
+        focus = self.tree.focus()
+        if not focus or self.df is None:
+            return None
+        position = self.df.index.get_loc(self._label(focus))
+        target = position + direction
+        if not 0 <= target < len(self):
+            return "break"
+        if target < self.offset:
+            self.scroll_to(target)
+        elif target >= self.offset + self.visible_rows():
+            self.scroll_to(target - self.visible_rows() + 1)
+        else:
+            return None  # Let the Treeview move the focus itself
+        iid = str(self.df.index[target])
+        self.tree.focus(iid)
+        self.tree.selection_set(iid)
+        return "break"
+
+    # Selection
+    def on_select(self, event=None):
+        """
+        Takes over the Treeview's selection. A plain click or arrow key replaces the selection,
+        so rows selected earlier and scrolled out of view are dropped. With Shift or Control
+        held, or when render() restored the visible part, rows out of view are kept.
+        """
+        if self._rendering:
+            return
+        shown = {self._label(iid) for iid in self.tree.selection()}
+        if self._input == "replace":
+            self.selected = shown
+        else:
+            rendered = {self._label(iid) for iid in self._order}
+            self.selected = (self.selected - rendered) | shown
+        self._input = None
+
+    def _note_modifiers(self, event):
+        self._input = "extend" if event.state & EXTEND_SELECTION_MASK else "replace"
+        # <<TreeviewSelect>> is queued ahead of idle callbacks; forget input that selected nothing
+        self.tree.after_idle(self._forget_input)
+
+    def _forget_input(self):
+        self._input = None
+
+    # Rendering
+    def window(self):
+        """Returns the (start, stop) positions of the rows that should exist as items."""
+        self.offset = max(0, min(self.offset, self.max_offset()))
+        return self.offset, min(len(self), self.offset + self.visible_rows() + OVERSCAN_ROWS)
+
+    def render(self):
+        """Brings the Treeview items in line with the visible window of rows."""
+        desired = []
+        if self.df is not None and len(self.df):
+            start, stop = self.window()
+            chunk = self.df.iloc[start:stop]
+            desired = [(str(label), [label + 1] + list(row))
+                       for label, row in zip(chunk.index, chunk.itertuples(index=False))]
+
+        self._rendering = True
+        try:
+            self.last_render_ops = self._reconcile(desired)
+            if desired:
+                self._measure_rows()
+                self.tree.yview_moveto(0)
+            self._restore_selection()
+        finally:
+            self._rendering = False
+        self._update_scrollbar()
+
+    @staticmethod
+    def _shown(values):
+        """Values as the Treeview displays them, so NaN compares equal to NaN."""
+        return tuple(str(value) for value in values)
+
+    def _reconcile(self, desired):
+        """Applies the minimal item changes that turn the shown rows into `desired`."""
+        ops = {"insert": 0, "move": 0, "update": 0, "delete": 0}
+        wanted = {iid for iid, _ in desired}
+
+        stale = [iid for iid in self._order if iid not in wanted]
+        if stale:
+            self.tree.delete(*stale)
+            ops["delete"] = len(stale)
+        order = [iid for iid in self._order if iid in wanted]
+
+        rendered = {}
+        for index, (iid, values) in enumerate(desired):
+            shown = self._shown(values)
+            if iid not in self._rendered:
+                self.tree.insert("", index, iid=iid, values=values)
+                order.insert(index, iid)
+                ops["insert"] += 1
+            else:
+                if order[index] != iid:
+                    self.tree.move(iid, "", index)
+                    order.remove(iid)
+                    order.insert(index, iid)
+                    ops["move"] += 1
+                if self._rendered[iid] != shown:
+                    self.tree.item(iid, values=values)
+                    ops["update"] += 1
+            rendered[iid] = shown
+
+        self._rendered = rendered
+        self._order = order
+        return ops
+
+    def _restore_selection(self):
+        visible = [str(label) for label in self.selected if str(label) in self._rendered]
+        if set(visible) != set(self.tree.selection()):
+            self.tree.selection_set(visible)
+
+    def _update_scrollbar(self):
+        total = len(self)
+        if not total:
+            self.scrollbar.set(0.0, 1.0)
+            return
+        first = self.offset / total
+        last = min(1.0, (self.offset + self.visible_rows()) / total)
+        self.scrollbar.set(first, last)
@@ -0,0 +1,88 @@
+# src/utils/asset_cache.py
+
+import glob
+import hashlib
+import logging
+import os
+
+
+class AssetCache:
+    """
+    Images from the assets folder, scaled to the size they are shown at.
+
+    A scaled copy is saved once as a PNG file in `cache_dir`, named after the asset, the
+    size and a hash of the source file, so later runs load it straight into tk.PhotoImage:
+    PIL is only imported to make a copy that is missing. A changed asset hashes differently,
+    so it is scaled again and its outdated copies are removed.
+
+    Images are decoded the first time they are asked for and kept afterwards, because Tk
+    drops an image once Python no longer references it. Assets are looked up in
+    `source_dirs` in order.
+    """
+
+    def __init__(self, cache_dir, source_dirs):
+        self.cache_dir = cache_dir
+        self.source_dirs = tuple(source_dirs)
+        self._photos = {}
+        self._digests = {}
+        self.scaled = 0  # Copies made with PIL (cache misses)
+
+    def source_path(self, name):
+        """Returns the path of asset `name` in the first source folder that has it."""
+        for directory in self.source_dirs:
+            path = os.path.join(directory, name)
+            if os.path.isfile(path):
+                return path
+        raise FileNotFoundError(f"Asset '{name}' not found in {', '.join(self.source_dirs)}")
+
+    def path(self, name, size=None):
+        """
+        Returns a PNG file holding asset `name` scaled to `size` (width, height), making it
+        on a cache miss; without a size, the asset itself.
+        """
+        source = self.source_path(name)
+        if size is None:
+            return source
+        width, height = size
+        prefix = f"{os.path.splitext(name)[0]}-{width}x{height}-"
+        cached = os.path.join(self.cache_dir, f"{prefix}{self._digest(source)}.png")
+        if not os.path.isfile(cached):
+            self._scale(source, cached, size)
+            for outdated in glob.glob(os.path.join(glob.escape(self.cache_dir), f"{glob.escape(prefix)}*.png")):
+                if outdated != cached:
+                    os.remove(outdated)
+        return cached
+
+    def photo(self, name, size=None, master=None):
+        """Returns asset `name` at `size` as a tk.PhotoImage, decoding it on first use."""
+        key = (name, size)
+        if key not in self._photos:
+            import tkinter as tk
+            try:
+                image = tk.PhotoImage(master=master, file=self.path(name, size))
+            except OSError as e:
+                if size is None or isinstance(e, FileNotFoundError):
+                    raise
+                # The cache folder is not writable: scale in memory for this session
+                logging.error(f"Could not cache {name} at {size[0]}x{size[1]}: {e}")
+                from PIL import Image, ImageTk
+                with Image.open(self.source_path(name)) as source:
+                    image = ImageTk.PhotoImage(source.resize(size), master=master)
+            self._photos[key] = image
+        return self._photos[key]
+
+    def _digest(self, source):
+        # Hashed once per run; the assets are a few KB each
+        if source not in self._digests:
+            with open(source, "rb") as source_file:
+                self._digests[source] = hashlib.sha256(source_file.read()).hexdigest()[:16]
+        return self._digests[source]
+
+    def _scale(self, source, cached, size):
+        from PIL import Image
+        os.makedirs(self.cache_dir, exist_ok=True)
+        temp_path = cached + ".tmp"
+        with Image.open(source) as image:
+            image.resize(size).save(temp_path, "PNG")
+        os.replace(temp_path, cached)  # Never leaves a half-written copy behind
+        self.scaled += 1
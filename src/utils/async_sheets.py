@@ -0,0 +1,240 @@
+# src/utils/async_sheets.py
+
+import logging
+import threading
+from types import SimpleNamespace
+from urllib.parse import quote
+
+from src.utils.sync_backend import SheetsBackend, row_structure_requests
+
+API_ROOT = "https://sheets.googleapis.com/v4/spreadsheets"
+
+
+class SheetsHttpError(Exception):
+    """A failed Sheets API request; `resp.status` mirrors googleapiclient's HttpError."""
+
+    def __init__(self, status, message):
+        super().__init__(f"<HttpError {status}: {message}>")
+        self.resp = SimpleNamespace(status=status)
+
+
+class EventLoopThread:
+    """
+    An asyncio event loop running on a daemon thread beside the Tk mainloop.
+
+    The thread (and asyncio itself) starts on the first run() call. close() cancels whatever is still running,
+    so callers waiting in run() get a CancelledError instead of hanging until a timeout.
+    """
+
+    def __init__(self, name="SheetsAsync"):
+        self.name = name
+        self.loop = None
+        self._thread = None
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def run(self, coro):
+        """Runs a coroutine on the loop and blocks the calling thread until it finishes."""
+        import asyncio
+        with self._lock:
+            if self._closed:
+                coro.close()
+                raise RuntimeError("The Google Sheets connection is closed.")
+            if self.loop is None:
+                self.loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=self.loop.run_forever, name=self.name, daemon=True)
+                self._thread.start()
+            future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        return future.result()
+
+    def close(self, cleanup=None, timeout=5):
+        """Cancels running coroutines, awaits `cleanup` (e.g. closing a session) and stops the loop."""
+        import asyncio
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            loop = self.loop
+        if loop is None:
+            return
+
+        async def shutdown():
+            current = asyncio.current_task()
+            tasks = [task for task in asyncio.all_tasks() if task is not current]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            if cleanup is not None:
+                await cleanup()
+
+        try:
+            asyncio.run_coroutine_threadsafe(shutdown(), loop).result(timeout)
+        except Exception as e:
+            logging.error(f"Error closing the Google Sheets connection: {e}")
+        loop.call_soon_threadsafe(loop.stop)
+        self._thread.join(timeout)
+        if not self._thread.is_alive():
+            loop.close()
+
+
+class AsyncSheetsBackend(SheetsBackend):
+    """
+    SheetsBackend that sends requests from an asyncio event loop over one pooled aiohttp session.
+
+    The primitives keep the synchronous interface the sync engine uses, so they block the
+    calling (sync worker) thread while the loop thread does the I/O. Chunked reads and writes
+    run as concurrent coroutines instead of a thread pool, with at most `max_parallel`
+    connections open to the API. close() cancels requests still in flight.
+    """
+
+    cancels_requests = True
+
+    def __init__(self, spreadsheet_id, range_name, client, api_root=API_ROOT, timeout=60, **kwargs):
+        super().__init__(spreadsheet_id, range_name, **kwargs)
+        self.client = client
+        self.api_root = api_root
+        self.timeout = timeout
+        self._events = EventLoopThread()
+        self._session = None
+        self._token_lock = None
+        self._sheet_id = None
+
+    def get_values(self, range_name):
+        return self._events.run(self._get_values(range_name))
+
+    def batch_update_values(self, data):
+        return self._events.run(self._batch_update_values(data))
+
+    def append_values(self, rows):
+        return self._events.run(self._append_values(rows))
+
+    def clear_values(self, range_name):
+        return self._events.run(self._clear_values(range_name))
+
+    def row_count(self):
+        return self._events.run(self._row_count())
+
+    def update_row_structure(self, deletes, inserts):
+        return self._events.run(self._update_row_structure(deletes, inserts))
+
+    def switch_spreadsheet(self, spreadsheet_id):
+        super().switch_spreadsheet(spreadsheet_id)
+        self._sheet_id = None
+
+    def close(self):
+        """Cancels requests in flight, closes the HTTP connections and stops the event loop."""
+        self._events.close(self._close_session)
+        super().close()
+
+    async def _get_values(self, range_name):
+        result = await self._request("GET", f"/values/{quote(range_name, safe='')}")
+        return result.get('values', [])
+
+    async def _batch_update_values(self, data):
+        await self._request("POST", "/values:batchUpdate", body={
+            'valueInputOption': 'RAW',
+            'data': [{'range': range_name, 'values': rows} for range_name, rows in data]
+        })
+
+    async def _append_values(self, rows):
+        await self._request(
+            "POST", f"/values/{quote(self.range_name, safe='')}:append",
+            params={'valueInputOption': 'RAW', 'insertDataOption': 'INSERT_ROWS'},
+            body={'values': rows}
+        )
+
+    async def _clear_values(self, range_name):
+        await self._request("POST", f"/values/{quote(range_name, safe='')}:clear", body={})
+
+    async def _row_count(self):
+        properties = await self._sheet_properties()
+        return properties.get('gridProperties', {}).get('rowCount', 0)
+
+    async def _update_row_structure(self, deletes, inserts):
+        if self._sheet_id is None:
+            self._sheet_id = (await self._sheet_properties())['sheetId']
+        await self._request("POST", ":batchUpdate",
+                            body={'requests': row_structure_requests(self._sheet_id, deletes, inserts)})
+
+    async def _sheet_properties(self):
+        metadata = await self._request(
+            "GET", "", params={'fields': 'sheets.properties(sheetId,title,gridProperties.rowCount)'}
+        )
+        for sheet in metadata.get('sheets', []):
+            properties = sheet['properties']
+            if properties['title'] == self.sheet_name:
+                self._sheet_id = properties['sheetId']
+                return properties
+        raise ValueError(f"Sheet '{self.sheet_name}' not found in the spreadsheet.")
+
+    async def _request(self, method, path, params=None, body=None):
+        import asyncio
+        # The budget may sleep, which must not stall the other requests on the loop
+        await asyncio.get_running_loop().run_in_executor(None, self._count_request)
+        session = await self._get_session()
+        url = f"{self.api_root}/{self.spreadsheet_id}{path}"
+        for attempt in range(2):
+            token = await self._access_token(refresh=attempt > 0)
+            async with session.request(method, url, params=params, json=body,
+                                       headers={'Authorization': f"Bearer {token}"}) as response:
+                if response.status == 401 and attempt == 0:
+                    continue  # The token expired early or was revoked; refresh it once
+                if response.status >= 400:
+                    raise SheetsHttpError(response.status, await response.text())
+                return await response.json()
+
+    async def _access_token(self, refresh=False):
+        import asyncio
+        credentials, _ = self.client.credentials()
+        async with self._token_lock:
+            if refresh or not credentials.valid:
+                # google-auth refreshes synchronously, so it runs off the loop
+                import httplib2
+                from google_auth_httplib2 import Request
+                await asyncio.get_running_loop().run_in_executor(
+                    None, lambda: credentials.refresh(Request(httplib2.Http(timeout=self.timeout)))
+                )
+            return credentials.token
+
+    async def _get_session(self):
+        if self._session is None:
+            import asyncio
+            import aiohttp  # Imported with the first request, not when the backend is created
+            self._token_lock = asyncio.Lock()
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.max_parallel),
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+        return self._session
+
+    async def _close_session(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _run_chunks(self, func, chunks, action):
+        """Runs the chunks as concurrent coroutines on the event loop and returns the results in order."""
+        import asyncio
+        coroutine_func = getattr(self, f"_{func.__name__}")
+
+        async def run_all():
+            done = 0
+
+            async def run(chunk):
+                nonlocal done
+                result = await coroutine_func(chunk)
+                done += 1
+                if self.progress is not None and len(chunks) > 1:
+                    self.progress(done, len(chunks), action)
+                return result
+
+            tasks = [asyncio.ensure_future(run(chunk)) for chunk in chunks]
+            try:
+                return await asyncio.gather(*tasks)
+            except BaseException:
+                # One failed chunk fails the whole transfer; stop the rest instead of letting them finish
+                for task in tasks:
+                    task.cancel()
+                raise
+
+        return self._events.run(run_all())
@@ -0,0 +1,192 @@
+# src/utils/change_journal.py
+
+import json
+import logging
+import os
+import re
+import threading
+import zipfile
+
+import pandas as pd
+
+from src.utils.data_cache import file_hash
+
+# The journal is folded into the workbook once it grows past this size
+COMPACT_THRESHOLD_BYTES = 256 * 1024
+
+# Stored in the workbook's core properties to record which journal entries it already contains
+JOURNAL_SEQ_PREFIX = "apptrackpro-journal:"
+
+
+def journal_path(data_file_path):
+    """Returns the path of the journal kept next to a workbook as a hidden file."""
+    directory, file_name = os.path.split(os.path.abspath(data_file_path))
+    return os.path.join(directory, f".{file_name}.journal")
+
+
+def read_journal_seq(data_file_path):
+    """
+    Returns the sequence number of the last journal entry folded into the workbook, or 0.
+    Only the workbook's core properties are read, not its sheets.
+    """
+    try:
+        with zipfile.ZipFile(data_file_path) as archive:
+            core = archive.read("docProps/core.xml").decode("utf-8")
+    except (FileNotFoundError, KeyError, zipfile.BadZipFile):
+        return 0
+    match = re.search(r"<dc:identifier>" + re.escape(JOURNAL_SEQ_PREFIX) + r"(\d+)</dc:identifier>", core)
+    return int(match.group(1)) if match else 0
+
+
+def workbook_signature(data_file_path):
+    """
+    Returns the size and content hash of a workbook ({} if there is none). The journal records
+    it, so its records are only replayed on the workbook they were written against.
+    """
+    try:
+        return {"size": os.path.getsize(data_file_path), "sha1": file_hash(data_file_path)}
+    except FileNotFoundError:
+        return {}
+
+
+def to_journal_value(value):
+    """Converts a DataFrame cell into a JSON-serializable journal value."""
+    if value is None:
+        return None
+    try:
+        if pd.isna(value):
+            return None
+    except (TypeError, ValueError):
+        pass
+    if isinstance(value, pd.Timestamp):
+        return value.strftime("%Y-%m-%d")
+    if hasattr(value, "item"):
+        return value.item()  # NumPy scalar
+    return value if isinstance(value, (str, int, float, bool)) else str(value)
+
+
+def rows_to_journal(df):
+    """Converts DataFrame rows into lists of journal values."""
+    return [[to_journal_value(value) for value in row] for row in df.itertuples(index=False)]
+
+
+def apply_record(df, record):
+    """Applies one journal record to `df` and returns the resulting DataFrame."""
+    op = record["op"]
+    if op == "append":
+        new_rows = pd.DataFrame(record["rows"], columns=record["columns"])
+        return pd.concat([df, new_rows], ignore_index=True)
+    if op == "update":
+        df.at[record["row"], record["column"]] = record["value"]
+        return df
+    if op == "delete":
+        return df.drop(index=[row for row in record["rows"] if row in df.index]).reset_index(drop=True)
+    if op == "replace":
+        return pd.DataFrame(record["rows"], columns=record["columns"])
+    logging.warning(f"Ignoring unknown journal record: {op}")
+    return df
+
+
+class ChangeJournal:
+    """
+    Append-only log of edits stored as JSON lines next to the workbook.
+
+    Every record carries an increasing sequence number. Records are flushed to disk
+    as they are appended, so edits made since the last compaction survive a crash.
+
+    Records refer to rows by position, so they only make sense on top of the workbook they
+    were written against. The first line of the file is a header holding that workbook's
+    signature (`workbook`, set by the store), and read_records() only returns records
+    whose header matches the signature it is given.
+    """
+
+    def __init__(self, data_file_path):
+        self.path = journal_path(data_file_path)
+        self.last_seq = 0
+        self.workbook = {}  # Signature of the workbook new records apply to
+        self._file = None
+        self._lock = threading.Lock()
+
+    def read_records(self, workbook=None):
+        """
+        Returns all complete records in the journal; a torn final line is ignored. With a
+        `workbook` signature, returns no records if the journal belongs to another workbook.
+        """
+        header, records = None, []
+        try:
+            with open(self.path, "r", encoding="utf-8") as file:
+                for line in file:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        logging.warning("Ignoring incomplete record at the end of the change journal.")
+                        break
+                    if "workbook" in record:
+                        header = record["workbook"]
+                    else:
+                        records.append(record)
+        except FileNotFoundError:
+            pass
+        if workbook is not None and records and header != workbook:
+            return []
+        return records
+
+    def append(self, record):
+        """Assigns the next sequence number to `record`, writes it and returns the number."""
+        with self._lock:
+            self.last_seq += 1
+            record = {"seq": self.last_seq, **record}
+            if self._file is None:
+                self._file = open(self.path, "a", encoding="utf-8")
+                if self._file.tell() == 0:
+                    self._file.write(json.dumps({"workbook": self.workbook}) + "\n")
+            self._file.write(json.dumps(record) + "\n")
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            return self.last_seq
+
+    def size(self):
+        """Returns the journal's size in bytes."""
+        try:
+            return os.path.getsize(self.path)
+        except FileNotFoundError:
+            return 0
+
+    def discard_through(self, seq, workbook):
+        """
+        Removes records up to and including `seq`, which the workbook now contains; the rest
+        apply on top of that workbook, whose signature is `workbook`.
+        """
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            self.workbook = workbook
+            remaining = [record for record in self.read_records() if record.get("seq", 0) > seq]
+            if not remaining:
+                if os.path.exists(self.path):
+                    os.remove(self.path)
+                return
+            temp_path = self.path + ".tmp"
+            with open(temp_path, "w", encoding="utf-8") as file:
+                file.write(json.dumps({"workbook": workbook}) + "\n")
+                for record in remaining:
+                    file.write(json.dumps(record) + "\n")
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(temp_path, self.path)
+
+    def clear(self):
+        """Removes every record, e.g. when the workbook was replaced."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            if os.path.exists(self.path):
+                os.remove(self.path)
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
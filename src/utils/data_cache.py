@@ -0,0 +1,123 @@
+# src/utils/data_cache.py
+
+import hashlib
+import json
+import logging
+import os
+
+import pandas as pd
+
+CACHE_VERSION = 1
+
+# Set once pyarrow turns out to be unavailable so the cache stops retrying
+_cache_disabled = False
+
+
+def cache_paths(data_file_path):
+    """
+    Returns the (feather, metadata) sidecar paths for a workbook, stored next to it as hidden files.
+    """
+    directory, file_name = os.path.split(os.path.abspath(data_file_path))
+    base = os.path.join(directory, f".{file_name}")
+    return base + ".feather", base + ".cache.json"
+
+
+def file_hash(file_path):
+    """Returns the SHA-1 hex digest of a file's contents."""
+    digest = hashlib.sha1()
+    with open(file_path, "rb") as file:
+        for block in iter(lambda: file.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def file_signature(file_path, with_hash=True):
+    """Returns the mtime, size and (optionally) content hash that identify a workbook version."""
+    stat = os.stat(file_path)
+    signature = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+    if with_hash:
+        signature["sha1"] = file_hash(file_path)
+    return signature
+
+
+def _load_metadata(meta_path):
+    try:
+        with open(meta_path, "r") as meta_file:
+            return json.load(meta_file)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def _is_current(metadata, data_file_path):
+    """
+    Checks the cached signature against the workbook. Matching mtime and size are trusted
+    as-is; otherwise the content hash decides, so a touched but unchanged file stays cached.
+    """
+    if not metadata or metadata.get("version") != CACHE_VERSION:
+        return False
+    signature = file_signature(data_file_path, with_hash=False)
+    if signature["mtime_ns"] == metadata.get("mtime_ns") and signature["size"] == metadata.get("size"):
+        return True
+    return signature["size"] == metadata.get("size") and file_hash(data_file_path) == metadata.get("sha1")
+
+
+def read_cached_applications(data_file_path):
+    """
+    Returns the cached DataFrame for `data_file_path`, or None if the cache is missing or stale.
+    """
+    if _cache_disabled or not os.path.exists(data_file_path):
+        return None
+    feather_path, meta_path = cache_paths(data_file_path)
+    try:
+        if not os.path.exists(feather_path) or not _is_current(_load_metadata(meta_path), data_file_path):
+            return None
+        df = pd.read_feather(feather_path)
+        df = df.mask(df.isna())  # Arrow nulls come back as None; match pd.read_excel's NaN
+        print("Applications loaded from cache.")
+        return df
+    except Exception as e:
+        logging.error(f"Error reading applications cache: {e}")
+        return None
+
+
+def _cacheable(df):
+    """
+    Returns a copy of `df` that Arrow can store: mixed-type object columns
+    (e.g. dates parsed by Excel next to typed-in strings) are stored as text.
+    """
+    frame = df.reset_index(drop=True)
+    frame.columns = [str(col) for col in frame.columns]
+    for col in frame.columns:
+        if frame[col].dtype == object:
+            values = frame[col].dropna()
+            if len({type(value) for value in values}) > 1:
+                frame[col] = frame[col].map(lambda value: value if pd.isna(value) else str(value))
+    return frame
+
+
+def write_applications_cache(df, data_file_path):
+    """
+    Stores `df` as the cached contents of `data_file_path` at its current version.
+    Call this right after the workbook itself has been written.
+    """
+    global _cache_disabled
+    if _cache_disabled or not os.path.exists(data_file_path):
+        return
+    feather_path, meta_path = cache_paths(data_file_path)
+    try:
+        # Drop the metadata first so a crash mid-write can never validate a stale cache
+        if os.path.exists(meta_path):
+            os.remove(meta_path)
+        temp_path = feather_path + ".tmp"
+        _cacheable(df).to_feather(temp_path)
+        os.replace(temp_path, feather_path)
+
+        metadata = {"version": CACHE_VERSION, **file_signature(data_file_path)}
+        with open(meta_path, "w") as meta_file:
+            json.dump(metadata, meta_file)
+    except ImportError as e:
+        _cache_disabled = True
+        print(f"Applications cache disabled: {e}")
+        logging.warning(f"Applications cache disabled: {e}")
+    except Exception as e:
+        logging.error(f"Error writing applications cache: {e}")
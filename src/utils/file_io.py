@@ -1,13 +1,289 @@
 # src/utils/file_io.py
 
+import logging
+import os
+import threading
+
 import pandas as pd
+from openpyxl import load_workbook
 from config.settings_manager import DATA_FILE_PATH
+from src.utils.change_journal import (
+    COMPACT_THRESHOLD_BYTES,
+    JOURNAL_SEQ_PREFIX,
+    ChangeJournal,
+    apply_record,
+    read_journal_seq,
+    rows_to_journal,
+    to_journal_value,
+    workbook_signature
+)
+from src.utils.data_cache import read_cached_applications, write_applications_cache
+from src.utils.write_behind import WriteBehindWriter
+
+APPLICATION_COLUMNS = ["Company", "Position", "Application Portal URL", "Date Applied", "Status"]
 
 def read_applications_from_excel(file_path=DATA_FILE_PATH):
     try:
         return pd.read_excel(file_path)
     except FileNotFoundError:
-        return pd.DataFrame(columns=["Company", "Position", "Application Portal URL", "Date Applied", "Status"])
+        return pd.DataFrame(columns=APPLICATION_COLUMNS)
+
+def save_applications_to_excel(df, file_path=DATA_FILE_PATH, journal_seq=None):
+    """
+    Writes the workbook through a temporary file so a crash never leaves it half written.
+    `journal_seq` records the last change-journal entry the workbook contains.
+    """
+    root, ext = os.path.splitext(file_path)
+    temp_path = f"{root}.saving{ext or '.xlsx'}"
+    with pd.ExcelWriter(temp_path, engine="openpyxl") as writer:
+        df.to_excel(writer, index=False)
+        if journal_seq is not None:
+            writer.book.properties.identifier = f"{JOURNAL_SEQ_PREFIX}{journal_seq}"
+    os.replace(temp_path, file_path)
+
+def iter_application_batches(file_path=DATA_FILE_PATH, batch_size=1000, progress_callback=None):
+    """
+    Yields the workbook's rows as DataFrames of up to `batch_size` rows.
+    Uses openpyxl's read-only mode, so only the current batch of parsed rows is held in memory.
+    progress_callback(rows_read, total_rows) is called after each batch; total_rows comes from
+    the sheet's declared dimensions and may be None.
+    """
+    if not os.path.exists(file_path):
+        yield pd.DataFrame(columns=APPLICATION_COLUMNS)
+        return
+
+    workbook = load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        sheet = workbook.active
+        total_rows = sheet.max_row - 1 if sheet.max_row else None
+        rows = sheet.iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            yield pd.DataFrame(columns=APPLICATION_COLUMNS)
+            return
+        columns = [str(name) if name is not None else f"Unnamed: {i}" for i, name in enumerate(header)]
+        width = len(columns)
+
+        batch = []
+        rows_read = 0
+        for row in rows:
+            if all(value is None for value in row):
+                continue  # Formatted but empty rows are reported by read-only sheets
+            batch.append(tuple(row[:width]) + (None,) * (width - len(row)))
+            if len(batch) >= batch_size:
+                rows_read += len(batch)
+                yield _batch_frame(batch, columns)
+                batch = []
+                if progress_callback:
+                    progress_callback(rows_read, total_rows)
+        if batch or rows_read == 0:
+            rows_read += len(batch)
+            yield _batch_frame(batch, columns)
+            if progress_callback:
+                progress_callback(rows_read, total_rows)
+    finally:
+        workbook.close()
+
+def _batch_frame(rows, columns):
+    """Builds a batch DataFrame with missing cells as NaN, matching pd.read_excel."""
+    df = pd.DataFrame(rows, columns=columns)
+    return df.mask(df.isna())
+
+def read_applications_cached(file_path=DATA_FILE_PATH):
+    """
+    Reads applications from the binary sidecar cache when it matches the workbook,
+    otherwise parses the workbook and rebuilds the cache.
+    """
+    df = read_cached_applications(file_path)
+    if df is None:
+        df = read_applications_from_excel(file_path)
+        write_applications_cache(df, file_path)
+    return df
+
+def save_applications_and_cache(df, file_path=DATA_FILE_PATH, journal_seq=None):
+    """Writes the workbook and refreshes its sidecar cache so the next startup skips parsing."""
+    save_applications_to_excel(df, file_path, journal_seq)
+    write_applications_cache(df, file_path)
+
+
+class ExcelApplicationStore:
+    """
+    Storage engine that keeps Applications.xlsx as the database.
+
+    Each mutation is appended to a change journal next to the workbook, so an edit costs
+    the same however many applications there are. compact() folds the journal into the
+    workbook on a background writer; loading replays the journal on top of the workbook,
+    unless the workbook was replaced since the journal was written.
+    """
+
+    def __init__(self, file_path=DATA_FILE_PATH):
+        self.file_path = file_path
+        self.journal = ChangeJournal(file_path)
+        self.writer = WriteBehindWriter(
+            self._save_snapshot, file_path, after_write=self._snapshot_written, on_failure=self._snapshot_failed
+        )
+        self._streamed_from_workbook = False
+        self._latest_df = None
+        self._compacted_seq = 0
+        self.replayed_records = 0
+
+    def load(self):
+        """Reads the workbook (or its cache), replays the journal and returns the resulting DataFrame."""
+        self._streamed_from_workbook = False  # read_applications_cached keeps the cache current
+        return self.finish_load(read_applications_cached(self.file_path))
+
+    def iter_batches(self, batch_size=1000, progress_callback=None):
+        """Yields the stored applications in batches, from the cache when it is current."""
+        cached = read_cached_applications(self.file_path)
+        self._streamed_from_workbook = cached is None
+        if cached is None:
+            yield from iter_application_batches(self.file_path, batch_size, progress_callback)
+            return
+        for start in range(0, max(len(cached), 1), batch_size):
+            yield cached.iloc[start:start + batch_size]
+            if progress_callback:
+                progress_callback(min(start + batch_size, len(cached)), len(cached))
+
+    def finish_load(self, df):
+        """
+        Takes the workbook's contents, replays journaled changes the workbook does not
+        contain yet and returns the result.
+        """
+        self.writer.mark_persisted(df)
+        if self._streamed_from_workbook:
+            write_applications_cache(df, self.file_path)
+
+        workbook_seq = read_journal_seq(self.file_path)
+        signature = workbook_signature(self.file_path)
+        records = self.journal.read_records(signature)
+        if not records and self.journal.size():
+            # Written against another workbook, e.g. before this one was copied over it
+            logging.warning("Discarding a change journal that belongs to a replaced workbook.")
+            self.journal.clear()
+        self.journal.workbook = signature
+        self.journal.last_seq = max([workbook_seq] + [record.get("seq", 0) for record in records])
+        pending = [record for record in records if record.get("seq", 0) > workbook_seq]
+        for record in pending:
+            df = apply_record(df, record)
+        if pending:
+            print(f"Replayed {len(pending)} journaled changes.")
+        self.replayed_records = len(pending)
+        self._compacted_seq = workbook_seq if not pending else 0
+        self._latest_df = df
+        return df
+
+    def append_rows(self, df, count=1):
+        """Journals the last `count` rows of `df` as appended."""
+        self._record(df, {"op": "append", "columns": [str(col) for col in df.columns],
+                          "rows": rows_to_journal(df.tail(count))})
+
+    def update_cell(self, df, position, column):
+        """Journals the new value of the cell at (`position`, `column`)."""
+        self._record(df, {"op": "update", "row": int(position), "column": column,
+                          "value": to_journal_value(df.at[position, column])})
+
+    def delete_rows(self, df, positions):
+        """Journals the removal of the rows that were at `positions` before deletion."""
+        self._record(df, {"op": "delete", "rows": sorted(int(position) for position in positions)})
+
+    def replace_all(self, df):
+        """Journals `df` as the complete new contents and compacts right away."""
+        self._record(df, {"op": "replace", "columns": [str(col) for col in df.columns],
+                          "rows": rows_to_journal(df)})
+        self.compact()
+
+    def _record(self, df, record):
+        self.journal.append(record)
+        self._latest_df = df
+        if self.journal.size() > COMPACT_THRESHOLD_BYTES:
+            self.compact()
+
+    def compact(self, df=None):
+        """Folds the journal into the workbook on the background writer."""
+        df = self._latest_df if df is None else df
+        seq = self.journal.last_seq
+        if df is None or seq == self._compacted_seq:
+            return  # Nothing journaled since the last compaction
+        snapshot = df.copy()
+        snapshot.attrs["journal_seq"] = seq
+        self._compacted_seq = seq
+        self.writer.submit(snapshot, copy=False)
+
+    def _save_snapshot(self, snapshot, file_path):
+        save_applications_and_cache(snapshot, file_path, snapshot.attrs.get("journal_seq"))
+
+    def _snapshot_written(self, snapshot):
+        seq = snapshot.attrs.get("journal_seq")
+        if seq:
+            self.journal.discard_through(seq, workbook_signature(self.file_path))
+
+    def _snapshot_failed(self, snapshot):
+        # The journal still holds the edits; forget the compaction so the next compact() retries it
+        if snapshot.attrs.get("journal_seq") == self._compacted_seq:
+            self._compacted_seq = 0
+
+    def export_to_excel(self, file_path):
+        """Writes the stored applications to an Applications.xlsx-format workbook."""
+        self.flush()
+        save_applications_to_excel(read_applications_cached(self.file_path), file_path)
+
+    def flush(self, timeout=None):
+        self.compact()
+        return self.writer.flush(timeout)
+
+    def close(self, timeout=None):
+        self.compact()
+        self.writer.close(timeout)
+        self.journal.close()
+
+    def stats(self):
+        return {
+            "backend": "excel",
+            "journal_bytes": self.journal.size(),
+            "replayed_records": self.replayed_records,
+            **self.writer.stats(),
+        }
+
+
+class ApplicationDataset:
+    """
+    Load-once view of the applications held by a storage engine, shared by every
+    part of the GUI that needs the data at startup.
+    """
+
+    def __init__(self, store):
+        self.store = store
+        self._df = None
+        self._lock = threading.Lock()
+
+    def get(self):
+        """Returns the applications DataFrame, loading it from the store on first use."""
+        with self._lock:
+            if self._df is None:
+                self._df = self.store.load()
+            return self._df
+
+    def stream(self, batch_size=1000, progress_callback=None):
+        """
+        Yields the store's applications in batches and keeps the assembled DataFrame
+        as the loaded data once the last batch has been read.
+        """
+        batches = []
+        for batch in self.store.iter_batches(batch_size, progress_callback):
+            batches.append(batch)
+            yield batch
+        df = pd.concat(batches, ignore_index=True) if batches else pd.DataFrame(columns=APPLICATION_COLUMNS)
+        df = self.store.finish_load(df)
+        with self._lock:
+            self._df = df
+
 
-def save_applications_to_excel(df, file_path=DATA_FILE_PATH):
-    df.to_excel(file_path, index=False)
\ No newline at end of file
+def open_application_store(storage_backend="excel", data_file_path=DATA_FILE_PATH, sqlite_db_path=None):
+    """
+    Returns the storage engine selected by STORAGE_BACKEND in app_config.json.
+    The SQLite engine imports an existing Applications.xlsx the first time it is opened.
+    """
+    if str(storage_backend).lower() == "sqlite":
+        from src.utils.sqlite_store import SQLiteApplicationStore
+        return SQLiteApplicationStore(sqlite_db_path, excel_path=data_file_path)
+    return ExcelApplicationStore(data_file_path)
@@ -1,109 +1,203 @@
 # src/utils/google_sheets.py
 
+import importlib.util
 import logging
-import pandas as pd
-from googleapiclient.discovery import build
-from google.oauth2 import service_account
-from config.settings_manager import (
-    SERVICE_ACCOUNT_FILE,
-    SPREADSHEET_ID,
-    RANGE_NAME
-)
+import os
+import threading
+from config.settings_manager import RANGE_NAME, config
+from src.utils.sync_backend import SheetsBackend, row_structure_requests
 
 SCOPES = ['https://www.googleapis.com/auth/spreadsheets']
 
-def get_service():
-    """
-    Authenticates with Google Sheets API using a service account file and returns the service object.
-    """
-    try:
-        creds = service_account.Credentials.from_service_account_file(
-            SERVICE_ACCOUNT_FILE, scopes=SCOPES
-        )
-        service = build('sheets', 'v4', credentials=creds, cache_discovery=False)
-        return service
-    except Exception as e:
-        logging.error(f"Error obtaining Google Sheets service: {e}")
-        raise
-
-def read_from_google_sheets():
+# Seconds before an unresponsive Google Sheets request gives up
+HTTP_TIMEOUT = 60
+
+# Sheet (tab) that holds the applications, e.g. "Sheet1" for "Sheet1!A1:E"
+SHEET_NAME = RANGE_NAME.split('!')[0]
+
+
+class SheetsClient:
     """
-    Reads data from the specified Google Sheets document and returns it as a pandas DataFrame.
+    Long-lived Google Sheets API client.
+
+    The service account credentials are loaded once and reused, and each thread keeps its
+    own service object on a keep-alive HTTP connection (httplib2 connections must not be
+    shared between threads). Access tokens are refreshed only when they have expired. The
+    client is rebuilt when the service account file is replaced or a different file is configured;
+    unless one is given, the file is the SERVICE_ACCOUNT_FILE setting.
+
+    The Google API libraries are imported on first use, so they cost nothing at startup
+    and are never loaded while Google Sync is off.
     """
-    try:
-        service = get_service()
-        sheet = service.spreadsheets()
-        result = sheet.values().get(
-            spreadsheetId=SPREADSHEET_ID,
-            range=RANGE_NAME
+
+    def __init__(self, service_account_file=None, timeout=HTTP_TIMEOUT):
+        self._service_account_file = service_account_file
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._credentials = None
+        self._generation = 0  # Bumped whenever the credentials are reloaded
+        self._file_key = None
+        self._sheet_ids = {}
+        self.builds = 0  # Number of times credentials were (re)loaded
+
+    def credentials(self):
+        """Returns the shared service account credentials and their generation, reloading them if the file changed."""
+        from google.oauth2 import service_account
+        with self._lock:
+            file_key = self._current_file_key()
+            if self._credentials is None or file_key != self._file_key:
+                self._credentials = service_account.Credentials.from_service_account_file(
+                    self.service_account_file, scopes=SCOPES
+                )
+                self._file_key = file_key
+                self._generation += 1
+                self._sheet_ids = {}
+                self.builds += 1
+            return self._credentials, self._generation
+
+    @property
+    def service_account_file(self):
+        return self._service_account_file or config.get("SERVICE_ACCOUNT_FILE")
+
+    def service(self):
+        """Returns the calling thread's service object, building it on first use or after invalidation."""
+        credentials, generation = self.credentials()
+        if getattr(self._local, 'generation', None) != generation:
+            self._local.service = self._build(credentials)
+            self._local.generation = generation
+        return self._local.service
+
+    def sheet_properties(self, spreadsheet_id, sheet_name):
+        """Returns the properties (sheetId, gridProperties) of a sheet (tab)."""
+        metadata = self.service().spreadsheets().get(
+            spreadsheetId=spreadsheet_id,
+            fields='sheets.properties(sheetId,title,gridProperties.rowCount)'
         ).execute()
-        values = result.get('values', [])
-        if values:
-            df = pd.DataFrame(values[1:], columns=values[0])
-            print("Data read from Google Sheets successfully.")
-            return df
-        else:
-            print("No data found in Google Sheets.")
-            return pd.DataFrame()
-    except Exception as e:
-        logging.error(f"Error reading from Google Sheets: {e}")
-        return pd.DataFrame()
-
-def write_to_google_sheets(df):
-    """
-    Writes the provided pandas DataFrame to the specified Google Sheets document.
-    """
-    try:
-        service = get_service()
-        # Replace NaN values with empty strings
-        df = df.fillna('')
-        # Convert DataFrame to a list of lists
-        values = [df.columns.values.tolist()] + df.values.tolist()
-        body = {'values': values}
-
-        # Clear the existing data in the sheet before writing new data
-        clear_values_request_body = {}
-        service.spreadsheets().values().clear(
-            spreadsheetId=SPREADSHEET_ID,
-            range=RANGE_NAME,
-            body=clear_values_request_body
+        for sheet in metadata.get('sheets', []):
+            properties = sheet['properties']
+            with self._lock:
+                self._sheet_ids[(spreadsheet_id, properties['title'])] = properties['sheetId']
+            if properties['title'] == sheet_name:
+                return properties
+        raise ValueError(f"Sheet '{sheet_name}' not found in the spreadsheet.")
+
+    def sheet_id(self, spreadsheet_id, sheet_name):
+        """Returns the numeric id of a sheet (tab), which row deletions need; looked up once."""
+        key = (spreadsheet_id, sheet_name)
+        with self._lock:
+            if key in self._sheet_ids:
+                return self._sheet_ids[key]
+        return self.sheet_properties(spreadsheet_id, sheet_name)['sheetId']
+
+    def invalidate(self):
+        """Drops the cached credentials and connections, e.g. after the service account file was replaced."""
+        with self._lock:
+            self._credentials = None
+
+    def _current_file_key(self):
+        # A replaced file has a new mtime or size even when its path is unchanged
+        try:
+            stat = os.stat(self.service_account_file)
+            return self.service_account_file, stat.st_mtime_ns, stat.st_size
+        except OSError:
+            return self.service_account_file, None, None
+
+    def _build(self, credentials):
+        import httplib2
+        from google_auth_httplib2 import AuthorizedHttp
+        from googleapiclient.discovery import build
+
+        # AuthorizedHttp refreshes the token on the same connection when it has expired
+        http = AuthorizedHttp(credentials, http=httplib2.Http(timeout=self.timeout))
+        return build('sheets', 'v4', http=http, cache_discovery=False)
+
+
+sheets_client = SheetsClient()
+
+class GoogleSheetsBackend(SheetsBackend):
+    """SheetsBackend for a range of a Google Sheets spreadsheet, using the shared SheetsClient."""
+
+    def __init__(self, spreadsheet_id, range_name, client=None):
+        super().__init__(spreadsheet_id, range_name)
+        self.client = client or sheets_client
+
+    def get_values(self, range_name):
+        self._count_request()
+        result = self.client.service().spreadsheets().values().get(
+            spreadsheetId=self.spreadsheet_id,
+            range=range_name
+        ).execute()
+        return result.get('values', [])
+
+    def batch_update_values(self, data):
+        self._count_request()
+        self.client.service().spreadsheets().values().batchUpdate(
+            spreadsheetId=self.spreadsheet_id,
+            body={
+                'valueInputOption': 'RAW',
+                'data': [{'range': range_name, 'values': rows} for range_name, rows in data]
+            }
         ).execute()
 
-        # Write the new data to the sheet
-        service.spreadsheets().values().update(
-            spreadsheetId=SPREADSHEET_ID,
-            range=RANGE_NAME,
+    def append_values(self, rows):
+        self._count_request()
+        self.client.service().spreadsheets().values().append(
+            spreadsheetId=self.spreadsheet_id,
+            range=self.range_name,
             valueInputOption='RAW',
-            body=body
+            insertDataOption='INSERT_ROWS',
+            body={'values': rows}
         ).execute()
-        print("Data written to Google Sheets successfully.")
-    except Exception as e:
-        logging.error(f"Error writing to Google Sheets: {e}")
-        raise
 
-def delete_row_in_google_sheets(row_index):
+    def clear_values(self, range_name):
+        self._count_request()
+        self.client.service().spreadsheets().values().clear(
+            spreadsheetId=self.spreadsheet_id,
+            range=range_name,
+            body={}
+        ).execute()
+
+    def row_count(self):
+        self._count_request()
+        properties = self.client.sheet_properties(self.spreadsheet_id, self.sheet_name)
+        return properties.get('gridProperties', {}).get('rowCount', 0)
+
+    def update_row_structure(self, deletes, inserts):
+        sheet_id = self.client.sheet_id(self.spreadsheet_id, self.sheet_name)
+        self._count_request()
+        self.client.service().spreadsheets().batchUpdate(
+            spreadsheetId=self.spreadsheet_id,
+            body={'requests': row_structure_requests(sheet_id, deletes, inserts)}
+        ).execute()
+
+
+def open_sheets_backend(spreadsheet_id, range_name, http_client="httplib2"):
     """
-    Deletes a row in the Google Sheets document at the specified index.
-    Note: row_index is 1-based (1 corresponds to the first row).
+    Returns the backend for a sheet range using the configured HTTP client: "httplib2" uses
+    googleapiclient on a thread pool, "asyncio" sends requests from a background event loop
+    over one pooled aiohttp session. Falls back to httplib2 if aiohttp is not installed.
     """
-    try:
-        service = get_service()
-        requests = [{
-            'deleteDimension': {
-                'range': {
-                    'sheetId': 0,  # Default sheet ID; change if necessary
-                    'dimension': 'ROWS',
-                    'startIndex': row_index - 1,  # Zero-based index
-                    'endIndex': row_index        # Exclusive end index
-                }
-            }
-        }]
-        body = {'requests': requests}
-        service.spreadsheets().batchUpdate(
-            spreadsheetId=SPREADSHEET_ID,
-            body=body
-        ).execute()
-        print(f"Row {row_index} deleted from Google Sheets successfully.")
-    except Exception as e:
-        logging.error(f"Error deleting row in Google Sheets: {e}")
-        raise
\ No newline at end of file
+    if str(http_client).lower() == "asyncio":
+        # Only checks that aiohttp is installed; it is imported when the first request is sent
+        if importlib.util.find_spec("aiohttp") is not None:
+            from src.utils.async_sheets import AsyncSheetsBackend
+            return AsyncSheetsBackend(spreadsheet_id, range_name, sheets_client, timeout=HTTP_TIMEOUT)
+        logging.warning("aiohttp is not installed; Google Sheets requests use httplib2.")
+    return GoogleSheetsBackend(spreadsheet_id, range_name)
+
+_sheets_backend = None
+_sheets_backend_lock = threading.Lock()
+
+def get_sheets_backend():
+    """
+    Returns the backend for the configured spreadsheet, used by the sync engine. It is
+    created on first use from the SPREADSHEET_ID and SYNC_HTTP_CLIENT settings.
+    """
+    global _sheets_backend
+    with _sheets_backend_lock:
+        if _sheets_backend is None:
+            _sheets_backend = open_sheets_backend(
+                config.get("SPREADSHEET_ID"), RANGE_NAME, config.get("SYNC_HTTP_CLIENT")
+            )
+        return _sheets_backend
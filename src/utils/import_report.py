@@ -0,0 +1,116 @@
+# src/utils/import_report.py
+"""
+Reports how long importing a module takes, summed per subsystem.
+
+Runs `python -X importtime -c "import <module>"` in fresh interpreters, keeps the fastest
+run and adds up each imported module's own time by subsystem. Modules an empty interpreter
+already imports at startup (site, .pth hooks) are left out. It fails when a subsystem
+that must not load at startup was imported, or when the total is over a budget, so
+regressions are caught. Run from the project root:
+
+    python -m src.utils.import_report
+    python -m src.utils.import_report --budget-ms 150 --top 15
+    python app.py --import-report
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+from collections import Counter
+
+# Subsystems by top-level package; everything else counts as "python & other"
+SUBSYSTEMS = {
+    "app": {"src", "config"},
+    "tk": {"tkinter", "_tkinter", "tkinterdnd2"},
+    "data": {"pandas", "numpy", "pyarrow", "dateutil", "pytz", "tzdata", "openpyxl", "et_xmlfile"},
+    "imaging": {"PIL"},
+    "google sync": {
+        "google", "googleapiclient", "google_auth_httplib2", "google_auth_oauthlib", "httplib2",
+        "uritemplate", "pyparsing", "cachetools", "rsa", "pyasn1", "pyasn1_modules", "cryptography",
+        "requests", "urllib3", "certifi", "charset_normalizer", "idna", "aiohttp", "aiosignal",
+        "aiohappyeyeballs", "async_timeout", "attr", "frozenlist", "multidict", "propcache", "yarl",
+    },
+}
+OTHER = "python & other"
+
+# Subsystems the main window must not import before it is painted
+STARTUP_FORBIDDEN = ("data", "imaging", "google sync")
+
+IMPORT_TIME_RE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)$")
+
+
+def subsystem(module_name):
+    top = module_name.split(".")[0]
+    for name, packages in SUBSYSTEMS.items():
+        if top in packages:
+            return name
+    return OTHER
+
+
+def measure(module, cwd=None):
+    """
+    Imports `module` in a new interpreter and returns {module name: own import time in µs};
+    with `module` None, the modules imported by interpreter startup alone.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}" if module else "pass"],
+        cwd=cwd, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr.strip()}")
+    times = {}
+    for line in result.stderr.splitlines():
+        match = IMPORT_TIME_RE.match(line)
+        if match:
+            times[match.group(4)] = int(match.group(1))
+    return times
+
+
+def summarize(times):
+    """Returns ({subsystem: µs}, {subsystem: module count})."""
+    total, count = Counter(), Counter()
+    for name, microseconds in times.items():
+        total[subsystem(name)] += microseconds
+        count[subsystem(name)] += 1
+    return total, count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("module", nargs="?", default="src.gui.main_window")
+    parser.add_argument("--runs", type=int, default=3, help="interpreters to start; the fastest run is reported")
+    parser.add_argument("--top", type=int, default=10, help="slowest modules to list")
+    parser.add_argument("--budget-ms", type=float, default=None, help="fail if the imports take longer")
+    parser.add_argument("--forbid", default=",".join(STARTUP_FORBIDDEN),
+                        help="comma-separated subsystems that must not be imported ('' to allow all)")
+    args = parser.parse_args(argv)
+
+    project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    startup_modules = measure(None, project_root)
+    runs = [{name: microseconds for name, microseconds in measure(args.module, project_root).items()
+             if name not in startup_modules} for _ in range(max(args.runs, 1))]
+    times = min(runs, key=lambda run: sum(run.values()))
+    total, count = summarize(times)
+    total_ms = sum(total.values()) / 1000
+
+    print(f"Import time for {args.module}: {total_ms:.0f} ms, {len(times)} modules")
+    print(f"  {'subsystem':<16}{'ms':>8}{'modules':>9}")
+    for name in list(SUBSYSTEMS) + [OTHER]:
+        print(f"  {name:<16}{total[name] / 1000:>8.1f}{count[name]:>9}")
+    print("Slowest modules (own time):")
+    for name, microseconds in sorted(times.items(), key=lambda item: -item[1])[:args.top]:
+        print(f"  {microseconds / 1000:>8.1f} ms  {name}  [{subsystem(name)}]")
+
+    problems = [f"{name} was imported ({count[name]} modules)"
+                for name in filter(None, (part.strip() for part in args.forbid.split(","))) if count[name]]
+    if args.budget_ms is not None and total_ms > args.budget_ms:
+        problems.append(f"imports took {total_ms:.0f} ms, over the {args.budget_ms:.0f} ms budget")
+    for problem in problems:
+        print(f"FAIL: {problem}")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,79 @@
+# src/utils/row_fingerprint.py
+
+import hashlib
+
+import numpy as np
+import pandas as pd
+
+
+def normalize_cell(value):
+    """
+    Returns the text a cell compares as. Google Sheets returns every cell as a string,
+    while Excel-loaded data has typed cells, so 3.0, "3" and " 3 " all normalize to "3"
+    and a midnight timestamp to its date.
+    """
+    if value is None or value is pd.NaT:
+        return ""
+    if isinstance(value, float):
+        if np.isnan(value):
+            return ""
+        if value.is_integer():
+            return str(int(value))
+    if isinstance(value, pd.Timestamp):
+        if value == value.normalize():
+            return value.strftime("%Y-%m-%d")
+        return value.isoformat(sep=" ")
+    return str(value).strip()
+
+
+def normalized_frame(df, columns):
+    """Returns `df[columns]` with every cell normalized to text."""
+    normalized = {}
+    for column in columns:
+        series = df[column] if column in df.columns else pd.Series("", index=df.index)
+        normalized[column] = _normalized_column(series)
+    return pd.DataFrame(normalized, index=df.index)
+
+
+def _normalized_column(series):
+    # Fast paths for the common column types; anything else goes cell by cell
+    kind = pd.api.types.infer_dtype(series, skipna=False)
+    if kind == "string":
+        return series.str.strip()
+    if pd.api.types.is_datetime64_any_dtype(series) and series.dt.tz is None:
+        values = series.to_numpy()
+        days = values.astype("datetime64[D]")
+        missing = series.isna().to_numpy()
+        if ((values == days) | missing).all():
+            text = days.astype(str).astype(object)
+            text[missing] = ""
+            return pd.Series(text, index=series.index)
+    return series.map(normalize_cell).astype(object)
+
+
+class TableFingerprint:
+    """
+    Per-row hashes of a table's normalized cells plus a digest of the whole table.
+
+    Two tables with the same digest hold the same data, so checking for remote changes
+    is a single comparison; otherwise diff() lists the rows that differ.
+    """
+
+    def __init__(self, df, columns=None, keep_values=False):
+        self.columns = tuple(df.columns if columns is None else columns)
+        self.values = [] if keep_values else None  # Normalized rows as tuples, if requested
+        if len(df):
+            frame = normalized_frame(df, self.columns)
+            self.rows = pd.util.hash_pandas_object(frame, index=False).to_numpy()
+            if keep_values:
+                self.values = list(frame.itertuples(index=False, name=None))
+        else:
+            self.rows = np.empty(0, dtype=np.uint64)
+
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update("\x1f".join(str(column) for column in self.columns).encode("utf-8"))
+        digest.update(self.rows.tobytes())
+        self.digest = digest.hexdigest()
+
+    def __len__(self):
+        return len(self.rows)
@@ -0,0 +1,139 @@
+# src/utils/search_index.py
+
+import math
+from collections import defaultdict
+
+import pandas as pd
+
+SEARCH_COLUMNS = ["Company", "Position", "Application Portal URL", "Date Applied", "Status"]
+NGRAM_SIZE = 3
+
+
+def cell_text(value):
+    """Lower-cased text of a cell as searched; empty cells (None, NaN, NaT) have no text."""
+    if value is None or value is pd.NaT or (isinstance(value, float) and math.isnan(value)):
+        return ""
+    return str(value).lower()
+
+
+def row_text(values):
+    """Searchable text of a row; columns are kept apart so matches never span two cells."""
+    return "\n".join(cell_text(value) for value in values)
+
+
+def ngrams(text):
+    return {text[i:i + NGRAM_SIZE] for i in range(len(text) - NGRAM_SIZE + 1)}
+
+
+class SearchIndex:
+    """
+    Trigram index over the searchable columns of the applications DataFrame.
+
+    Each row gets an internal document id, so deleting rows does not renumber the
+    postings of the rows after them. A query intersects the postings of its trigrams
+    and confirms the substring on the few remaining rows; a query that extends the
+    previous one only re-checks the previous result.
+
+    `version` changes on every modification, so callers can cache data derived from the rows.
+    """
+
+    def __init__(self):
+        self.version = 0
+        self._reset()
+
+    def _reset(self):
+        self._texts = {}  # doc id -> row text
+        self._postings = defaultdict(set)  # trigram -> doc ids
+        self._doc_ids = []  # doc id of each DataFrame position
+        self._positions = None  # doc id -> position, rebuilt lazily after deletes
+        self._next_doc_id = 0
+        self._last_term = None
+        self._last_docs = None
+
+    def build(self, df):
+        """Indexes every row of `df`, replacing the current contents."""
+        self._reset()
+        self._add(self._column_rows(df, range(len(df))))
+
+    def add_rows(self, df, positions):
+        """Indexes the rows of `df` at `positions`, which were appended at the end."""
+        self._add(self._column_rows(df, positions))
+
+    def update_row(self, df, position):
+        """Re-indexes the row of `df` at `position` after one of its cells changed."""
+        doc_id = self._doc_ids[position]
+        self._unindex(doc_id)
+        text = row_text(next(self._column_rows(df, [position])))
+        self._index(doc_id, text)
+        self._changed()
+
+    def delete_rows(self, positions):
+        """Removes the rows at `positions` (before deletion) from the index."""
+        for position in sorted({int(position) for position in positions}, reverse=True):
+            if 0 <= position < len(self._doc_ids):
+                self._unindex(self._doc_ids.pop(position))
+        self._positions = None
+        self._changed()
+
+    def search(self, term):
+        """Returns the sorted DataFrame positions of the rows containing `term` (case-insensitive)."""
+        term = term.strip().lower()
+        if not term:
+            return list(range(len(self._doc_ids)))
+
+        if self._last_term is not None and self._last_term in term:
+            # The user kept typing: the new matches are a subset of the previous ones
+            candidates = self._last_docs
+        elif len(term) >= NGRAM_SIZE:
+            postings = sorted((self._postings.get(gram, set()) for gram in ngrams(term)), key=len)
+            candidates = set.intersection(*postings) if postings else set()
+        else:
+            candidates = self._texts.keys()
+
+        docs = {doc_id for doc_id in candidates if term in self._texts[doc_id]}
+        self._last_term, self._last_docs = term, docs
+        positions = self._position_map()
+        return sorted(positions[doc_id] for doc_id in docs)
+
+    def __len__(self):
+        return len(self._doc_ids)
+
+    def _column_rows(self, df, positions):
+        columns = [col for col in SEARCH_COLUMNS if col in df.columns]
+        return df[columns].iloc[list(positions)].itertuples(index=False, name=None)
+
+    def _add(self, rows):
+        if self._positions is None:
+            self._position_map()
+        for values in rows:
+            doc_id = self._next_doc_id
+            self._next_doc_id += 1
+            self._positions[doc_id] = len(self._doc_ids)
+            self._doc_ids.append(doc_id)
+            self._index(doc_id, row_text(values))
+        self._changed()
+
+    def _index(self, doc_id, text):
+        self._texts[doc_id] = text
+        for gram in ngrams(text):
+            self._postings[gram].add(doc_id)
+
+    def _unindex(self, doc_id):
+        text = self._texts.pop(doc_id, "")
+        for gram in ngrams(text):
+            docs = self._postings.get(gram)
+            if docs is not None:
+                docs.discard(doc_id)
+                if not docs:
+                    del self._postings[gram]
+
+    def _position_map(self):
+        if self._positions is None:
+            self._positions = {doc_id: position for position, doc_id in enumerate(self._doc_ids)}
+        return self._positions
+
+    def _changed(self):
+        # Cached results describe the old rows
+        self.version += 1
+        self._last_term = None
+        self._last_docs = None
@@ -0,0 +1,197 @@
+# src/utils/search_query.py
+
+import logging
+import re
+from collections import namedtuple
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from src.utils.search_index import cell_text
+
+# Field names accepted in queries, mapped to DataFrame columns
+FIELD_ALIASES = {
+    "company": "Company",
+    "position": "Position",
+    "role": "Position",
+    "title": "Position",
+    "url": "Application Portal URL",
+    "portal": "Application Portal URL",
+    "applied": "Date Applied",
+    "date": "Date Applied",
+    "status": "Status",
+}
+
+# Columns compared as dates rather than as text
+DATE_COLUMNS = {"Date Applied"}
+
+COMPILED_QUERY_CACHE_SIZE = 256
+
+# [-]field<op>value, where the value may be "quoted"; anything else is a plain word
+TOKEN_RE = re.compile(r'(-?)(?:([A-Za-z_]+)(>=|<=|!=|:|=|>|<))?(?:"([^"]*)"?|(\S*))')
+
+Term = namedtuple("Term", ["column", "op", "values", "negate"])
+Query = namedtuple("Query", ["terms", "words", "excluded_words", "plain_text"])
+
+
+class QuerySyntaxError(ValueError):
+    """Raised for a query that cannot be compiled, e.g. an invalid date."""
+
+
+@lru_cache(maxsize=COMPILED_QUERY_CACHE_SIZE)
+def compile_query(text):
+    """
+    Parses a search-bar query such as
+        status:Interview company:acme applied>=2024-06-01 -status:Rejected
+    into a Query. Supported forms:
+      - `field:value` matches cells containing the value; `field:a,b` matches either value.
+      - `field=value` and `field!=value` match whole cells; for Date Applied, the same day.
+      - `field>value`, `>=`, `<`, `<=` compare dates for Date Applied and text otherwise.
+      - A leading `-` negates a term; "double quotes" keep spaces inside a value.
+      - Other words must all appear somewhere in the row.
+    All matching is case-insensitive. Compiled queries are cached.
+    """
+    text = text.strip().lower()
+    terms, words, excluded_words = [], [], []
+    structured = False
+
+    for match in TOKEN_RE.finditer(text):
+        negate, field, op, quoted, bare = match.groups()
+        value = quoted if quoted is not None else bare
+        column = FIELD_ALIASES.get(field) if field else None
+
+        if field and column is None:
+            # Not a known field (e.g. part of a URL), so search for the token as written
+            value = match.group(0)[len(negate):]
+            op = None
+        if negate or column or quoted is not None:
+            structured = True
+
+        if column is None:
+            if value:
+                (excluded_words if negate else words).append(value)
+            continue
+        if not value:
+            continue  # Still being typed, e.g. "status:"
+
+        if op == ":":
+            values = tuple(part for part in value.split(",") if part)
+        else:
+            values = (_comparison_value(column, op, value),)
+        terms.append(Term(column, op, values, bool(negate)))
+
+    # Unstructured input keeps the plain substring search, spaces included
+    plain_text = text if not structured else None
+    return Query(tuple(terms), tuple(words), tuple(excluded_words), plain_text)
+
+
+def _comparison_value(column, op, value):
+    if column not in DATE_COLUMNS:
+        return value
+    date = pd.to_datetime(value, errors="coerce")
+    if pd.isna(date):
+        raise QuerySyntaxError(f"Invalid date in query: {value}")
+    return date
+
+
+class QueryEngine:
+    """
+    Runs compiled queries against the applications DataFrame as vectorized boolean masks.
+
+    Each column is factorized into codes and distinct lower-cased texts (and parsed dates)
+    once per data version (the SearchIndex's version, which changes on every edit), so a
+    term is tested once per distinct value and broadcast to the rows through the codes.
+    Plain words are answered by the SearchIndex.
+    """
+
+    def __init__(self):
+        self._columns = {}
+        self._columns_key = None
+
+    def search(self, df, search_index, text):
+        """
+        Returns the sorted positions of the rows of `df` matching `text`,
+        or None if the query is not valid (e.g. half-typed).
+        """
+        try:
+            query = compile_query(text)
+        except QuerySyntaxError as e:
+            logging.debug(f"Ignoring search query: {e}")
+            return None
+
+        if query.plain_text is not None:
+            return search_index.search(query.plain_text)
+
+        self._check_version(df, search_index)
+        mask = np.ones(len(df), dtype=bool)
+        for word in query.words:
+            mask &= self._word_mask(search_index, word, len(df))
+        for word in query.excluded_words:
+            mask &= ~self._word_mask(search_index, word, len(df))
+        for term in query.terms:
+            if term.column not in df.columns:
+                continue
+            term_mask = self._term_mask(df, term)
+            mask &= ~term_mask if term.negate else term_mask
+        return np.flatnonzero(mask).tolist()
+
+    def _check_version(self, df, search_index):
+        key = (id(df), len(df), id(search_index), search_index.version)
+        if key != self._columns_key:
+            self._columns = {}
+            self._columns_key = key
+
+    @staticmethod
+    def _word_mask(search_index, word, length):
+        mask = np.zeros(length, dtype=bool)
+        mask[search_index.search(word)] = True
+        return mask
+
+    def _text_column(self, df, column):
+        """Returns (codes, distinct lower-cased texts) of a column; terms are evaluated per distinct text."""
+        key = ("text", column)
+        if key not in self._columns:
+            codes, uniques = pd.factorize(np.array([cell_text(value) for value in df[column]], dtype=object))
+            self._columns[key] = (codes, np.asarray(uniques, dtype=object))
+        return self._columns[key]
+
+    def _date_column(self, df, column):
+        key = ("date", column)
+        if key not in self._columns:
+            codes, uniques = self._text_column(df, column)
+            dates = pd.to_datetime(pd.Series(uniques, dtype=object), errors="coerce", format="mixed")
+            self._columns[key] = (codes, dates.to_numpy())
+        return self._columns[key]
+
+    def _term_mask(self, df, term):
+        value = term.values[0]
+        if term.op == ":":
+            codes, uniques = self._text_column(df, term.column)
+            hits = np.array([any(part in text for part in term.values) for text in uniques], dtype=bool)
+        elif term.op in ("=", "!="):
+            if isinstance(value, pd.Timestamp):
+                # Cells read from a workbook are Timestamps, typed ones text; compare the days
+                codes, uniques = self._date_column(df, term.column)
+                hits = uniques.astype("datetime64[D]") == np.datetime64(value.date())
+            else:
+                codes, uniques = self._text_column(df, term.column)
+                hits = uniques == value
+            if term.op == "!=":
+                hits = ~hits
+        else:
+            if isinstance(value, pd.Timestamp):
+                # Rows without a valid date never match a date comparison
+                codes, uniques = self._date_column(df, term.column)
+                value = value.to_datetime64()
+            else:
+                codes, uniques = self._text_column(df, term.column)
+            if term.op == ">":
+                hits = uniques > value
+            elif term.op == ">=":
+                hits = uniques >= value
+            elif term.op == "<":
+                hits = uniques < value
+            else:
+                hits = uniques <= value
+        return np.asarray(hits, dtype=bool)[codes]
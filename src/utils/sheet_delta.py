@@ -0,0 +1,54 @@
+# src/utils/sheet_delta.py
+
+from collections import namedtuple
+
+# Changes that turn one side's rows into the merged rows, in data-row indices
+# (0 is the first row under the header):
+#   delete_ranges  [start, stop) ranges of the side's rows as they are before the changes
+#   inserts        (position, values) rows inserted between existing rows, in final positions
+#   updates        (position, first column index, values) cell spans, in final positions
+#   appends        rows added after the last existing row
+SheetDelta = namedtuple("SheetDelta", ["delete_ranges", "inserts", "updates", "appends"])
+
+# A merged row and the positions of the rows it came from on each side (None if absent)
+MergedRow = namedtuple("MergedRow", ["values", "local", "remote"])
+
+
+def coalesce_ranges(indices):
+    """Turns row indices into sorted [start, stop) ranges of consecutive rows."""
+    ranges = []
+    for index in sorted(indices):
+        if ranges and ranges[-1][1] == index:
+            ranges[-1][1] = index + 1
+        else:
+            ranges.append([index, index + 1])
+    return [tuple(r) for r in ranges]
+
+
+def is_empty(delta):
+    return not (delta.delete_ranges or delta.inserts or delta.updates or delta.appends)
+
+
+def delta_to_merged(rows, merged, side):
+    """
+    Returns the SheetDelta that turns `rows` (one side's normalized rows) into `merged`.
+    `side` is "local" or "remote" and selects which MergedRow position refers to `rows`.
+    """
+    positions = [getattr(row, side) for row in merged]
+    kept = {position for position in positions if position is not None}
+    delete_ranges = coalesce_ranges(position for position in range(len(rows)) if position not in kept)
+    last_kept = max((index for index, position in enumerate(positions) if position is not None), default=-1)
+
+    inserts, updates, appends = [], [], []
+    for index, (row, position) in enumerate(zip(merged, positions)):
+        if position is None:
+            if index > last_kept:
+                appends.append(list(row.values))
+            else:
+                inserts.append((index, list(row.values)))
+            continue
+        changed = [column for column, (old, new) in enumerate(zip(rows[position], row.values)) if old != new]
+        if changed:
+            first, last = min(changed), max(changed)
+            updates.append((index, first, list(row.values[first:last + 1])))
+    return SheetDelta(delete_ranges, inserts, updates, appends)
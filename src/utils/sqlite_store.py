@@ -0,0 +1,211 @@
+# src/utils/sqlite_store.py
+
+import logging
+import os
+import sqlite3
+import threading
+
+import pandas as pd
+from src.utils.file_io import APPLICATION_COLUMNS, read_applications_from_excel, save_applications_to_excel
+
+# Maps DataFrame columns to SQLite column names
+COLUMN_MAP = {
+    "Company": "company",
+    "Position": "position",
+    "Application Portal URL": "url",
+    "Date Applied": "date_applied",
+    "Status": "status",
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS applications (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    company TEXT,
+    position TEXT,
+    url TEXT,
+    date_applied TEXT,
+    status TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_applications_company ON applications (company);
+CREATE INDEX IF NOT EXISTS idx_applications_status ON applications (status);
+CREATE INDEX IF NOT EXISTS idx_applications_date_applied ON applications (date_applied);
+"""
+
+# PRAGMA user_version once Applications.xlsx has been imported (0: not yet)
+IMPORTED_VERSION = 1
+
+
+def to_db_value(value):
+    """Converts a DataFrame cell into a value stored in SQLite."""
+    if value is None:
+        return None
+    try:
+        if pd.isna(value):
+            return None
+    except (TypeError, ValueError):
+        pass
+    if isinstance(value, pd.Timestamp):
+        return value.strftime("%Y-%m-%d")
+    return str(value)
+
+
+class SQLiteApplicationStore:
+    """
+    Storage engine that keeps applications in a SQLite database.
+
+    The GUI addresses rows by position, so the store keeps the row id of every
+    position and turns each edit into a single-row INSERT, UPDATE or DELETE.
+
+    Applications.xlsx is imported once, the first time the database is used, and the
+    database records that it was (PRAGMA user_version). An emptied database stays empty.
+    """
+
+    def __init__(self, db_path, excel_path=None):
+        self.db_path = db_path
+        self.excel_path = excel_path
+        self._row_ids = []
+        self._lock = threading.Lock()
+        self.transactions = 0
+
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+
+        self._import_pending = self.conn.execute("PRAGMA user_version").fetchone()[0] < IMPORTED_VERSION
+        if self._import_pending and self.conn.execute("SELECT COUNT(*) FROM applications").fetchone()[0]:
+            self._mark_imported()  # Filled before the import was recorded
+
+    def load(self):
+        """Returns all applications as a DataFrame, importing Applications.xlsx into a new database."""
+        self._import_excel_once()
+        columns = ", ".join(COLUMN_MAP.values())
+        with self._lock:
+            rows = self.conn.execute(f"SELECT id, {columns} FROM applications ORDER BY id").fetchall()
+        self._row_ids = [row[0] for row in rows]
+        values = [["" if value is None else value for value in row[1:]] for row in rows]
+        return pd.DataFrame(values, columns=APPLICATION_COLUMNS)
+
+    def iter_batches(self, batch_size=1000, progress_callback=None):
+        """Yields all applications in batches of up to `batch_size` rows."""
+        self._import_excel_once()
+        with self._lock:
+            total_rows = self.conn.execute("SELECT COUNT(*) FROM applications").fetchone()[0]
+
+        columns = ", ".join(COLUMN_MAP.values())
+        # A separate cursor keeps reading consistent while the GUI thread commits edits
+        cursor = sqlite3.connect(self.db_path).execute(f"SELECT id, {columns} FROM applications ORDER BY id")
+        row_ids = []
+        try:
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                row_ids.extend(row[0] for row in rows)
+                values = [["" if value is None else value for value in row[1:]] for row in rows]
+                yield pd.DataFrame(values, columns=APPLICATION_COLUMNS)
+                if progress_callback:
+                    progress_callback(len(row_ids), total_rows)
+        finally:
+            cursor.connection.close()
+        self._row_ids = row_ids
+        if not row_ids:
+            yield pd.DataFrame(columns=APPLICATION_COLUMNS)
+
+    def finish_load(self, df):
+        return df  # Every row is already stored
+
+    def compact(self, df=None):
+        pass  # Every change is already in the database
+
+    def append_rows(self, df, count=1):
+        """Inserts the last `count` rows of `df`."""
+        placeholders = ", ".join("?" for _ in COLUMN_MAP)
+        sql = f"INSERT INTO applications ({', '.join(COLUMN_MAP.values())}) VALUES ({placeholders})"
+        new_rows = df[APPLICATION_COLUMNS].tail(count)
+        with self._lock, self.conn:
+            for values in new_rows.itertuples(index=False):
+                cursor = self.conn.execute(sql, [to_db_value(value) for value in values])
+                self._row_ids.append(cursor.lastrowid)
+            self.transactions += 1
+
+    def update_cell(self, df, position, column):
+        """Writes the value at (`position`, `column`) of `df` to its row."""
+        if column not in COLUMN_MAP:
+            return
+        value = to_db_value(df.iloc[position][column])
+        with self._lock, self.conn:
+            self.conn.execute(
+                f"UPDATE applications SET {COLUMN_MAP[column]} = ? WHERE id = ?",
+                (value, self._row_ids[position])
+            )
+            self.transactions += 1
+
+    def delete_rows(self, df, positions):
+        """Deletes the rows that were at `positions` before they were removed from `df`."""
+        positions = sorted({int(position) for position in positions if 0 <= int(position) < len(self._row_ids)},
+                           reverse=True)
+        if not positions:
+            return
+        row_ids = [self._row_ids[position] for position in positions]
+        with self._lock, self.conn:
+            self.conn.executemany("DELETE FROM applications WHERE id = ?", [(row_id,) for row_id in row_ids])
+            self.transactions += 1
+        for position in positions:
+            del self._row_ids[position]
+
+    def replace_all(self, df):
+        """Replaces the stored applications with the contents of `df`."""
+        placeholders = ", ".join("?" for _ in COLUMN_MAP)
+        sql = f"INSERT INTO applications ({', '.join(COLUMN_MAP.values())}) VALUES ({placeholders})"
+        frame = df.reindex(columns=APPLICATION_COLUMNS)
+        with self._lock, self.conn:
+            self.conn.execute("DELETE FROM applications")
+            self._row_ids = []
+            for values in frame.itertuples(index=False):
+                cursor = self.conn.execute(sql, [to_db_value(value) for value in values])
+                self._row_ids.append(cursor.lastrowid)
+            self.transactions += 1
+
+    def import_from_excel(self, file_path):
+        """Replaces the stored applications with the contents of an Applications.xlsx workbook."""
+        try:
+            self.replace_all(read_applications_from_excel(file_path))
+            self._mark_imported()
+        except Exception as e:
+            print(f"Error: Could not import {file_path} into SQLite. {str(e)}")
+            logging.error(f"Error: Could not import {file_path} into SQLite. {str(e)}")
+            raise
+
+    def _import_excel_once(self):
+        """Imports Applications.xlsx if the database has never been filled from it."""
+        if not self._import_pending:
+            return
+        if self.excel_path and os.path.exists(self.excel_path):
+            print(f"Importing {self.excel_path} into {self.db_path}.")
+            self.import_from_excel(self.excel_path)
+        else:
+            self._mark_imported()  # Nothing to import; start empty
+
+    def _mark_imported(self):
+        with self._lock, self.conn:
+            self.conn.execute(f"PRAGMA user_version = {IMPORTED_VERSION}")
+        self._import_pending = False
+
+    def export_to_excel(self, file_path):
+        """Writes the stored applications to an Applications.xlsx-format workbook."""
+        columns = ", ".join(COLUMN_MAP.values())
+        with self._lock:
+            rows = self.conn.execute(f"SELECT {columns} FROM applications ORDER BY id").fetchall()
+        save_applications_to_excel(pd.DataFrame(rows, columns=APPLICATION_COLUMNS), file_path)
+
+    def flush(self, timeout=None):
+        return True  # Every change is committed in its own transaction
+
+    def close(self, timeout=None):
+        with self._lock:
+            self.conn.close()
+
+    def stats(self):
+        return {"backend": "sqlite", "transactions": self.transactions, "rows": len(self._row_ids)}
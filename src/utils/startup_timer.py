@@ -0,0 +1,29 @@
+# src/utils/startup_timer.py
+
+import logging
+import time
+
+
+class StartupTimer:
+    """
+    Records when startup milestones are reached, in seconds since `started`
+    (a time.perf_counter() value taken as early as possible, at the top of app.py).
+
+    The main window marks "first_paint" once its shell has been drawn and "interactive"
+    once the applications are loaded and every control responds.
+    """
+
+    def __init__(self, started=None):
+        self.started = started if started is not None else time.perf_counter()
+        self.marks = {}
+
+    def mark(self, name):
+        """Records the first time `name` is reached and returns its offset; later calls keep the first."""
+        return self.marks.setdefault(name, time.perf_counter() - self.started)
+
+    def report(self):
+        """Prints and logs the milestones reached so far."""
+        text = ", ".join(f"{name} {seconds * 1000:.0f} ms" for name, seconds in self.marks.items())
+        print(f"Startup: {text}")
+        logging.info(f"Startup: {text}")
+        return text
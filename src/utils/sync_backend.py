@@ -0,0 +1,426 @@
+# src/utils/sync_backend.py
+
+import random
+import re
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+from src.utils.sheet_delta import coalesce_ranges
+
+# Rows per read or write request; larger transfers are split and run concurrently
+CHUNK_ROWS = 5000
+MAX_PARALLEL_REQUESTS = 4
+
+# The footprint cells start this many columns right of the data, leaving a blank column between
+FOOTPRINT_GAP = 2
+
+A1_RE = re.compile(r"^(?:(?P<sheet>[^!]+)!)?(?P<col1>[A-Z]+)(?P<row1>\d+)?(?::(?P<col2>[A-Z]+)(?P<row2>\d+)?)?$")
+
+
+def sheet_value(value):
+    """Converts a DataFrame cell into a value the Sheets API accepts; empty cells become ''."""
+    if type(value) is str:
+        return value
+    if value is None:
+        return ''
+    import pandas as pd
+    try:
+        if pd.isna(value):
+            return ''
+    except (TypeError, ValueError):
+        pass
+    if isinstance(value, pd.Timestamp):
+        return value.strftime('%Y-%m-%d')
+    if hasattr(value, 'item'):
+        return value.item()  # NumPy scalar
+    return value if isinstance(value, (str, int, float, bool)) else str(value)
+
+
+def sheet_rows(rows):
+    return [[sheet_value(value) for value in row] for row in rows]
+
+
+def column_letter(index):
+    """Returns the A1 column letter for a zero-based column index (A-Z)."""
+    return chr(ord('A') + index)
+
+
+def column_index(letters):
+    """Returns the zero-based column index of A1 column letters, e.g. 0 for "A" and 26 for "AA"."""
+    index = 0
+    for letter in letters:
+        index = index * 26 + ord(letter) - ord('A') + 1
+    return index - 1
+
+
+def parse_a1(range_name):
+    """
+    Parses an A1 range such as "Sheet1!B3:D3" or "Sheet1!A1:E" into
+    (sheet, first column, first row, last column, last row), all zero-based and inclusive;
+    a missing row means the range is open-ended.
+    """
+    match = A1_RE.match(range_name)
+    if not match:
+        raise ValueError(f"Unsupported range: {range_name}")
+    first_column = column_index(match.group("col1"))
+    last_column = column_index(match.group("col2")) if match.group("col2") else first_column
+    first_row = int(match.group("row1")) - 1 if match.group("row1") else 0
+    if match.group("row2"):
+        last_row = int(match.group("row2")) - 1
+    elif match.group("col2") or not match.group("row1"):
+        last_row = None
+    else:
+        last_row = first_row
+    return match.group("sheet"), first_column, first_row, last_column, last_row
+
+
+def row_structure_requests(sheet_id, deletes, inserts):
+    """Returns the spreadsheets.batchUpdate requests that delete and then insert sheet rows."""
+    requests = [{
+        'deleteDimension': {
+            'range': {'sheetId': sheet_id, 'dimension': 'ROWS', 'startIndex': start, 'endIndex': stop}
+        }
+    } for start, stop in deletes]
+    requests += [{
+        'insertDimension': {
+            'range': {'sheetId': sheet_id, 'dimension': 'ROWS', 'startIndex': start, 'endIndex': stop},
+            'inheritFromBefore': True
+        }
+    } for start, stop in inserts]
+    return requests
+
+
+class SheetsBackend:
+    """
+    Sync operations on one sheet range, built on a handful of Sheets API primitives.
+
+    Subclasses talk to a concrete service by implementing:
+      get_values(range_name)            -> rows of cell values, trailing empty cells and rows omitted
+      batch_update_values(data)         writes [(range_name, rows)] in one request
+      append_values(rows)               adds rows after the last row of the table in one request
+      clear_values(range_name)
+      update_row_structure(deletes, inserts)
+                                        deletes then inserts sheet rows, as zero-based [start, stop)
+                                        ranges (deletes bottom-up, inserts top-down), in one request
+      row_count()                       -> number of rows in the sheet's grid, filled or not
+    and calling _count_request() once per request. The primitives must be safe to call from
+    several threads: large reads and writes are split into chunks of `chunk_rows` rows that
+    run concurrently on a pool of `max_parallel` threads and are reassembled in order.
+    `requests` counts the API requests made; `budget` (a TokenBucket) paces them if set, and
+    `progress(done, total, action)` is called from the pool as chunks complete.
+
+    Writes can also store a footprint, (row count, digest) of the data, in two cells of the
+    first row beside the range; reading it back is a cheap way to notice remote changes.
+
+    After close() no further request or chunk starts; they raise RuntimeError instead. A
+    request already under way is only interrupted by backends that set `cancels_requests`
+    (the asyncio one); with the others it runs to completion or its timeout.
+    """
+
+    cancels_requests = False
+
+    def __init__(self, spreadsheet_id, range_name, chunk_rows=CHUNK_ROWS, max_parallel=MAX_PARALLEL_REQUESTS):
+        self.spreadsheet_id = spreadsheet_id
+        self.range_name = range_name
+        self.sheet_name = range_name.split('!')[0]
+        _, self.first_column, _, self.last_column, _ = parse_a1(range_name)
+        self.chunk_rows = chunk_rows
+        self.max_parallel = max_parallel
+        self.budget = None
+        self.progress = None
+        self.requests = 0
+        self._requests_lock = threading.Lock()
+        self._executor = None
+        self._closed = False
+
+    def read(self):
+        """
+        Returns the range as a DataFrame with the first row as the header; empty if the sheet is blank.
+        Every read, the first one included, asks for the grid size and downloads it in row windows.
+        """
+        values = self._read_chunks()
+        import pandas as pd
+        if not values:
+            return pd.DataFrame()
+        return pd.DataFrame(values[1:], columns=values[0])
+
+    def footprint_range(self):
+        first = self.last_column + FOOTPRINT_GAP
+        return f"{self.sheet_name}!{column_letter(first)}1:{column_letter(first + 1)}1"
+
+    def read_footprint(self):
+        """Returns the stored footprint as a tuple of strings, or None if there is none."""
+        values = self.get_values(self.footprint_range())
+        return tuple(str(value) for value in values[0]) if values and values[0] else None
+
+    def write_footprint(self, footprint):
+        self.batch_update_values([(self.footprint_range(), [list(footprint)])])
+
+    def fingerprint(self):
+        """Returns the TableFingerprint of the sheet's data."""
+        from src.utils.row_fingerprint import TableFingerprint
+        df = self.read()
+        return TableFingerprint(df)
+
+    def rewrite(self, df, footprint=None):
+        """
+        Replaces the sheet's data with `df`. The new data overwrites the old in place and
+        only rows left below it are cleared, so the sheet is never empty in between.
+        """
+        values = [df.columns.values.tolist()] + sheet_rows(df.values.tolist())
+        first, last = column_letter(self.first_column), column_letter(self.first_column + max(len(df.columns), 1) - 1)
+        chunks = [[(f"{self.sheet_name}!{first}{start + 1}", values[start:start + self.chunk_rows])]
+                  for start in range(0, len(values), self.chunk_rows)]
+        if footprint is not None:
+            chunks[0].append((self.footprint_range(), [list(footprint)]))
+        self._run_chunks(self.batch_update_values, chunks, "Uploading")
+        self.clear_values(f"{self.sheet_name}!{first}{len(values) + 1}:{last}")
+
+    def push_delta(self, delta, footprint=None):
+        """
+        Applies a SheetDelta: deleted rows are removed and rows for interior inserts opened
+        in one structural request, edited cells and inserted rows are written in batches
+        and new rows are added at the end with appends. A footprint goes with the last
+        batch of values, or in a request of its own if there are none.
+        """
+        if delta.delete_ranges or delta.inserts:
+            # +1 skips the header row
+            deletes = [(start + 1, stop + 1) for start, stop in reversed(delta.delete_ranges)]
+            inserts = [(start + 1, stop + 1) for start, stop in coalesce_ranges(row for row, _ in delta.inserts)]
+            self.update_row_structure(deletes, inserts)
+
+        cells = list(delta.updates) + [(row, 0, values) for row, values in delta.inserts]
+        if cells:
+            data = []
+            for row, first_column, values in cells:
+                sheet_row = row + 2  # Sheet rows are 1-based and row 1 is the header
+                first_column += self.first_column
+                last_column = first_column + len(values) - 1
+                data.append((f"{self.sheet_name}!{column_letter(first_column)}{sheet_row}:"
+                             f"{column_letter(last_column)}{sheet_row}", sheet_rows([values])))
+            chunks = [data[start:start + self.chunk_rows] for start in range(0, len(data), self.chunk_rows)]
+            if footprint is not None:
+                chunks[-1].append((self.footprint_range(), [list(footprint)]))
+            self._run_chunks(self.batch_update_values, chunks, "Uploading")
+        elif footprint is not None:
+            self.write_footprint(footprint)
+
+        # Appends land after the last row, so they go one after another to keep their order
+        for start in range(0, len(delta.appends), self.chunk_rows):
+            self.append_values(sheet_rows(delta.appends[start:start + self.chunk_rows]))
+
+    def switch_spreadsheet(self, spreadsheet_id):
+        """Sends later requests to another spreadsheet."""
+        self.spreadsheet_id = spreadsheet_id
+
+    def close(self):
+        """Stops the chunk threads and refuses later requests and chunks with RuntimeError."""
+        self._closed = True
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _check_open(self):
+        if self._closed:
+            raise RuntimeError("The Google Sheets connection is closed.")
+
+    def _count_request(self):
+        self._check_open()
+        if self.budget is not None:
+            self.budget.acquire(1)
+        with self._requests_lock:
+            self.requests += 1
+
+    def _read_chunks(self):
+        # The grid size bounds the data; chunks past the data come back empty
+        total = self.row_count()
+        first, last = column_letter(self.first_column), column_letter(self.last_column)
+        ranges = [f"{self.sheet_name}!{first}{start + 1}:{last}{min(start + self.chunk_rows, total)}"
+                  for start in range(0, max(total, 1), self.chunk_rows)]
+        chunks = self._run_chunks(self.get_values, ranges, "Downloading")
+
+        values = []
+        for chunk in chunks:
+            # Trailing empty rows are omitted per chunk; restore them so later chunks keep their positions
+            values.extend(chunk + [[]] * (self.chunk_rows - len(chunk)))
+        while values and not values[-1]:
+            values.pop()
+        return values
+
+    def _run_chunks(self, func, chunks, action):
+        """Calls `func` on every chunk, concurrently when there are several, and returns the results in order."""
+        self._check_open()
+        if len(chunks) <= 1:
+            return [func(chunk) for chunk in chunks]
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(self.max_parallel, thread_name_prefix="SheetsChunk")
+        done, done_lock = [0], threading.Lock()
+
+        def run(chunk):
+            result = func(chunk)
+            if self.progress is not None:
+                with done_lock:
+                    done[0] += 1
+                    count = done[0]
+                self.progress(count, len(chunks), action)
+            return result
+
+        return list(self._executor.map(run, chunks))
+
+
+class FakeSheetsError(Exception):
+    """An injected API failure; `resp.status` mirrors googleapiclient's HttpError."""
+
+    def __init__(self, status, message):
+        super().__init__(f"<HttpError {status}: {message}>")
+        self.resp = SimpleNamespace(status=status)
+
+
+class FakeSheetsBackend(SheetsBackend):
+    """
+    In-process stand-in for a Google Sheets range, for measuring and checking sync offline.
+
+    Cells are kept as the strings the API returns for RAW input, reads omit trailing
+    empty cells and rows, and appends land after the last non-empty row. Every request
+    can be slowed down (`latency` seconds plus up to `jitter`), fail at random
+    (`failure_rate`, as HTTP 503) or exceed a per-minute quota (`quota`, as HTTP 429);
+    fail_next() queues specific failures. Safe to use from several threads.
+    """
+
+    def __init__(self, rows=None, spreadsheet_id="fake", range_name="Sheet1!A1:E",
+                 latency=0.0, jitter=0.0, failure_rate=0.0, quota=None, seed=None, **kwargs):
+        super().__init__(spreadsheet_id, range_name, **kwargs)
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self.quota = quota  # Requests per minute, or None for no limit
+        self.failures = 0  # Injected failures raised
+        self.cells_written = 0  # Cells sent by value writes and appends
+        self._grid = [[self._cell(value) for value in row] for row in (rows or [])]
+        self._random = random.Random(seed)
+        self._planned_failures = deque()
+        self._recent = deque()  # Times of recent requests, for the quota
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_frame(cls, df, **kwargs):
+        """Returns a fake sheet holding `df` under a header row."""
+        return cls([list(df.columns)] + sheet_rows(df.values.tolist()), **kwargs)
+
+    def fail_next(self, status=503, count=1):
+        """Makes the next `count` requests fail with HTTP `status`."""
+        with self._lock:
+            self._planned_failures.extend([status] * count)
+
+    def snapshot(self):
+        """Returns the stored rows, without going through the request path."""
+        with self._lock:
+            return [list(row) for row in self._grid]
+
+    def set_rows(self, rows):
+        """Replaces the stored rows without going through the request path, as another user's edits would."""
+        with self._lock:
+            self._grid = [[self._cell(value) for value in row] for row in rows]
+
+    def get_values(self, range_name):
+        self._request()
+        _, first_column, first_row, last_column, last_row = parse_a1(range_name)
+        with self._lock:
+            stop = len(self._grid) if last_row is None else min(last_row + 1, len(self._grid))
+            rows = [row[first_column:last_column + 1] for row in self._grid[first_row:stop]]
+        rows = [self._trim(row) for row in rows]
+        while rows and not rows[-1]:
+            rows.pop()
+        return rows
+
+    def batch_update_values(self, data):
+        self._request()
+        with self._lock:
+            for range_name, rows in data:
+                self.cells_written += sum(len(values) for values in rows)
+                _, first_column, first_row, _, _ = parse_a1(range_name)
+                for offset, values in enumerate(rows):
+                    row = self._row(first_row + offset, first_column + len(values))
+                    row[first_column:first_column + len(values)] = [self._cell(value) for value in values]
+
+    def append_values(self, rows):
+        self._request()
+        with self._lock:
+            self.cells_written += sum(len(values) for values in rows)
+            last = len(self._grid)
+            while last and not any(self._grid[last - 1]):
+                last -= 1
+            self._grid[last:last] = [[self._cell(value) for value in values] for values in rows]
+
+    def clear_values(self, range_name):
+        self._request()
+        _, first_column, first_row, last_column, last_row = parse_a1(range_name)
+        with self._lock:
+            stop = len(self._grid) if last_row is None else min(last_row + 1, len(self._grid))
+            for row in self._grid[first_row:stop]:
+                for column in range(first_column, min(last_column + 1, len(row))):
+                    row[column] = ""
+
+    def row_count(self):
+        self._request()
+        with self._lock:
+            return len(self._grid)
+
+    def update_row_structure(self, deletes, inserts):
+        self._request()
+        with self._lock:
+            for start, stop in deletes:
+                del self._grid[start:stop]
+            for start, stop in inserts:
+                self._row(start - 1, 0)
+                self._grid[start:start] = [[] for _ in range(stop - start)]
+
+    def _request(self):
+        """Counts a request and applies the injected latency and failures."""
+        self._count_request()
+        with self._lock:
+            now = time.monotonic()
+            status = self._planned_failures.popleft() if self._planned_failures else None
+            if status is None and self.quota is not None:
+                while self._recent and now - self._recent[0] > 60:
+                    self._recent.popleft()
+                if len(self._recent) >= self.quota:
+                    status = 429
+                else:
+                    self._recent.append(now)
+            if status is None and self.failure_rate and self._random.random() < self.failure_rate:
+                status = 503
+            delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+        if delay:
+            time.sleep(delay)
+        if status is not None:
+            self.failures += 1
+            raise FakeSheetsError(status, "Quota exceeded" if status == 429 else "Injected failure")
+
+    def _row(self, index, width):
+        # Callers hold the lock; grows the grid so row `index` exists with at least `width` cells
+        while len(self._grid) <= index:
+            self._grid.append([])
+        row = self._grid[index]
+        if len(row) < width:
+            row.extend([""] * (width - len(row)))
+        return row
+
+    @staticmethod
+    def _trim(row):
+        row = list(row)
+        while row and row[-1] == "":
+            row.pop()
+        return row
+
+    @staticmethod
+    def _cell(value):
+        # The API hands RAW values back as their formatted text
+        if isinstance(value, bool):
+            return "TRUE" if value else "FALSE"
+        if isinstance(value, float) and value.is_integer():
+            return str(int(value))
+        return "" if value is None else str(value)
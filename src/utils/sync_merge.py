@@ -0,0 +1,399 @@
+# src/utils/sync_merge.py
+
+import json
+import logging
+import os
+import threading
+import time
+from collections import defaultdict, namedtuple
+from difflib import SequenceMatcher
+
+from src.utils.sheet_delta import MergedRow, SheetDelta, delta_to_merged, is_empty
+
+BASE_VERSION = 1
+
+# Idle polls check the footprint cell only; once this many seconds have passed since the last full
+# read the whole sheet is read anyway, which catches edits made in the browser (they do not update
+# the footprint). Measured in time rather than polls, since idle polls get further apart
+FULL_READ_INTERVAL = 5 * 60
+
+# Replaced blocks larger than this (rows x rows) are paired by position instead of by similarity
+MAX_PAIRING_CELLS = 10000
+
+# The local data to sync; `version` identifies the local edit state it was taken at and
+# must change whenever the data does (None if unknown)
+SyncSnapshot = namedtuple("SyncSnapshot", ["df", "version"])
+
+# Outcome of a sync cycle: `local_delta` turns the snapshot's rows into `merged`
+SyncResult = namedtuple("SyncResult", ["version", "columns", "merged", "local_delta", "remote_changed"])
+
+
+def _pair_block(base, other, i1, i2, j1, j2):
+    """
+    Pairs the base and other rows of a replaced block as (base, other) updates. Rows are
+    paired by how many cells they share, keeping their order, so an edited row is not
+    mistaken for a deleted neighbour. Unpaired rows are deletes or inserts.
+    """
+    m, n = i2 - i1, j2 - j1
+    if m * n > MAX_PAIRING_CELLS:
+        return list(zip(range(i1, i1 + min(m, n)), range(j1, j1 + min(m, n))))
+
+    def similarity(i, j):
+        return sum(a == b for a, b in zip(base[i1 + i], other[j1 + j]))
+
+    # scores[i][j]: best total similarity pairing the first i base rows with the first j other rows
+    scores = [[0] * (n + 1) for _ in range(m + 1)]
+    for i in range(1, m + 1):
+        for j in range(1, n + 1):
+            best = max(scores[i - 1][j], scores[i][j - 1])
+            shared = similarity(i - 1, j - 1)
+            if shared:
+                best = max(best, scores[i - 1][j - 1] + shared)
+            scores[i][j] = best
+
+    pairs = []
+    i, j = m, n
+    while i and j:
+        if scores[i][j] == scores[i - 1][j]:
+            i -= 1
+        elif scores[i][j] == scores[i][j - 1]:
+            j -= 1
+        else:
+            pairs.append((i1 + i - 1, j1 + j - 1))
+            i, j = i - 1, j - 1
+    pairs.reverse()
+    return pairs
+
+
+def align(base, other):
+    """
+    Aligns `other` (a TableFingerprint kept with values) to `base`. Returns (matches, inserts):
+    `matches[i]` is the other-side position of base row i, or None if it was deleted, and
+    `inserts[i]` lists the other-side rows inserted before base row i (i == len(base) is the end).
+    """
+    matches = [None] * len(base)
+    inserts = defaultdict(list)
+    matcher = SequenceMatcher(None, base.rows.tolist(), other.rows.tolist(), autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            for offset in range(i2 - i1):
+                matches[i1 + offset] = j1 + offset
+        elif tag == "insert":
+            inserts[i1].extend(range(j1, j2))
+        elif tag == "replace":
+            pairs = _pair_block(base.values, other.values, i1, i2, j1, j2)
+            for i, j in pairs:
+                matches[i] = j
+            # Other-side rows left unpaired are inserted before the next base row they precede
+            paired = {j for _, j in pairs}
+            next_base = {j: i for i, j in pairs}
+            anchor = i1
+            for j in range(j1, j2):
+                if j in paired:
+                    anchor = next_base[j] + 1
+                else:
+                    inserts[anchor].append(j)
+    return matches, inserts
+
+
+def merge(base, local, remote):
+    """
+    Three-way merges the local and remote rows against the last-synced base rows.
+    All three are TableFingerprints kept with values. The policy is deterministic:
+      - Cells changed on one side take that side's value; a cell changed on both sides takes the local value.
+      - A row deleted on one side and updated on the other is kept, with the update.
+      - Rows inserted at the same place go remote first, then local; rows inserted identically on both sides are kept once.
+      - Blank rows inserted in the sheet are dropped.
+    Returns the merged rows as a list of MergedRow.
+    """
+    local_matches, local_inserts = align(base, local)
+    remote_matches, remote_inserts = align(base, remote)
+    merged = []
+
+    for anchor in range(len(base) + 1):
+        # Blank rows added in the sheet are dropped; a push that failed after opening rows leaves them behind
+        remote_rows = [j for j in remote_inserts.get(anchor, []) if any(remote.values[j])]
+        local_rows = local_inserts.get(anchor, [])
+        if remote_rows or local_rows:
+            matcher = SequenceMatcher(None, [remote.rows[j] for j in remote_rows],
+                                      [local.rows[j] for j in local_rows], autojunk=False)
+            for tag, r1, r2, l1, l2 in matcher.get_opcodes():
+                if tag == "equal":
+                    merged.extend(MergedRow(local.values[local_rows[l1 + k]], local_rows[l1 + k], remote_rows[r1 + k])
+                                  for k in range(r2 - r1))
+                else:
+                    merged.extend(MergedRow(remote.values[j], None, j) for j in remote_rows[r1:r2])
+                    merged.extend(MergedRow(local.values[j], j, None) for j in local_rows[l1:l2])
+
+        if anchor == len(base):
+            break
+        base_values = base.values[anchor]
+        local_position, remote_position = local_matches[anchor], remote_matches[anchor]
+        local_values = local.values[local_position] if local_position is not None else None
+        remote_values = remote.values[remote_position] if remote_position is not None else None
+
+        if local_values is None and remote_values is None:
+            continue  # Deleted on both sides
+        if local_values is None:
+            # Deleted locally: gone unless the sheet updated it
+            if remote_values != base_values:
+                merged.append(MergedRow(remote_values, None, remote_position))
+            continue
+        if remote_values is None:
+            # Deleted in the sheet: gone unless it was updated locally
+            if local_values != base_values:
+                merged.append(MergedRow(local_values, local_position, None))
+            continue
+
+        values = tuple(local_value if local_value != base_value else remote_value
+                       for base_value, local_value, remote_value in zip(base_values, local_values, remote_values))
+        merged.append(MergedRow(values, local_position, remote_position))
+    return merged
+
+
+def merge_without_base(local, remote):
+    """
+    Merges the local and remote rows when there is no base to compare them with (the first
+    sync, another spreadsheet or a lost base file). The remote rows are aligned to the local
+    ones and rows of replaced blocks are paired by similarity, as in align(). A paired row
+    takes the local values, like the first push used to overwrite the sheet. Rows on one side
+    only are kept, and blank rows in the sheet are dropped.
+    """
+    matches, inserts = align(local, remote)
+    merged = []
+    for anchor in range(len(local) + 1):
+        merged.extend(MergedRow(remote.values[j], None, j) for j in inserts.get(anchor, []) if any(remote.values[j]))
+        if anchor < len(local):
+            merged.append(MergedRow(local.values[anchor], anchor, matches[anchor]))
+    return merged
+
+
+def merged_frame(merged, columns):
+    import pandas as pd
+    return pd.DataFrame([list(row.values) for row in merged], columns=list(columns))
+
+
+class SheetSyncEngine:
+    """
+    Keeps the local data and Google Sheets in sync by three-way merging, on the sync worker thread.
+
+    The base is the data both sides held after the last sync; it is stored in the config
+    directory so concurrent edits are merged correctly across restarts. Each cycle reads
+    the sheet, merges the local and remote changes since the base, writes only the merged
+    changes to the sheet and returns the changes the local side needs. The base advances
+    once the local side has applied them (commit()).
+
+    Without a base the two sides are paired row by row instead (merge_without_base), so a
+    row both sides hold with different values is kept once, with the local values.
+
+    Every write also stores a footprint of the sheet (row count and digest) in a cell
+    beside the data. A poll without local changes first reads just that cell, and skips
+    the full read when it still matches what this client last synced, unless the last
+    full read is more than `full_read_interval` seconds old.
+    """
+
+    def __init__(self, base_path, backend, full_read_interval=FULL_READ_INTERVAL):
+        self.base_path = base_path
+        self.backend = backend  # SheetsBackend of the synced sheet
+        self.spreadsheet_id = backend.spreadsheet_id
+        self._next_spreadsheet_id = None  # Set by switch_spreadsheet() until the next cycle starts
+        self.full_read_interval = full_read_interval
+        self._footprint = None  # Footprint of the sheet as of the last sync
+        self._last_full_read = None  # time.monotonic() of the last full read
+        self._base_fingerprint = (None, None)  # (base rows, their TableFingerprint)
+        self._base_version = None  # Snapshot version the base was committed at
+
+        self._lock = threading.Lock()
+        self._base = None  # (columns, rows) once loaded
+        self._base_loaded = False
+        self._base_unsaved = False
+
+        # Counters reported by stats()
+        self.cycles = 0
+        self.full_rewrites = 0
+        self.delta_pushes = 0
+        self.remote_changes_pulled = 0
+        self.full_reads = 0
+        self.reads_skipped = 0
+
+    def sync(self, snapshot):
+        """Runs one sync cycle for `snapshot` and returns a SyncResult."""
+        from src.utils.row_fingerprint import TableFingerprint  # Imported here, off the Tk thread
+        spreadsheet_id, self._next_spreadsheet_id = self._next_spreadsheet_id, None
+        if spreadsheet_id is not None and spreadsheet_id != self.spreadsheet_id:
+            self.backend.switch_spreadsheet(spreadsheet_id)
+            self.spreadsheet_id = spreadsheet_id
+            self.reset()
+        self._save_base()
+        columns = tuple(str(column) for column in snapshot.df.columns)
+        base = self._base_table(columns)
+        if snapshot.version is not None and snapshot.version == self._base_version:
+            local, local_unchanged = None, True  # Still the data committed last time; no need to hash it
+        else:
+            local = TableFingerprint(snapshot.df, columns, keep_values=True)
+            local_unchanged = local.digest == base.digest
+
+        # Nothing changed locally: if the footprint is unchanged too, the sheet still matches the base
+        probe = None
+        if local_unchanged and self._footprint is not None and not self._full_read_due():
+            probe = self.backend.read_footprint()
+            if probe == self._footprint:
+                self.cycles += 1
+                self.reads_skipped += 1
+                return SyncResult(snapshot.version, columns, list(base.values), SheetDelta([], [], [], []), False)
+        if local is None:
+            local = TableFingerprint(snapshot.df, columns, keep_values=True)
+
+        remote_df = self.backend.read()
+        self._last_full_read = time.monotonic()
+        self.full_reads += 1
+        layout_matches = [str(column) for column in remote_df.columns] == list(columns)
+        if layout_matches:
+            remote = TableFingerprint(remote_df, columns, keep_values=True)
+        else:
+            # A blank sheet or different headers: keep the local data and rewrite the sheet
+            logging.warning("Google Sheets layout differs from the local data; the sheet will be rewritten.")
+            remote = base
+
+        if local.digest == base.digest == remote.digest:
+            merged = [MergedRow(values, index, index if layout_matches else None)
+                      for index, values in enumerate(local.values)]
+        elif layout_matches and not self._has_base(columns):
+            merged = merge_without_base(local, remote)
+        else:
+            merged = merge(base, local, remote)
+
+        self.cycles += 1
+        local_delta = delta_to_merged(local.values, merged, "local")
+        remote_delta = delta_to_merged(remote.values, merged, "remote") if layout_matches else None
+        footprint = self._merged_footprint(merged, columns, local, local_delta, remote, remote_delta)
+        if not layout_matches:
+            self.backend.rewrite(merged_frame(merged, columns), footprint)
+            self.full_rewrites += 1
+            print("Data written to Google Sheets successfully.")
+        elif not is_empty(remote_delta):
+            self.backend.push_delta(remote_delta, footprint)
+            self.delta_pushes += 1
+            print(f"Changes pushed to Google Sheets: "
+                  f"{sum(stop - start for start, stop in remote_delta.delete_ranges)} deleted, "
+                  f"{len(remote_delta.updates)} updated, {len(remote_delta.inserts) + len(remote_delta.appends)} added.")
+        elif footprint != (probe or self._footprint):
+            # The sheet changed without a footprint update (e.g. in the browser), or this is the first sync
+            self.backend.write_footprint(footprint)
+        self._footprint = footprint
+
+        remote_changed = not is_empty(local_delta)
+        if remote_changed:
+            self.remote_changes_pulled += 1
+        return SyncResult(snapshot.version, columns, [row.values for row in merged], local_delta, remote_changed)
+
+    def commit(self, result):
+        """Records the merged rows of `result` as the new base once the local side holds them."""
+        with self._lock:
+            self._base = (result.columns, result.merged)
+            self._base_loaded = True
+            self._base_unsaved = True
+        self._base_version = result.version
+
+    def switch_spreadsheet(self, spreadsheet_id):
+        """
+        Syncs with another spreadsheet from the next cycle on, starting without a base.
+        A cycle already running finishes against the current spreadsheet.
+        """
+        self._next_spreadsheet_id = spreadsheet_id
+
+    def _full_read_due(self):
+        return self._last_full_read is None or time.monotonic() - self._last_full_read >= self.full_read_interval
+
+    def reset(self):
+        """Forgets the base, e.g. after switching to another spreadsheet."""
+        self._footprint = None
+        self._base_version = None
+        with self._lock:
+            self._base = None
+            self._base_loaded = True
+            self._base_unsaved = True
+
+    def close(self):
+        self._save_base()
+
+    def stats(self):
+        return {
+            "cycles": self.cycles,
+            "full_rewrites": self.full_rewrites,
+            "delta_pushes": self.delta_pushes,
+            "remote_changes_pulled": self.remote_changes_pulled,
+            "full_reads": self.full_reads,
+            "reads_skipped": self.reads_skipped,
+            "requests": self.backend.requests,
+            "budget_wait_seconds": round(self.backend.budget.waited, 1) if self.backend.budget is not None else 0,
+        }
+
+    def _merged_footprint(self, merged, columns, local, local_delta, remote, remote_delta):
+        """Returns the (row count, digest) footprint of the merged rows, reusing a side's digest if it already matches."""
+        if is_empty(local_delta):
+            digest = local.digest
+        elif remote_delta is not None and is_empty(remote_delta):
+            digest = remote.digest
+        else:
+            from src.utils.row_fingerprint import TableFingerprint
+            digest = TableFingerprint(merged_frame(merged, columns), columns).digest
+        return str(len(merged)), digest
+
+    def _base_table(self, columns):
+        """Returns the TableFingerprint (with values) of the base; empty if there is none (the first sync)."""
+        import pandas as pd
+        from src.utils.row_fingerprint import TableFingerprint
+
+        with self._lock:
+            if not self._base_loaded:
+                self._base = self._load_base()
+                self._base_loaded = True
+            base = self._base
+        cached_base, fingerprint = self._base_fingerprint
+        if cached_base is base and fingerprint is not None and fingerprint.columns == tuple(columns):
+            return fingerprint
+        if base is None or tuple(base[0]) != tuple(columns):
+            frame = pd.DataFrame(columns=list(columns))
+        else:
+            frame = pd.DataFrame([list(row) for row in base[1]], columns=list(columns))
+        fingerprint = TableFingerprint(frame, columns, keep_values=True)
+        self._base_fingerprint = (base, fingerprint)
+        return fingerprint
+
+    def _has_base(self, columns):
+        with self._lock:
+            base = self._base
+        return base is not None and tuple(base[0]) == tuple(columns)
+
+    def _load_base(self):
+        try:
+            with open(self.base_path, "r", encoding="utf-8") as base_file:
+                data = json.load(base_file)
+        except FileNotFoundError:
+            return None
+        except (OSError, json.JSONDecodeError) as e:
+            logging.error(f"Error reading the sync base, starting without one: {e}")
+            return None
+        if data.get("version") != BASE_VERSION or data.get("spreadsheet_id") != self.spreadsheet_id:
+            return None
+        return tuple(data["columns"]), [tuple(row) for row in data["rows"]]
+
+    def _save_base(self):
+        with self._lock:
+            if not self._base_unsaved:
+                return
+            base, self._base_unsaved = self._base, False
+        try:
+            if base is None:
+                if os.path.exists(self.base_path):
+                    os.remove(self.base_path)
+                return
+            temp_path = self.base_path + ".tmp"
+            with open(temp_path, "w", encoding="utf-8") as base_file:
+                json.dump({"version": BASE_VERSION, "spreadsheet_id": self.spreadsheet_id,
+                           "columns": list(base[0]), "rows": [list(row) for row in base[1]]},
+                          base_file, separators=(",", ":"))
+            os.replace(temp_path, self.base_path)
+        except OSError as e:
+            logging.error(f"Error saving the sync base: {e}")
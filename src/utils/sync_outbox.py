@@ -0,0 +1,139 @@
+# src/utils/sync_outbox.py
+
+import json
+import logging
+import os
+import random
+import time
+from datetime import datetime
+
+# Retry delays double from the first to the last, then stay there
+FIRST_RETRY_SECONDS = 5
+MAX_RETRY_SECONDS = 15 * 60
+
+# HTTP statuses worth retrying soon; other client errors (bad credentials, missing sheet) wait the longest delay
+RETRYABLE_STATUSES = {408, 429, 500, 502, 503, 504}
+
+
+def error_status(error):
+    """Returns the HTTP status of a Google API error, or None for network and other errors."""
+    response = getattr(error, "resp", None)
+    status = getattr(response, "status", None)
+    try:
+        return int(status) if status is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def retry_delay(attempts, retryable=True):
+    """Returns the seconds to wait before retry number `attempts`, with jitter so clients spread out."""
+    if not retryable:
+        return MAX_RETRY_SECONDS
+    delay = min(FIRST_RETRY_SECONDS * 2 ** max(attempts - 1, 0), MAX_RETRY_SECONDS)
+    return delay * random.uniform(0.5, 1.0)
+
+
+class SyncOutbox:
+    """
+    Durable record of local changes that have not reached Google Sheets yet.
+
+    The changes themselves need no separate queue: local storage keeps the edited data and
+    the sync base keeps the last-synced data, so the next sync replays exactly the net
+    difference, with repeated edits to a row collapsed into one update and all changes
+    sent as a few batched requests. The outbox stores when changes became pending, how
+    many edits are waiting and the retry state in a small JSON file in the config
+    directory, so pending changes are reported and retried across restarts. After a
+    failed sync, retries back off exponentially instead of firing on every edit.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.pending_since = None  # ISO time of the first unsynced edit
+        self.edits = 0  # Local edits since the last successful sync
+        self.attempts = 0  # Failed syncs in a row
+        self.last_error = None
+        self.retry_at = None  # time.monotonic() before which no sync is attempted
+        self._unsaved = False
+        self._load()
+
+    @property
+    def pending(self):
+        return self.pending_since is not None
+
+    def backing_off(self):
+        """True while waiting for the next retry after a failed sync."""
+        return self.retry_at is not None and time.monotonic() < self.retry_at
+
+    def seconds_until_retry(self):
+        return max(0.0, self.retry_at - time.monotonic()) if self.retry_at is not None else 0.0
+
+    def record_edit(self):
+        """Counts a local edit; the file is written when changes first become pending."""
+        self.edits += 1
+        if self.pending_since is None:
+            self.pending_since = datetime.now().isoformat(timespec="seconds")
+            self._save()
+        else:
+            self._unsaved = True
+
+    def record_success(self):
+        """Clears the outbox after a sync that included every local edit."""
+        if self.pending_since is None and self.attempts == 0 and not self._unsaved:
+            self.retry_at = None
+            return
+        self.pending_since = None
+        self.edits = 0
+        self.attempts = 0
+        self.last_error = None
+        self.retry_at = None
+        self._save()
+
+    def record_failure(self, error):
+        """Records a failed sync and returns the seconds to wait before retrying."""
+        self.attempts += 1
+        self.last_error = str(error)
+        if self.pending_since is None:
+            self.pending_since = datetime.now().isoformat(timespec="seconds")
+        status = error_status(error)
+        delay = retry_delay(self.attempts, status is None or status in RETRYABLE_STATUSES)
+        self.retry_at = time.monotonic() + delay
+        self._save()
+        return delay
+
+    def clear_backoff(self):
+        """Allows the next sync right away, e.g. when the user turns sync back on."""
+        self.retry_at = None
+
+    def close(self):
+        if self._unsaved:
+            self._save()
+
+    def _load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as outbox_file:
+                data = json.load(outbox_file)
+        except FileNotFoundError:
+            return
+        except (OSError, json.JSONDecodeError) as e:
+            logging.error(f"Error reading the sync outbox: {e}")
+            return
+        self.pending_since = data.get("pending_since")
+        self.edits = data.get("edits", 0)
+        self.attempts = data.get("attempts", 0)
+        self.last_error = data.get("last_error")
+
+    def _save(self):
+        self._unsaved = False
+        data = {
+            "pending_since": self.pending_since,
+            "edits": self.edits,
+            "attempts": self.attempts,
+            "last_error": self.last_error,
+        }
+        try:
+            temp_path = self.path + ".tmp"
+            with open(temp_path, "w", encoding="utf-8") as outbox_file:
+                json.dump(data, outbox_file, indent=4)
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            logging.error(f"Error saving the sync outbox: {e}")
@@ -0,0 +1,118 @@
+# src/utils/sync_scheduler.py
+
+import threading
+import time
+
+# Google Sheets requests allowed per minute unless SYNC_REQUESTS_PER_MINUTE is configured.
+# The API allows 60 reads and 60 writes per minute per user, shared by every running instance.
+DEFAULT_REQUESTS_PER_MINUTE = 30
+
+# Poll interval bounds while the window is focused; polls slow down when nothing changes
+MIN_POLL_SECONDS = 15
+DEFAULT_POLL_SECONDS = 60
+MAX_POLL_SECONDS = 300
+
+# Polls are this many times further apart while the window is in the background
+UNFOCUSED_FACTOR = 4
+
+# Edits made within this window of the first one are pushed together
+PUSH_BATCH_MS = 1500
+
+
+class TokenBucket:
+    """
+    Thread-safe request budget: `rate` tokens per minute, up to `capacity` saved for bursts.
+    The sync worker takes a token per API request and waits when the budget is spent.
+    `clock` and `sleep` default to time.monotonic and time.sleep.
+    """
+
+    def __init__(self, rate=DEFAULT_REQUESTS_PER_MINUTE, capacity=None, clock=time.monotonic, sleep=time.sleep):
+        self.rate = max(float(rate), 1.0) / 60.0  # Tokens per second
+        self.capacity = float(capacity if capacity is not None else max(rate // 4, 1))
+        self.clock = clock
+        self.sleep = sleep
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+        self.waited = 0.0  # Seconds spent waiting for tokens, reported in stats
+
+    def take(self, count=1):
+        """Takes `count` tokens if available; returns 0, or the seconds until they will be."""
+        with self._lock:
+            self._refill()
+            if self._tokens >= count:
+                self._tokens -= count
+                return 0.0
+            return (count - self._tokens) / self.rate
+
+    def acquire(self, count=1):
+        """Blocks until `count` tokens could be taken."""
+        count = min(count, self.capacity)
+        while True:
+            wait = self.take(count)
+            if not wait:
+                return
+            self.waited += wait
+            self.sleep(wait)
+
+    def drain(self):
+        """Spends every saved token, e.g. after the API reported that the quota ran out."""
+        with self._lock:
+            self._refill()
+            self._tokens = min(self._tokens, 0.0)
+
+    def _refill(self):
+        now = self.clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+
+class SyncScheduler:
+    """
+    Decides how long to wait between Google Sheets polls.
+
+    The interval halves (down to MIN_POLL_SECONDS) when a poll brings in remote changes
+    or the user edits locally, and grows by half (up to MAX_POLL_SECONDS) when a poll
+    finds nothing new, so a sheet in active use is followed closely and an idle one costs
+    few requests. Failed polls double the interval, and it is stretched by UNFOCUSED_FACTOR
+    while the window is in the background.
+    """
+
+    def __init__(self, min_seconds=MIN_POLL_SECONDS, max_seconds=MAX_POLL_SECONDS, unfocused_factor=UNFOCUSED_FACTOR,
+                 clock=time.monotonic):
+        self.min_seconds = min_seconds
+        self.max_seconds = max_seconds
+        self.unfocused_factor = unfocused_factor
+        self.interval = float(DEFAULT_POLL_SECONDS)
+        self.focused = True
+        self.clock = clock
+        self.last_poll = None  # clock() of the last poll
+
+    def poll_delay(self):
+        """Returns the seconds from now until the next poll is due."""
+        delay = self.interval if self.focused else self.interval * self.unfocused_factor
+        if self.last_poll is None:
+            return delay
+        return max(0.0, self.last_poll + delay - self.clock())
+
+    def record_poll(self):
+        self.last_poll = self.clock()
+
+    def record_edit(self):
+        """A local edit: the user is working on the data, so follow the sheet closely too."""
+        self.interval = max(self.min_seconds, self.interval / 2)
+
+    def record_result(self, remote_changed):
+        if remote_changed:
+            self.interval = max(self.min_seconds, self.interval / 2)
+        else:
+            self.interval = min(self.max_seconds, self.interval * 1.5)
+
+    def record_failure(self):
+        self.interval = min(self.max_seconds, self.interval * 2)
+
+    def set_focused(self, focused):
+        """Returns True if the focus state changed, so the next poll should be rescheduled."""
+        changed = focused != self.focused
+        self.focused = focused
+        return changed
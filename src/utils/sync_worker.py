@@ -0,0 +1,88 @@
+# src/utils/sync_worker.py
+
+import logging
+import queue
+import threading
+
+
+class SyncWorker:
+    """
+    Runs Google Sheets sync cycles on a background thread so they never block the Tk event loop.
+
+    Snapshots go through a queue and are synced one at a time. A snapshot replaces any
+    snapshot that is still waiting, so only the latest local data is synced. Outcomes are
+    put on `results` as (error, result) tuples for the GUI to poll with after(); `error`
+    is None on success and `result` is what the sync function returned.
+    """
+
+    def __init__(self, sync_func):
+        self.sync_func = sync_func
+        self.results = queue.Queue()
+
+        self._jobs = queue.Queue()
+        self._lock = threading.Lock()
+        self._pending = None
+        self._outstanding = 0  # Cycles queued or running
+
+        # Counters reported by stats()
+        self.requested = 0
+        self.synced = 0
+        self.failed = 0
+
+        self._thread = threading.Thread(target=self._run, name="SyncWorker", daemon=True)
+        self._thread.start()
+
+    def submit(self, snapshot):
+        """
+        Queues a sync of `snapshot`, replacing a snapshot that has not been synced yet.
+        The snapshot must not be modified afterwards, e.g. a copy of the DataFrame.
+        """
+        with self._lock:
+            queued = self._pending is not None
+            self._pending = snapshot
+            self.requested += 1
+            if not queued:
+                self._outstanding += 1
+        if not queued:
+            self._jobs.put(True)
+
+    @property
+    def busy(self):
+        """True while a sync is queued or running."""
+        with self._lock:
+            return self._outstanding > 0
+
+    def stats(self):
+        """Returns the worker's counters as a dictionary."""
+        with self._lock:
+            return {
+                "requested": self.requested,
+                "synced": self.synced,
+                "saved": self.requested - self.synced - self.failed - (1 if self._pending is not None else 0),
+                "failed": self.failed,
+            }
+
+    def close(self, timeout=None):
+        """Lets a queued sync finish (up to `timeout` seconds) and stops the thread."""
+        self._jobs.put(None)
+        self._thread.join(timeout)
+
+    def _run(self):
+        while self._jobs.get() is not None:
+            with self._lock:
+                snapshot, self._pending = self._pending, None
+
+            error, result = None, None
+            try:
+                result = self.sync_func(snapshot)
+            except Exception as e:
+                logging.error(f"Google Sheets sync failed: {e}")
+                error = e
+
+            with self._lock:
+                self._outstanding -= 1
+                if error is None:
+                    self.synced += 1
+                else:
+                    self.failed += 1
+            self.results.put((error, result))
@@ -0,0 +1,178 @@
+# src/utils/write_behind.py
+
+import hashlib
+import logging
+import threading
+import time
+
+import pandas as pd
+
+
+def dataframe_digest(df):
+    """
+    Returns a content hash of a DataFrame covering its column names and cell values.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update("\x1f".join(str(col) for col in df.columns).encode("utf-8"))
+    if not df.empty:
+        try:
+            row_hashes = pd.util.hash_pandas_object(df, index=False)
+        except TypeError:
+            # Mixed object columns that pandas cannot hash directly are hashed as text
+            row_hashes = pd.util.hash_pandas_object(df.astype(str), index=False)
+        digest.update(row_hashes.values.tobytes())
+    return digest.hexdigest()
+
+
+class WriteBehindWriter:
+    """
+    Persists DataFrame snapshots on a background thread.
+
+    Snapshots submitted within `delay` seconds of each other are coalesced so that
+    only the latest one is written, and a write is skipped when its content hash
+    matches the last snapshot that reached disk. `after_write(snapshot)` is called
+    once a snapshot's content is on disk, whether it was written or skipped, and
+    `on_failure(snapshot)` when saving it raised.
+    """
+
+    def __init__(self, save_func, file_path, delay=0.5, after_write=None, on_failure=None):
+        self.save_func = save_func
+        self.file_path = file_path
+        self.delay = delay
+        self.after_write = after_write
+        self.on_failure = on_failure
+
+        self._condition = threading.Condition()
+        self._pending = None
+        self._last_submit = 0.0
+        self._writing = False
+        self._flush_requests = 0
+        self._closed = False
+        self._last_digest = None
+
+        # Counters reported by stats()
+        self.submitted = 0
+        self.written = 0
+        self.skipped_unchanged = 0
+        self.failed = 0
+
+        self._thread = threading.Thread(target=self._run, name="WriteBehindWriter", daemon=True)
+        self._thread.start()
+
+    def mark_persisted(self, df):
+        """Records `df` as the content currently on disk so identical snapshots are not rewritten."""
+        digest = dataframe_digest(df)
+        with self._condition:
+            self._last_digest = digest
+
+    def submit(self, df, copy=True):
+        """Queues a copy of `df` (or `df` itself if it is already a private snapshot) to be written."""
+        snapshot = df.copy() if copy else df
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("WriteBehindWriter is closed.")
+            self._pending = snapshot
+            self._last_submit = time.monotonic()
+            self.submitted += 1
+            self._condition.notify_all()
+
+    def flush(self, timeout=None):
+        """
+        Writes any pending snapshot without waiting for the coalescing delay.
+        Returns True once nothing is pending or being written, False on timeout.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            self._flush_requests += 1
+            self._condition.notify_all()
+            try:
+                while self._pending is not None or self._writing:
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        return False
+                    self._condition.wait(remaining)
+                return True
+            finally:
+                self._flush_requests -= 1
+
+    def close(self, timeout=None):
+        """Flushes pending work and stops the background thread."""
+        self.flush(timeout)
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join(timeout)
+
+    @property
+    def writes_saved(self):
+        """Number of submitted snapshots that did not cost a workbook write."""
+        return self.submitted - self.written - self.failed - (1 if self._pending is not None else 0)
+
+    def stats(self):
+        """Returns the writer's counters as a dictionary."""
+        with self._condition:
+            return {
+                "submitted": self.submitted,
+                "written": self.written,
+                "skipped_unchanged": self.skipped_unchanged,
+                "failed": self.failed,
+                "writes_saved": self.writes_saved,
+            }
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while self._pending is None and not self._closed:
+                    self._condition.wait()
+                if self._pending is None:
+                    return  # Closed with nothing left to write
+
+                # Let a burst of edits settle before writing, unless a flush was requested
+                while not self._flush_requests and not self._closed:
+                    remaining = self._last_submit + self.delay - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+
+                snapshot = self._pending
+                self._pending = None
+                self._writing = True
+                last_digest = self._last_digest
+
+            try:
+                self._write(snapshot, last_digest)
+            finally:
+                with self._condition:
+                    self._writing = False
+                    self._condition.notify_all()
+
+    def _write(self, snapshot, last_digest):
+        digest = dataframe_digest(snapshot)
+        if digest == last_digest:
+            with self._condition:
+                self.skipped_unchanged += 1
+            self._notify(self.after_write, snapshot)
+            return
+
+        try:
+            self.save_func(snapshot, self.file_path)
+        except Exception as e:
+            print(f"Error: Could not save the Excel file. {str(e)}")
+            logging.error(f"Error: Could not save the Excel file in the background writer. {str(e)}")
+            with self._condition:
+                self.failed += 1
+            self._notify(self.on_failure, snapshot)
+            return
+
+        with self._condition:
+            self._last_digest = digest
+            self.written += 1
+        self._notify(self.after_write, snapshot)
+
+    def _notify(self, callback, snapshot):
+        if callback is None:
+            return
+        try:
+            callback(snapshot)
+        except Exception as e:
+            logging.error(f"Error in background writer callback: {e}")
@@ -0,0 +1,61 @@
+import os
+import sys
+
+import pytest
+
+from src.utils.asset_cache import AssetCache
+
+Image = pytest.importorskip("PIL.Image")
+
+
+@pytest.fixture
+def assets(tmp_path):
+    source_dir = tmp_path / "assets"
+    source_dir.mkdir()
+    Image.new("RGBA", (64, 64), "red").save(source_dir / "icon.png")
+    return str(source_dir), str(tmp_path / "cache")
+
+
+def cached_files(cache_dir):
+    return sorted(os.listdir(cache_dir))
+
+
+def test_a_miss_saves_a_scaled_copy(assets):
+    source_dir, cache_dir = assets
+    cache = AssetCache(cache_dir, [source_dir])
+
+    path = cache.path("icon.png", (16, 16))
+    assert cache.scaled == 1
+    assert os.path.dirname(path) == cache_dir
+    with Image.open(path) as image:
+        assert image.format == "PNG" and image.size == (16, 16)
+    assert cached_files(cache_dir) == [os.path.basename(path)]
+    assert cache.path("icon.png") == os.path.join(source_dir, "icon.png")
+
+
+def test_a_warm_hit_does_not_import_pil(assets, monkeypatch):
+    source_dir, cache_dir = assets
+    path = AssetCache(cache_dir, [source_dir]).path("icon.png", (16, 16))
+
+    monkeypatch.setitem(sys.modules, "PIL", None)  # Makes any `import PIL...` fail
+    monkeypatch.setitem(sys.modules, "PIL.Image", None)
+    cache = AssetCache(cache_dir, [source_dir])
+    assert cache.path("icon.png", (16, 16)) == path
+    assert cache.scaled == 0
+
+
+def test_a_changed_asset_or_size_gets_a_new_copy(assets):
+    source_dir, cache_dir = assets
+    first = AssetCache(cache_dir, [source_dir]).path("icon.png", (16, 16))
+
+    Image.new("RGBA", (64, 64), "blue").save(os.path.join(source_dir, "icon.png"))
+    cache = AssetCache(cache_dir, [source_dir])
+    second = cache.path("icon.png", (16, 16))
+    assert second != first and cache.scaled == 1
+    assert cached_files(cache_dir) == [os.path.basename(second)]  # The outdated copy is removed
+    with Image.open(second) as image:
+        assert image.getpixel((8, 8)) == (0, 0, 255, 255)
+
+    larger = cache.path("icon.png", (32, 32))
+    assert cache.scaled == 2
+    assert cached_files(cache_dir) == sorted([os.path.basename(second), os.path.basename(larger)])
@@ -0,0 +1,166 @@
+import asyncio
+import threading
+from urllib.parse import unquote
+
+import pandas as pd
+import pytest
+
+from src.utils.async_sheets import AsyncSheetsBackend, SheetsHttpError
+from src.utils.sync_backend import FakeSheetsBackend
+from src.utils.sync_merge import SheetSyncEngine, SyncSnapshot
+from src.utils.sync_outbox import error_status
+
+web = pytest.importorskip("aiohttp.web")
+
+COLUMNS = ["Company", "Position", "Application Portal URL", "Date Applied", "Status"]
+
+
+def frame(count):
+    return pd.DataFrame([[f"Company {i}", "Engineer", f"https://example.com/{i}", "2024-01-02", "Applied"]
+                         for i in range(count)], columns=COLUMNS)
+
+
+class SheetsServer:
+    """A local HTTP server answering the Sheets API requests AsyncSheetsBackend sends from a FakeSheetsBackend."""
+
+    def __init__(self, fake):
+        self.fake = fake
+        self.delay = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.failing_ranges = set()
+        self.loop = asyncio.new_event_loop()
+        app = web.Application()
+        app.router.add_route("*", "/v4/spreadsheets/{spreadsheet_id:[^/:]+}{path:.*}", self.handle)
+        self.runner = web.AppRunner(app, handler_cancellation=True)  # Stop handlers whose client went away
+        self.loop.run_until_complete(self.runner.setup())
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        self.loop.run_until_complete(site.start())
+        port = self.runner.addresses[0][1]
+        self.api_root = f"http://127.0.0.1:{port}/v4/spreadsheets"
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self.thread.start()
+
+    def close(self):
+        asyncio.run_coroutine_threadsafe(self.runner.cleanup(), self.loop).result(5)
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(5)
+        self.loop.close()
+
+    async def handle(self, request):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            return self.answer(request.match_info["path"], await request.json() if request.can_read_body else None)
+        finally:
+            self.in_flight -= 1
+
+    def answer(self, path, body):
+        fake = self.fake
+        if path == "":
+            return web.json_response({"sheets": [{"properties": {
+                "sheetId": 0, "title": fake.sheet_name, "gridProperties": {"rowCount": fake.row_count()}}}]})
+        if path == ":batchUpdate":
+            ranges = {"deleteDimension": [], "insertDimension": []}
+            for request in body["requests"]:
+                for kind, rows in ranges.items():
+                    if kind in request:
+                        rows.append((request[kind]["range"]["startIndex"], request[kind]["range"]["endIndex"]))
+            fake.update_row_structure(ranges["deleteDimension"], ranges["insertDimension"])
+            return web.json_response({})
+        if path == "/values:batchUpdate":
+            fake.batch_update_values([(data["range"], data["values"]) for data in body["data"]])
+            return web.json_response({})
+        range_name = unquote(path[len("/values/"):])
+        if range_name.endswith(":append"):
+            fake.append_values(body["values"])
+            return web.json_response({})
+        if range_name.endswith(":clear"):
+            fake.clear_values(range_name[:-len(":clear")])
+            return web.json_response({})
+        if range_name in self.failing_ranges:
+            return web.Response(status=503, text="The service is currently unavailable.")
+        return web.json_response({"values": fake.get_values(range_name)})
+
+
+class Credentials:
+    valid = True
+    token = "token"
+
+
+class Client:
+    def credentials(self):
+        return Credentials, "service-account.json"
+
+
+@pytest.fixture
+def server():
+    server = SheetsServer(FakeSheetsBackend.from_frame(frame(250)))
+    yield server
+    server.close()
+
+
+@pytest.fixture
+def backend(server):
+    backend = AsyncSheetsBackend(server.fake.spreadsheet_id, server.fake.range_name, Client(),
+                                 api_root=server.api_root, chunk_rows=100, max_parallel=2)
+    yield backend
+    backend.close()
+
+
+def test_reads_match_the_sheet(server, backend):
+    expected = server.fake.read()
+    pd.testing.assert_frame_equal(backend.read(), expected)
+    pd.testing.assert_frame_equal(backend.read(), expected)
+    assert server.max_in_flight <= 2
+
+
+def test_sync_writes_the_same_sheet_as_the_fake_backend(server, backend, tmp_path):
+    df = frame(250)
+    engine = SheetSyncEngine(str(tmp_path / "async_base.json"), backend)
+    engine.commit(engine.sync(SyncSnapshot(df, 1)))
+
+    df.at[5, "Status"] = "Interview"
+    df = df.drop(index=[7, 120]).reset_index(drop=True)
+    df.loc[len(df)] = ["Acme", "Analyst", "https://acme.example", "2024-02-01", "Applied"]
+    engine.commit(engine.sync(SyncSnapshot(df, 2)))
+
+    expected = FakeSheetsBackend.from_frame(frame(250))
+    expected_engine = SheetSyncEngine(str(tmp_path / "fake_base.json"), expected)
+    expected_engine.commit(expected_engine.sync(SyncSnapshot(frame(250), 1)))
+    expected_engine.commit(expected_engine.sync(SyncSnapshot(df, 2)))
+    assert server.fake.snapshot() == expected.snapshot()
+    assert engine.sync(SyncSnapshot(df, 2)).merged == list(df.itertuples(index=False, name=None))
+
+
+def test_errors_carry_the_http_status(server, backend):
+    server.failing_ranges.add("Sheet1!A1:A1")
+    with pytest.raises(SheetsHttpError) as raised:
+        backend.get_values("Sheet1!A1:A1")
+    assert raised.value.resp.status == 503
+    assert error_status(raised.value) == 503
+
+
+def test_close_cancels_a_request_in_flight(server, backend):
+    assert backend.cancels_requests and not FakeSheetsBackend.cancels_requests
+    backend.read_footprint()  # Starts the event loop and session
+    server.delay = 30
+    errors = []
+
+    def poll():
+        try:
+            backend.read()
+        except BaseException as e:
+            errors.append(e)
+
+    thread = threading.Thread(target=poll)
+    thread.start()
+    while not server.in_flight:
+        thread.join(0.01)
+    backend.close()
+    thread.join(5)
+    assert not thread.is_alive()
+    assert errors
+    with pytest.raises(RuntimeError):
+        backend.get_values(backend.range_name)
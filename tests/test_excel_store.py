@@ -0,0 +1,55 @@
+import pandas as pd
+
+import src.utils.file_io as file_io
+from src.utils.file_io import APPLICATION_COLUMNS, ExcelApplicationStore, save_applications_to_excel
+
+
+def test_a_failed_compaction_is_retried(tmp_path, monkeypatch):
+    path = str(tmp_path / "Applications.xlsx")
+    save_applications_to_excel(pd.DataFrame(columns=APPLICATION_COLUMNS), path)
+    store = ExcelApplicationStore(path)
+    df = store.load()
+    df.loc[0] = ["Acme", "Engineer", "https://acme.example/jobs/1", "2024-01-02", "Applied"]
+    store.append_rows(df)
+
+    save = file_io.save_applications_and_cache
+    monkeypatch.setattr(file_io, "save_applications_and_cache", lambda *args: 1 / 0)
+    store.flush()
+    assert store.writer.failed == 1
+
+    monkeypatch.setattr(file_io, "save_applications_and_cache", save)
+    store.flush()
+    store.close()
+    assert store.writer.written == 1
+    assert list(file_io.read_applications_from_excel(path)["Company"]) == ["Acme"]
+
+
+def workbook(path, companies):
+    rows = [[company, "Engineer", "", "2024-01-02", "Applied"] for company in companies]
+    save_applications_to_excel(pd.DataFrame(rows, columns=APPLICATION_COLUMNS), path)
+
+
+def test_journaled_edits_are_replayed_after_a_crash(tmp_path):
+    path = str(tmp_path / "Applications.xlsx")
+    workbook(path, ["A", "B", "C"])
+    store = ExcelApplicationStore(path)
+    df = store.load()
+    store.delete_rows(df.drop(index=0).reset_index(drop=True), [0])
+    store.journal.close()  # Crashes before compacting
+
+    assert list(ExcelApplicationStore(path).load()["Company"]) == ["B", "C"]
+
+
+def test_a_replaced_workbook_ignores_the_old_journal(tmp_path):
+    path = str(tmp_path / "Applications.xlsx")
+    workbook(path, ["A", "B", "C"])
+    store = ExcelApplicationStore(path)
+    df = store.load()
+    store.delete_rows(df.drop(index=0).reset_index(drop=True), [0])
+    store.journal.close()
+
+    workbook(path, ["P", "Q"])  # Copied over it outside the store
+    store = ExcelApplicationStore(path)
+    assert list(store.load()["Company"]) == ["P", "Q"]
+    assert store.journal.size() == 0
+    store.close()
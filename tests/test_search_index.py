@@ -0,0 +1,61 @@
+import pandas as pd
+
+from src.utils.search_index import SearchIndex
+
+COLUMNS = ["Company", "Position", "Application Portal URL", "Date Applied", "Status"]
+TERMS = ["goo", "google", "engineer", "acme", "interview", "2024-03", "zz", "a", ""]
+
+
+def frame(companies):
+    return pd.DataFrame([[company, "Engineer", f"https://{company.lower()}.example", "2024-03-01", "Applied"]
+                         for company in companies], columns=COLUMNS)
+
+
+def test_incremental_changes_match_a_full_rebuild():
+    df = frame(["Google", "Acme", "Globex", "Initech"])
+    index = SearchIndex()
+    index.build(df)
+
+    df = pd.concat([df, frame(["Goodyear", "Umbrella"])], ignore_index=True)
+    index.add_rows(df, [4, 5])
+    df.at[1, "Status"] = "Interview"
+    index.update_row(df, 1)
+    df.at[4, "Company"] = "Acme Labs"
+    index.update_row(df, 4)
+    index.delete_rows([0, 2])
+    df = df.drop(index=[0, 2]).reset_index(drop=True)
+    df = pd.concat([df, frame(["Google Cloud"])], ignore_index=True)
+    index.add_rows(df, [len(df) - 1])
+
+    rebuilt = SearchIndex()
+    rebuilt.build(df)
+    assert len(index) == len(rebuilt) == len(df)
+    for term in TERMS:
+        assert index.search(term) == rebuilt.search(term), term
+
+
+class UnusedPostings(dict):
+    def get(self, gram, default=None):
+        raise AssertionError(f"looked up the postings of {gram!r}")
+
+
+def test_a_narrowed_query_only_rechecks_the_previous_matches():
+    df = frame(["Google", "Goodyear", "Acme", "Google Cloud"])
+    index = SearchIndex()
+    index.build(df)
+    assert index.search("goo") == [0, 1, 3]
+
+    index._postings = UnusedPostings(index._postings)
+    assert index.search("goog") == [0, 3]
+    assert index.search("Google C") == [3]
+
+
+def test_a_change_drops_the_previous_matches():
+    df = frame(["Google", "Acme"])
+    index = SearchIndex()
+    index.build(df)
+    assert index.search("goo") == [0]
+
+    df = pd.concat([df, frame(["Goodyear"])], ignore_index=True)
+    index.add_rows(df, [2])
+    assert index.search("good") == [2]
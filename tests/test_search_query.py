@@ -0,0 +1,55 @@
+import pandas as pd
+import pytest
+
+from src.utils.search_index import SearchIndex
+from src.utils.search_query import QueryEngine, QuerySyntaxError, compile_query
+
+COLUMNS = ["Company", "Position", "Application Portal URL", "Date Applied", "Status"]
+
+
+def applications():
+    # Dates as a workbook read gives them: Timestamps
+    return pd.DataFrame([
+        ["Acme", "Software Engineer", "https://acme.example", pd.Timestamp("2024-06-01"), "Interview"],
+        ["Globex", "Data Analyst", "https://globex.example", pd.Timestamp("2024-06-02"), "Rejected"],
+        ["Initech", "Software Tester", "https://initech.example", pd.Timestamp("2024-06-15"), "Submitted"],
+    ], columns=COLUMNS)
+
+
+def search(text):
+    df = applications()
+    index = SearchIndex()
+    index.build(df)
+    return QueryEngine().search(df, index, text)
+
+
+def test_field_match():
+    assert search("status:interview") == [0]
+    assert search("status:reject,submit") == [1, 2]
+    assert search("company=globex") == [1]
+
+
+def test_quoted_phrase():
+    assert search('position:"software engineer"') == [0]
+    assert search('"software t"') == [2]
+
+
+def test_negation():
+    assert search("-status:rejected") == [0, 2]
+    assert search("software -acme") == [2]
+
+
+def test_date_equality_on_timestamps():
+    assert search("applied=2024-06-02") == [1]
+    assert search("applied!=2024-06-02") == [0, 2]
+
+
+def test_date_range():
+    assert search("applied>=2024-06-02 applied<2024-06-15") == [1]
+    assert search("date>2024-06-01") == [1, 2]
+
+
+def test_an_invalid_query_returns_none():
+    assert search("applied>soon") is None
+    with pytest.raises(QuerySyntaxError):
+        compile_query("applied=not-a-date")
@@ -0,0 +1,75 @@
+import json
+import os
+
+import pytest
+
+from config.settings_manager import ConfigService
+
+DEFAULTS = {"ENABLE_GOOGLE_SYNC": False, "SPREADSHEET_ID": "", "theme": "Light"}
+
+
+class CountingConfig(ConfigService):
+    """Counts how often app_config.json is read."""
+
+    reads = 0
+
+    def _read(self):
+        self.reads += 1
+        return super()._read()
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "app_config.json")
+
+
+def stored(path):
+    with open(path, encoding="utf-8") as config_file:
+        return json.load(config_file)
+
+
+def test_settings_changed_together_are_written_once(path):
+    config = ConfigService(path, DEFAULTS, write_delay=60)
+    config.set(theme="Dark")
+    config.set(SPREADSHEET_ID="sheet-1", ENABLE_GOOGLE_SYNC=True)
+    config.set(theme="Dark")  # Unchanged: nothing more to write
+    assert config.writes == 0
+
+    config.close()
+    assert config.writes == 1
+    assert stored(path) == {"ENABLE_GOOGLE_SYNC": True, "SPREADSHEET_ID": "sheet-1", "theme": "Dark"}
+    assert not os.path.exists(path + ".tmp")
+
+
+def test_subscribers_only_hear_about_changed_keys(path):
+    config = ConfigService(path, DEFAULTS, write_delay=60)
+    everything, sync = [], []
+    config.subscribe(everything.append)
+    unsubscribe = config.subscribe(sync.append, keys=["ENABLE_GOOGLE_SYNC", "SPREADSHEET_ID"])
+
+    assert config.set(theme="Dark", SPREADSHEET_ID="") == {"theme": "Dark"}
+    config.set(SPREADSHEET_ID="sheet-1")
+    unsubscribe()
+    config.set(ENABLE_GOOGLE_SYNC=True)
+    config.close()
+
+    assert everything == [{"theme": "Dark"}, {"SPREADSHEET_ID": "sheet-1"}, {"ENABLE_GOOGLE_SYNC": True}]
+    assert sync == [{"SPREADSHEET_ID": "sheet-1"}]
+
+
+def test_the_file_is_read_on_first_use_and_cached(path):
+    config = CountingConfig(path, DEFAULTS)
+    with open(path, "w", encoding="utf-8") as config_file:
+        json.dump({"theme": "Dark"}, config_file)
+    assert config.reads == 0
+
+    assert config["theme"] == "Dark"
+    assert config.get("SPREADSHEET_ID") == ""
+    assert config.as_dict()["ENABLE_GOOGLE_SYNC"] is False
+    assert config.reads == 1
+
+    with open(path, "w", encoding="utf-8") as config_file:
+        json.dump({"theme": "Light"}, config_file)
+    assert config["theme"] == "Dark"
+    assert config.reload() == {"theme": "Light"}
+    assert config.reads == 2
@@ -0,0 +1,42 @@
+import pandas as pd
+
+from src.utils.file_io import APPLICATION_COLUMNS, save_applications_to_excel
+from src.utils.sqlite_store import SQLiteApplicationStore
+
+
+def make_workbook(path):
+    df = pd.DataFrame([
+        ["Acme", "Engineer", "https://acme.example/jobs/1", "2024-01-02", "Applied"],
+        ["Globex", "Analyst", "https://globex.example/jobs/2", "2024-01-03", "Interview"],
+    ], columns=APPLICATION_COLUMNS)
+    save_applications_to_excel(df, str(path))
+
+
+def test_workbook_is_imported_into_a_new_database(tmp_path):
+    make_workbook(tmp_path / "Applications.xlsx")
+    store = SQLiteApplicationStore(str(tmp_path / "Applications.db"), str(tmp_path / "Applications.xlsx"))
+    assert list(store.load()["Company"]) == ["Acme", "Globex"]
+    store.close()
+
+
+def test_deleting_every_row_survives_a_restart(tmp_path):
+    make_workbook(tmp_path / "Applications.xlsx")
+    db_path, excel_path = str(tmp_path / "Applications.db"), str(tmp_path / "Applications.xlsx")
+    store = SQLiteApplicationStore(db_path, excel_path)
+    df = store.load()
+    store.delete_rows(df, range(len(df)))
+    store.close()
+
+    store = SQLiteApplicationStore(db_path, excel_path)
+    assert len(store.load()) == 0
+    assert sum(len(batch) for batch in store.iter_batches(batch_size=1)) == 0
+    store.close()
+
+
+def test_streaming_a_new_database_imports_once(tmp_path):
+    make_workbook(tmp_path / "Applications.xlsx")
+    db_path, excel_path = str(tmp_path / "Applications.db"), str(tmp_path / "Applications.xlsx")
+    store = SQLiteApplicationStore(db_path, excel_path)
+    assert sum(len(batch) for batch in store.iter_batches(batch_size=1)) == 2
+    assert len(store.load()) == 2
+    store.close()
@@ -0,0 +1,74 @@
+import threading
+
+import pandas as pd
+import pytest
+
+from src.utils.sync_backend import FakeSheetsBackend
+
+COLUMNS = ["Company", "Position", "Application Portal URL", "Date Applied", "Status"]
+
+
+class RecordingBackend(FakeSheetsBackend):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.ranges_read = []
+
+    def get_values(self, range_name):
+        self.ranges_read.append(range_name)
+        return super().get_values(range_name)
+
+
+def test_the_first_read_is_split_into_row_windows():
+    df = pd.DataFrame([[f"Company {i}", "Engineer", "", "2024-01-02", "Applied"] for i in range(250)], columns=COLUMNS)
+    backend = RecordingBackend.from_frame(df, chunk_rows=100)
+
+    pd.testing.assert_frame_equal(backend.read(), df)
+    assert sorted(backend.ranges_read) == ["Sheet1!A101:E200", "Sheet1!A1:E100", "Sheet1!A201:E251"]
+
+
+def test_blank_rows_at_a_window_boundary_keep_later_rows_in_place():
+    row = ["Engineer", "", "2024-01-02", "Applied"]
+    rows = [COLUMNS] + [[f"Company {i}"] + row for i in range(98)] + [[], [], []] + [["Acme"] + row]
+    backend = FakeSheetsBackend(rows, chunk_rows=100)
+
+    df = backend.read()
+    assert len(df) == 102
+    assert df.iloc[-1]["Company"] == "Acme"
+
+
+class BlockingBackend(RecordingBackend):
+    """Holds every chunk read until `release` is set."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def get_values(self, range_name):
+        self.started.set()
+        self.release.wait(5)
+        return super().get_values(range_name)
+
+
+def test_close_stops_the_chunks_not_yet_started():
+    df = pd.DataFrame([[f"Company {i}", "Engineer", "", "2024-01-02", "Applied"] for i in range(250)], columns=COLUMNS)
+    backend = BlockingBackend.from_frame(df, chunk_rows=100, max_parallel=1)
+    errors = []
+
+    def poll():
+        try:
+            backend.read()
+        except Exception as e:
+            errors.append(e)
+
+    thread = threading.Thread(target=poll)
+    thread.start()
+    assert backend.started.wait(5)
+    backend.close()
+    backend.release.set()
+    thread.join(5)
+
+    assert errors
+    assert len(backend.ranges_read) == 1
+    with pytest.raises(RuntimeError):
+        backend.read()
@@ -0,0 +1,65 @@
+import pandas as pd
+
+from src.utils.sync_backend import FakeSheetsBackend
+from src.utils.sync_merge import SheetSyncEngine, SyncSnapshot
+
+COLUMNS = ["Company", "Position", "Application Portal URL", "Date Applied", "Status"]
+
+
+def frame(rows):
+    return pd.DataFrame([list(row) for row in rows], columns=COLUMNS)
+
+
+def sheet_values(backend):
+    return [row[:len(COLUMNS)] for row in backend.snapshot()[1:]]
+
+
+def test_first_sync_keeps_a_conflicting_row_once(tmp_path):
+    a = ("Acme", "Engineer", "https://acme.example", "2024-01-02", "Applied")
+    b_local = ("Globex", "Analyst", "https://globex.example", "2024-01-03", "Submitted")
+    b_remote = b_local[:4] + ("Interview",)
+    c = ("Initech", "Developer", "https://initech.example", "2024-01-04", "Applied")
+    backend = FakeSheetsBackend.from_frame(frame([a, b_remote, c]))
+    engine = SheetSyncEngine(str(tmp_path / "sync_base.json"), backend)
+
+    result = engine.sync(SyncSnapshot(frame([a, b_local]), 1))
+
+    assert [tuple(row) for row in result.merged] == [a, b_local, c]
+    assert [tuple(row) for row in sheet_values(backend)] == [a, b_local, c]
+
+
+def test_switching_spreadsheets_merges_without_the_old_base(tmp_path):
+    a = ("Acme", "Engineer", "https://acme.example", "2024-01-02", "Applied")
+    b = ("Globex", "Analyst", "https://globex.example", "2024-01-03", "Submitted")
+    backend = FakeSheetsBackend.from_frame(frame([a, b]), spreadsheet_id="one")
+    engine = SheetSyncEngine(str(tmp_path / "sync_base.json"), backend)
+    engine.commit(engine.sync(SyncSnapshot(frame([a, b]), 1)))
+
+    backend.set_rows([COLUMNS, list(b[:4]) + ["Rejected"]])
+    engine.switch_spreadsheet("two")
+    result = engine.sync(SyncSnapshot(frame([a, b]), 2))
+
+    assert backend.spreadsheet_id == "two"
+    assert [tuple(row) for row in result.merged] == [a, b]
+
+
+def test_browser_edits_are_read_once_the_full_read_interval_has_passed(tmp_path, monkeypatch):
+    a = ("Acme", "Engineer", "https://acme.example", "2024-01-02", "Applied")
+    b = ("Globex", "Analyst", "https://globex.example", "2024-01-03", "Submitted")
+    now = [1000.0]
+    monkeypatch.setattr("src.utils.sync_merge.time.monotonic", lambda: now[0])
+    backend = FakeSheetsBackend.from_frame(frame([a, b]))
+    engine = SheetSyncEngine(str(tmp_path / "sync_base.json"), backend, full_read_interval=300)
+    engine.commit(engine.sync(SyncSnapshot(frame([a, b]), 1)))
+
+    # Edited in the browser: the footprint cells beside the header are unchanged
+    rows = backend.snapshot()
+    rows[2][4] = "Interview"
+    backend.set_rows(rows)
+    now[0] += 299
+    assert not engine.sync(SyncSnapshot(frame([a, b]), 1)).remote_changed
+    assert engine.reads_skipped == 1
+    now[0] += 1
+    result = engine.sync(SyncSnapshot(frame([a, b]), 1))
+    assert result.remote_changed
+    assert tuple(result.merged[1]) == b[:4] + ("Interview",)
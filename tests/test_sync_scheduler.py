@@ -0,0 +1,101 @@
+import pytest
+
+from src.utils.sync_scheduler import (DEFAULT_POLL_SECONDS, MAX_POLL_SECONDS, MIN_POLL_SECONDS, UNFOCUSED_FACTOR,
+                                      SyncScheduler, TokenBucket)
+
+
+class Clock:
+    """A monotonic clock the test moves by hand; sleep() advances it."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.slept = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+def test_the_bucket_refills_at_the_configured_rate():
+    clock = Clock()
+    bucket = TokenBucket(rate=60, capacity=5, clock=clock, sleep=clock.sleep)
+    for _ in range(5):
+        assert bucket.take() == 0
+    assert bucket.take() == pytest.approx(1.0)
+
+    clock.now += 3
+    for _ in range(3):
+        assert bucket.take() == 0
+    assert bucket.take() > 0
+
+    clock.now += 600
+    assert [bucket.take() for _ in range(6)].count(0) == 5  # Saved tokens never exceed the capacity
+
+
+def test_acquire_waits_while_the_budget_is_spent():
+    clock = Clock()
+    bucket = TokenBucket(rate=30, capacity=1, clock=clock, sleep=clock.sleep)
+    bucket.acquire()
+    assert clock.slept == []
+
+    bucket.acquire()
+    assert sum(clock.slept) == pytest.approx(2.0)
+    assert bucket.waited == pytest.approx(2.0)
+
+    clock.slept = []
+    bucket.drain()
+    bucket.acquire()
+    assert sum(clock.slept) == pytest.approx(2.0)
+
+
+def test_idle_polls_back_off():
+    clock = Clock()
+    scheduler = SyncScheduler(clock=clock)
+    scheduler.record_poll()
+    assert scheduler.poll_delay() == DEFAULT_POLL_SECONDS
+
+    for _ in range(20):
+        scheduler.record_result(remote_changed=False)
+    assert scheduler.interval == MAX_POLL_SECONDS
+    clock.now += 100
+    assert scheduler.poll_delay() == MAX_POLL_SECONDS - 100
+
+
+def test_an_unfocused_window_polls_less_often():
+    clock = Clock()
+    scheduler = SyncScheduler(clock=clock)
+    scheduler.record_poll()
+    assert scheduler.set_focused(False)
+    assert not scheduler.set_focused(False)
+    assert scheduler.poll_delay() == DEFAULT_POLL_SECONDS * UNFOCUSED_FACTOR
+
+    assert scheduler.set_focused(True)
+    assert scheduler.poll_delay() == DEFAULT_POLL_SECONDS
+
+
+@pytest.mark.parametrize("activity", ["remote change", "local edit"])
+def test_activity_brings_polls_closer(activity):
+    clock = Clock()
+    scheduler = SyncScheduler(clock=clock)
+    for _ in range(20):
+        scheduler.record_result(remote_changed=False)
+
+    intervals = []
+    for _ in range(10):
+        if activity == "local edit":
+            scheduler.record_edit()
+        else:
+            scheduler.record_result(remote_changed=True)
+        intervals.append(scheduler.interval)
+    assert intervals == sorted(intervals, reverse=True)
+    assert intervals[0] == MAX_POLL_SECONDS / 2
+    assert intervals[-1] == MIN_POLL_SECONDS
+
+
+def test_a_failure_doubles_the_interval():
+    scheduler = SyncScheduler(clock=Clock())
+    scheduler.record_failure()
+    assert scheduler.interval == DEFAULT_POLL_SECONDS * 2
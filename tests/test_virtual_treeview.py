@@ -0,0 +1,136 @@
+import pandas as pd
+
+from src.gui.virtual_treeview import StreamedRows, VirtualTreeview
+
+
+def test_streamed_rows_match_the_concatenated_batches():
+    batches = [pd.DataFrame({"Company": [f"C{i}-{j}" for j in range(size)]}) for i, size in enumerate([3, 1, 4, 2])]
+    rows = StreamedRows()
+    for batch in batches:
+        rows.append(batch)
+    full = pd.concat(batches, ignore_index=True)
+
+    assert len(rows) == len(full)
+    assert list(rows.index) == list(full.index)
+    for start in range(len(full) + 1):
+        for stop in range(start, len(full) + 2):
+            pd.testing.assert_frame_equal(rows.iloc[start:stop], full.iloc[start:stop])
+    for label in full.index:
+        assert list(rows.loc[label]) == list(full.loc[label])
+
+
+class FakeTree:
+    """The ttk.Treeview calls VirtualTreeview makes, without Tk. Holds 10 rows."""
+
+    def __init__(self):
+        self.bindings = {}
+        self.items = []
+        self.selected = []
+        self.idle = []
+        self.focused = ""
+
+    def bind(self, sequence, func, add=None):
+        self.bindings[sequence] = func
+
+    def after_idle(self, func):
+        self.idle.append(func)
+
+    def winfo_height(self):
+        return 1
+
+    def cget(self, option):
+        return 10
+
+    def get_children(self):
+        return tuple(self.items)
+
+    def bbox(self, iid):
+        return None
+
+    def insert(self, parent, index, iid, values):
+        self.items.insert(index, iid)
+
+    def move(self, iid, parent, index):
+        self.items.remove(iid)
+        self.items.insert(index, iid)
+
+    def item(self, iid, values):
+        pass
+
+    def delete(self, *iids):
+        self.items = [iid for iid in self.items if iid not in iids]
+        self.selected = [iid for iid in self.selected if iid not in iids]
+
+    def selection(self):
+        return tuple(self.selected)
+
+    def selection_set(self, iids):
+        self.selected = [iids] if isinstance(iids, str) else list(iids)
+
+    def yview_moveto(self, fraction):
+        pass
+
+    def focus(self, iid=None):
+        if iid is None:
+            return self.focused
+        self.focused = iid
+
+
+class FakeScrollbar:
+    def configure(self, **options):
+        pass
+
+    def set(self, first, last):
+        pass
+
+
+class Event:
+    def __init__(self, state=0):
+        self.state = state
+
+
+def click(tree, iid, state=0):
+    """A click on `iid` as Tk delivers it: the binding, the class binding's selection change, then the event."""
+    tree.bindings["<ButtonPress-1>"](Event(state))
+    tree.selection_set(tree.selected + [iid] if state else [iid])
+    tree.bindings["<<TreeviewSelect>>"](None)
+    for func in tree.idle:
+        func()
+    tree.idle = []
+
+
+def make_view():
+    tree = FakeTree()
+    view = VirtualTreeview(tree, FakeScrollbar())
+    view.set_data(pd.DataFrame({"Company": [f"Company {i}" for i in range(100)]}))
+    return tree, view
+
+
+def test_a_plain_click_drops_rows_scrolled_out_of_view():
+    tree, view = make_view()
+    click(tree, "1")
+    view.scroll_to(50)
+    tree.bindings["<<TreeviewSelect>>"](None)  # Queued by restoring the visible selection
+
+    assert view.selection() == ("1",)
+    click(tree, "55")
+    assert view.selection() == ("55",)
+
+
+def test_a_control_click_keeps_rows_scrolled_out_of_view():
+    tree, view = make_view()
+    click(tree, "1")
+    view.scroll_to(50)
+    click(tree, "55", state=0x0004)
+    assert view.selection() == ("1", "55")
+
+
+def test_an_arrow_key_past_the_last_row_drops_rows_scrolled_out_of_view():
+    tree, view = make_view()
+    click(tree, "1")
+    view.scroll_to(50)
+    tree.focus("59")
+    tree.bindings["<Down>"](Event())
+    tree.bindings["<<TreeviewSelect>>"](None)
+    assert view.offset == 51
+    assert view.selection() == ("60",)
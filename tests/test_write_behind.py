@@ -0,0 +1,88 @@
+import pandas as pd
+import pytest
+
+from src.utils.write_behind import WriteBehindWriter
+
+
+def frame(status):
+    return pd.DataFrame({"Company": ["Acme", "Globex"], "Status": ["Applied", status]})
+
+
+class Saves:
+    """A save function recording what it wrote; fails while `error` is set."""
+
+    def __init__(self):
+        self.written = []
+        self.error = None
+
+    def __call__(self, df, file_path):
+        if self.error is not None:
+            raise self.error
+        self.written.append((df.copy(), file_path))
+
+
+@pytest.fixture
+def saves():
+    return Saves()
+
+
+def test_quick_submits_are_written_once_with_the_latest_snapshot(saves):
+    writer = WriteBehindWriter(saves, "Applications.xlsx", delay=60)
+    for status in ["Applied", "Interview", "Offer"]:
+        writer.submit(frame(status))
+    assert saves.written == []
+
+    assert writer.flush(5)
+    assert len(saves.written) == 1
+    df, file_path = saves.written[0]
+    pd.testing.assert_frame_equal(df, frame("Offer"))
+    assert file_path == "Applications.xlsx"
+    assert writer.stats() == {"submitted": 3, "written": 1, "skipped_unchanged": 0, "failed": 0, "writes_saved": 2}
+    writer.close(5)
+
+
+def test_a_snapshot_identical_to_the_file_is_not_written(saves):
+    persisted = []
+    writer = WriteBehindWriter(saves, "Applications.xlsx", delay=60, after_write=persisted.append)
+    writer.mark_persisted(frame("Applied"))
+    writer.submit(frame("Applied"))
+    assert writer.flush(5)
+    assert saves.written == []
+    assert writer.skipped_unchanged == 1
+    assert len(persisted) == 1  # The content is on disk all the same
+
+    writer.submit(frame("Interview"))
+    writer.flush(5)
+    writer.submit(frame("Interview"))
+    writer.flush(5)
+    assert len(saves.written) == 1
+    assert writer.skipped_unchanged == 2
+    writer.close(5)
+
+
+def test_close_writes_the_pending_snapshot(saves):
+    writer = WriteBehindWriter(saves, "Applications.xlsx", delay=60)
+    writer.submit(frame("Offer"))
+    writer.close(5)
+
+    assert len(saves.written) == 1
+    pd.testing.assert_frame_equal(saves.written[0][0], frame("Offer"))
+    with pytest.raises(RuntimeError):
+        writer.submit(frame("Rejected"))
+
+
+def test_a_failed_write_is_reported_and_retried_with_the_next_snapshot(saves):
+    failed = []
+    writer = WriteBehindWriter(saves, "Applications.xlsx", delay=60, on_failure=failed.append)
+    saves.error = PermissionError("The file is open in Excel.")
+    writer.submit(frame("Offer"))
+    writer.flush(5)
+
+    assert len(failed) == 1
+    pd.testing.assert_frame_equal(failed[0], frame("Offer"))
+    assert writer.failed == 1 and saves.written == []
+
+    saves.error = None
+    writer.submit(frame("Offer"))
+    writer.close(5)
+    assert len(saves.written) == 1  # A failed write does not count as the content on disk